@@ -195,12 +195,12 @@ def _create_canvas(name=None, config=None):
         raise ValueError(f"Unknown canvas name {name}")
 
 
-def _create_model(sam_file, ndf=None):
+def _create_model(sam_file, ndf=None, cache=None):
 
     import veux.model
 
     if isinstance(sam_file, (str, Path)):
-        model_data = veux.model.read_model(sam_file)
+        model_data = veux.model.read_model(sam_file, cache=cache)
 
     elif isinstance(sam_file, veux.model.Model):
         return sam_file
@@ -338,7 +338,7 @@ def create_artist(
     if model is None:
         raise RenderError("Expected required argument <sam-file>")
 
-    model_data = _create_model(model, ndf=ndf)
+    model_data = _create_model(model, ndf=ndf, cache=opts.get("cache_config", None))
 
     # Setup config
     config = Config()
@@ -357,7 +357,7 @@ def create_artist(
     # things if neccessary.
     artist = FrameArtist(model_data, ndf=ndf,
                          config=config["artist_config"],
-                         model_config=config["model_config"],
+                         model_config={"cache": opts.get("cache_config", None), **config["model_config"]},
                          canvas=_create_canvas(canvas or config["canvas_config"]["type"],
                                                config=config["canvas_config"]))
 
@@ -439,7 +439,7 @@ def render(model, state=None, ndf=6,
     #
     # Read model data
     #
-    model_data = _create_model(model)
+    model_data = _create_model(model, cache=opts.get("cache_config", None))
 
     # Setup config
     config = Config()
@@ -484,7 +484,7 @@ def render(model, state=None, ndf=6,
     # things if neccessary.
     artist = FrameArtist(model_data, ndf=ndf,
                          config=config["artist_config"],
-                         model_config=config["model_config"],
+                         model_config={"cache": opts.get("cache_config", None), **config["model_config"]},
                          canvas=_create_canvas(canvas or config["canvas_config"]["type"],
                                                config=config["canvas_config"]))
 
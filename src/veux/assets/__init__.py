@@ -39,32 +39,28 @@ def create_cube(canvas, style):
         ],
         dtype=index_t,
     )
-    triangles_binary_blob = triangles.flatten().tobytes()
 
-    canvas.gltf.accessors.extend([
+    indices_access = canvas._add_accessor(
         pygltflib.Accessor(
-            bufferView=canvas._push_data(triangles_binary_blob,
+            bufferView=canvas._push_data(triangles,
                                         pygltflib.ELEMENT_ARRAY_BUFFER),
             componentType=GLTF_T[index_t],
             count=triangles.size,
             type=pygltflib.SCALAR,
             max=[int(triangles.max())],
             min=[int(triangles.min())],
-        ),
+        ))
+    points_access  = canvas._add_accessor(
         pygltflib.Accessor(
-            bufferView=canvas._push_data(points.tobytes(),
+            bufferView=canvas._push_data(points,
                                         pygltflib.ARRAY_BUFFER),
             componentType=GLTF_T[canvas.float_t],
             count=len(points),
             type=pygltflib.VEC3,
             max=points.max(axis=0).tolist(),
             min=points.min(axis=0).tolist(),
-        )
-    ])
-
+        ))
 
-    indices_access = len(canvas.gltf.accessors)-2 # indices
-    points_access  = len(canvas.gltf.accessors)-1 # points
     canvas.gltf.meshes.append(
             pygltflib.Mesh(
                 primitives=[
@@ -198,29 +194,26 @@ def create_arrow(canvas, body_length,
     points = np.array(vertices, dtype=canvas.float_t)
     # Convert triangle indices to a flat array with the canvas index type.
     triangles_array = np.array(triangles, dtype=canvas.index_t)
-    indices_accessor_index = len(canvas.gltf.accessors)
-    points_accessor_index = indices_accessor_index + 1
-
-    canvas.gltf.accessors.extend([
+    indices_accessor_index = canvas._add_accessor(
         pygltflib.Accessor(
-            bufferView=canvas._push_data(triangles_array.flatten().tobytes(),
+            bufferView=canvas._push_data(triangles_array,
                                          pygltflib.ELEMENT_ARRAY_BUFFER),
             componentType=GLTF_T[canvas.index_t],
             count=triangles_array.size,
             type=pygltflib.SCALAR,
             max=[int(triangles_array.max())],
             min=[int(triangles_array.min())],
-        ),
+        ))
+    points_accessor_index = canvas._add_accessor(
         pygltflib.Accessor(
-            bufferView=canvas._push_data(points.tobytes(),
+            bufferView=canvas._push_data(points,
                                          pygltflib.ARRAY_BUFFER),
             componentType=GLTF_T[canvas.float_t],
             count=len(points),
             type=pygltflib.VEC3,
             max=points.max(axis=0).tolist(),
             min=points.min(axis=0).tolist(),
-        )
-    ])
+        ))
 
     # Append the mesh to the canvas.
     canvas.gltf.meshes.append(
@@ -0,0 +1,289 @@
+#===----------------------------------------------------------------------===#
+#
+#         STAIRLab -- STructural Artificial Intelligence Laboratory
+#
+#===----------------------------------------------------------------------===#
+#
+# On-disk cache of parsed model files.
+#
+# Entries are addressed by a hash of the file contents together with the
+# name and version of the parser that produced them. Each entry is stored
+# as a pair of files:
+#
+#   <key>.npz    node coordinates and element connectivity
+#   <key>.json   the remainder of the model dictionary
+#
+# Arrays derived from a model, such as section outlines, are stored under
+# the same directory as <key>.npy and share its size limit.
+#
+import os
+import hashlib
+import tempfile
+import warnings
+from pathlib import Path
+
+import numpy as np
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+
+# Bump when the layout of cache entries changes
+_FORMAT = 1
+
+# Default size limit of the cache in bytes
+_MAX_SIZE = 1<<30
+
+# Packages that provide each parser; their versions are part of the key
+_PARSER_PACKAGES = {
+    "csi":  ("openbim",),
+    "inp":  ("openbim",),
+    "json": (),
+}
+
+
+def _cache_directory()->Path:
+    if "VEUX_CACHE_DIR" in os.environ:
+        return Path(os.environ["VEUX_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME", Path.home()/".cache")
+    return Path(base)/"veux"
+
+
+def _parser_version(parser:str)->str:
+    from importlib.metadata import version, PackageNotFoundError
+    from veux.parser import __version__
+
+    versions = [f"veux={__version__}", f"format={_FORMAT}"]
+    for package in _PARSER_PACKAGES[parser]:
+        try:
+            versions.append(f"{package}={version(package)}")
+        except PackageNotFoundError:
+            versions.append(f"{package}=")
+    return ";".join(versions)
+
+
+def _dumps(value)->bytes:
+    # Lazily decoded sections and arrays from veux.utility.stream
+    from veux.utility.stream import json_default
+    data = json.dumps(value, default=json_default)
+    return data.encode() if isinstance(data, str) else data
+
+
+def _write_atomic(path:Path, write):
+    # Entries are written to a temporary file in the cache directory and
+    # renamed so that concurrent renders never see a partial entry.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _pack(sam:dict):
+    """
+    Move node coordinates and element connectivity out of the model
+    dictionary and into arrays. Returns the stripped dictionary and a
+    dictionary of arrays; only fields that can be restored exactly are
+    moved.
+    """
+    try:
+        geometry = sam["StructuralAnalysisModel"]["geometry"]
+        nodes    = geometry["nodes"]
+        elements = geometry["elements"]
+    except (KeyError, TypeError):
+        return sam, {}
+
+    arrays = {}
+
+    crd = [node.get("crd") for node in nodes]
+    if "coord" in geometry.get("columns", {}):
+        arrays["crd"] = np.asarray(geometry["columns"]["coord"], dtype=float)
+        nodes = [{k: v for k,v in node.items() if k != "crd"} for node in nodes]
+
+    elif nodes and all(isinstance(x, list) and len(x) == len(crd[0]) for x in crd) \
+       and all(type(v) is float for x in crd for v in x):
+        arrays["crd"] = np.array(crd, dtype=float).reshape(len(nodes), -1)
+        nodes = [{k: v for k,v in node.items() if k != "crd"} for node in nodes]
+
+    conn = [elem.get("nodes") for elem in elements]
+    if elements and all(isinstance(x, list) for x in conn) \
+       and all(type(v) is int for x in conn for v in x):
+        arrays["offsets"] = np.cumsum([0] + [len(x) for x in conn])
+        arrays["nodes"]   = np.fromiter((v for x in conn for v in x), dtype=np.int64,
+                                        count=int(arrays["offsets"][-1]))
+        elements = [{k: v for k,v in elem.items() if k != "nodes"} for elem in elements]
+
+    if not arrays:
+        return sam, {}
+
+    sam = dict(sam)
+    sam["StructuralAnalysisModel"] = dict(sam["StructuralAnalysisModel"])
+    geometry = {k: v for k,v in geometry.items() if k != "columns"}
+    sam["StructuralAnalysisModel"]["geometry"] = dict(geometry, nodes=nodes, elements=elements)
+    return sam, arrays
+
+
+def _unpack(sam:dict, arrays)->dict:
+    geometry = sam["StructuralAnalysisModel"]["geometry"]
+
+    if "crd" in arrays:
+        for node, crd in zip(geometry["nodes"], arrays["crd"].tolist()):
+            node["crd"] = crd
+
+    if "offsets" in arrays:
+        offsets = arrays["offsets"].tolist()
+        nodes   = arrays["nodes"].tolist()
+        for i, elem in enumerate(geometry["elements"]):
+            elem["nodes"] = nodes[offsets[i]:offsets[i+1]]
+
+    return sam
+
+
+def open_cache(cache=None):
+    """
+    Return the ModelCache described by a ``cache`` option, which is either
+    a boolean or a dictionary like ``Config()["cache_config"]``. Returns
+    ``None`` when caching is disabled, which is the default.
+    """
+    if cache is None or cache is False:
+        return None
+    elif cache is True:
+        cache = {}
+
+    if not cache.get("enabled", True):
+        return None
+    return ModelCache(cache.get("directory", None), cache.get("max_size", None))
+
+
+class ModelCache:
+    """
+    Content-addressed cache of parsed model files.
+
+    Parameters
+    ----------
+    directory : str or Path, optional
+        Location of the cache. Defaults to ``$VEUX_CACHE_DIR``, or
+        ``veux/`` under ``$XDG_CACHE_HOME`` (``~/.cache``).
+    max_size : int, optional
+        Total size in bytes of the cache (default 1 GiB); the least recently
+        used entries are removed when a new entry takes the cache over this
+        size.
+    """
+    def __init__(self, directory=None, max_size=None):
+        self.directory = Path(directory) if directory is not None else _cache_directory()
+        self.max_size  = max_size if max_size is not None else _MAX_SIZE
+
+    def key(self, filename, parser:str)->str:
+        digest = hashlib.blake2b(_parser_version(parser).encode(), digest_size=20)
+        with open(filename, "rb") as f:
+            for chunk in iter(lambda: f.read(1<<20), b""):
+                digest.update(chunk)
+        return f"{parser}-{digest.hexdigest()}"
+
+    def _paths(self, key):
+        return self.directory/f"{key}.json", self.directory/f"{key}.npz"
+
+    def load(self, key:str):
+        """
+        Return the model stored under ``key``, or ``None`` if there is no
+        such entry.
+        """
+        meta, data = self._paths(key)
+        try:
+            with open(meta, "rb") as f:
+                entry = json.loads(f.read())
+            sam = entry["model"]
+            if entry["arrays"]:
+                with np.load(data) as arrays:
+                    sam = _unpack(sam, arrays)
+        except (OSError, ValueError, KeyError):
+            # Missing or damaged entry; it will be written again
+            return None
+
+        # Record the access for eviction
+        for path in (meta, data):
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return sam
+
+    def store(self, key:str, sam:dict)->None:
+        meta, data = self._paths(key)
+        stripped, arrays = _pack(sam)
+        try:
+            text = _dumps({"arrays": sorted(arrays), "model": stripped})
+        except (TypeError, ValueError):
+            # Only JSON-like models are cached
+            return
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if arrays:
+                _write_atomic(data, lambda f: np.savez(f, **arrays))
+            _write_atomic(meta, lambda f: f.write(text))
+        except OSError as e:
+            warnings.warn(f"Failed to write model cache entry; {e}")
+            return
+
+        self.evict()
+
+    def load_array(self, key:str):
+        """
+        Return the array stored under ``key``, or ``None``.
+        """
+        path = self.directory/f"{key}.npy"
+        try:
+            array = np.load(path)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return array
+
+    def store_array(self, key:str, array)->None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self.directory/f"{key}.npy", lambda f: np.save(f, array))
+        except OSError as e:
+            warnings.warn(f"Failed to write cache entry; {e}")
+            return
+        self.evict()
+
+    def evict(self, max_size=None)->None:
+        """
+        Remove least recently used entries until the total size of the
+        cache is at most ``max_size`` bytes.
+        """
+        if max_size is None:
+            max_size = self.max_size
+
+        entries = {}
+        try:
+            files = list(self.directory.iterdir())
+        except OSError:
+            return
+
+        for path in files:
+            if path.suffix not in {".json", ".npz", ".npy"}:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            size, time, paths = entries.get(path.stem, (0, 0, []))
+            entries[path.stem] = (size + stat.st_size, max(time, stat.st_mtime), paths + [path])
+
+        total = sum(size for size, *_ in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k][1]):
+            if total <= max_size:
+                break
+            for path in entries[key][2]:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            total -= entries[key][0]
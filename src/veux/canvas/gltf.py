@@ -24,7 +24,11 @@ Some implementation notes:
 The glTF file format is supported by 
 [COMSOL](https://www.comsol.com/blogs/how-to-export-and-share-your-3d-result-plots-as-gltf-files)
 """
-import itertools
+import io
+import json
+import zlib
+import struct
+import hashlib
 
 import numpy as np
 import pygltflib
@@ -32,7 +36,6 @@ from scipy.spatial.transform import Rotation
 
 import veux
 from .canvas import Canvas, Line, Mesh, Node
-from veux import utility
 from veux.config import NodeStyle, MeshStyle, LineStyle, DrawStyle
 
 GLTF_T = {
@@ -40,6 +43,18 @@ GLTF_T = {
     "uint8":   pygltflib.UNSIGNED_BYTE,
     "uint16":  pygltflib.UNSIGNED_SHORT,
     "uint32":  pygltflib.UNSIGNED_INT,
+    "int8":    pygltflib.BYTE,
+    "int16":   pygltflib.SHORT,
+}
+
+_NUMPY_T = {v: k for k, v in GLTF_T.items()}
+
+_COMPONENTS = {
+    pygltflib.SCALAR: 1,
+    pygltflib.VEC2:   2,
+    pygltflib.VEC3:   3,
+    pygltflib.VEC4:   4,
+    pygltflib.MAT4:  16,
 }
 
 EYE3 = np.eye(3, dtype="float32")
@@ -49,6 +64,224 @@ def _append_index(lst, item):
     lst.append(item)
     return len(lst) - 1
 
+
+def _polyline_segments(polylines)->np.ndarray:
+    """
+    Return an (n,2) array with the pairs of consecutive indices in a
+    collection of poly-lines, given either as a 2D array or as a
+    ragged sequence of index lists.
+    """
+    if isinstance(polylines, np.ndarray) and polylines.ndim == 2:
+        return np.stack([polylines[:,:-1], polylines[:,1:]], axis=-1).reshape(-1, 2)
+
+    polylines = [np.asarray(p, dtype=np.int64).reshape(-1) for p in polylines]
+    if len(polylines) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    flat = np.concatenate(polylines)
+    if len(flat) < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Pair each index with its successor, except across poly-line boundaries
+    ends = np.cumsum([len(p) for p in polylines]) - 1
+    keep = np.ones(len(flat)-1, dtype=bool)
+    keep[ends[(ends >= 0) & (ends < len(keep))]] = False
+    return np.stack([flat[:-1][keep], flat[1:][keep]], axis=1)
+
+
+def _quaternions_from_x(directions)->np.ndarray:
+    """
+    Return (n,4) quaternions that rotate [1,0,0] onto each
+    of the (n,3) unit vectors in ``directions``.
+    """
+    x, y, z = np.asarray(directions, dtype=float).T
+    # The half-way quaternion is (e1 x d, 1 + e1.d)
+    q = np.stack([np.zeros_like(x), -z, y, 1.0 + x], axis=1)
+
+    # Vectors opposite to e1 are reached by a half turn about e2
+    opposite = q[:,3] < 1e-8
+    q[opposite] = [0.0, 1.0, 0.0, 0.0]
+
+    return q/np.linalg.norm(q, axis=1)[:,None]
+
+
+_JSON_LEAVES = {int, float, bool, str}
+
+
+def _json_tree(value):
+    """
+    Convert a tree of pygltflib objects into plain JSON values without
+    copying. Keys whose value is None or empty are dropped, as done by
+    pygltflib, and the contents of ``extensions`` are kept verbatim.
+    """
+    if type(value) in _JSON_LEAVES:
+        return value
+
+    if isinstance(value, (list, tuple)):
+        return [item if type(item) in _JSON_LEAVES else _json_tree(item) for item in value]
+
+    if hasattr(value, "__dict__"):
+        value = vars(value)
+    elif not isinstance(value, dict):
+        return value
+
+    tree = {}
+    for key, item in value.items():
+        kind = type(item)
+        if kind in _JSON_LEAVES:
+            if kind is not str or item:
+                tree[key] = item
+        elif item is None or key[0] == "_" or (hasattr(item, "__len__") and len(item) == 0):
+            continue
+        else:
+            tree[key] = item if key == "extensions" else _json_tree(item)
+    return tree
+
+
+def _json_default(value):
+    # numpy values that were stored in the document
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Colormaps and their look-up tables, by name
+_COLORMAPS = {}
+_COLORMAP_TABLES = {}
+
+
+def _colormap(name):
+    # Resolve a ColorCET colormap, falling back to matplotlib
+    if name not in _COLORMAPS:
+        try:
+            import colorcet
+            _COLORMAPS[name] = colorcet.cm[name]
+        except (ImportError, KeyError):
+            import matplotlib
+            _COLORMAPS[name] = matplotlib.colormaps[name]
+    return _COLORMAPS[name]
+
+
+def _colormap_table(name, size=256)->np.ndarray:
+    # (size,4) uint8 RGBA look-up table of a colormap
+    if name not in _COLORMAP_TABLES:
+        colors = _colormap(name)(np.linspace(0.0, 1.0, size))
+        _COLORMAP_TABLES[name] = np.round(colors*255).astype("uint8")
+    return _COLORMAP_TABLES[name]
+
+
+def _png_rgba(pixels)->bytes:
+    """
+    Encode an (h,w,4) uint8 array as a PNG image.
+    """
+    h, w, _ = pixels.shape
+    rows = b"".join(b"\x00" + row.tobytes() for row in pixels)
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    return b"".join([
+        b"\x89PNG\r\n\x1a\n",
+        chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 6, 0, 0, 0)),
+        chunk(b"IDAT", zlib.compress(rows)),
+        chunk(b"IEND", b""),
+    ])
+
+
+def _quantize_unorm(values, dtype)->np.ndarray:
+    # Normalized unsigned integers representing values in [0, 1]
+    limit = np.iinfo(dtype).max
+    return np.round(np.asarray(values)*limit).astype(dtype)
+
+
+def _quantize_weights(weights, dtype)->np.ndarray:
+    """
+    Quantize skin weights to normalized unsigned integers such that the
+    weights of every vertex still sum exactly to one.
+    """
+    limit = np.iinfo(dtype).max
+    q = np.round(np.asarray(weights)*limit).astype(np.int64)
+    # Assign the rounding residual to the largest weight of each vertex
+    rows = np.flatnonzero(q.sum(axis=1) > 0)
+    q[rows, q[rows].argmax(axis=1)] += limit - q[rows].sum(axis=1)
+    return q.clip(0, limit).astype(dtype)
+
+
+# Primitive modes that can be merged by concatenating their indices
+_MERGE_MODES = (pygltflib.POINTS, pygltflib.LINES, pygltflib.LINE_STRIP, pygltflib.TRIANGLES)
+
+
+def _attribute_items(attributes)->dict:
+    # Attributes may be given as pygltflib.Attributes or as a plain dict
+    if not isinstance(attributes, dict):
+        attributes = vars(attributes)
+    return {name: index for name, index in attributes.items() if index is not None}
+
+
+def _accessor_key(accessor):
+    # Description of the data referenced by an accessor, or None if it
+    # should not be shared
+    if accessor.sparse is not None or accessor.bufferView is None:
+        return None
+    return (accessor.bufferView, accessor.byteOffset or 0, accessor.componentType,
+            bool(accessor.normalized), accessor.count, accessor.type, accessor.name)
+
+
+class _BufferArena:
+    """
+    Growable arena that backs the single binary buffer of a glTF document.
+
+    Payloads are copied through the buffer protocol into a preallocated
+    ``bytearray`` whose capacity doubles when exhausted, so building the
+    buffer is linear in its final size. Every payload is placed at an
+    offset that is a multiple of ``alignment``; glTF requires bufferView
+    offsets to be aligned to 4 bytes.
+    """
+    def __init__(self, capacity=1<<16, alignment=4):
+        self.alignment = alignment
+        self._data = bytearray(capacity)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def _reserve(self, size):
+        capacity = len(self._data)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        # Padding between payloads relies on the new bytes being zero
+        self._data.extend(bytes(capacity - len(self._data)))
+
+    def push(self, data)->int:
+        """
+        Copy ``data`` (any C-contiguous buffer, e.g. a numpy array) into the
+        arena and return its byte offset.
+        """
+        view   = memoryview(data)
+        offset = self._size + (-self._size % self.alignment)
+        end    = offset + view.nbytes
+        self._reserve(end)
+        if view.nbytes:
+            self._data[offset:end] = view.cast("B")
+        self._size = end
+        return offset
+
+    def read(self, offset, nbytes)->bytearray:
+        """
+        Return a copy of ``nbytes`` bytes starting at ``offset``; unlike a
+        view, the copy does not prevent the arena from growing.
+        """
+        return self._data[offset:offset+nbytes]
+
+    def getbuffer(self)->memoryview:
+        return memoryview(self._data)[:self._size]
+
+    def tobytes(self)->bytes:
+        return self.getbuffer().tobytes()
+
+
 class GltfLibCanvas(Canvas):
     vertical = 2
 
@@ -56,6 +289,12 @@ class GltfLibCanvas(Canvas):
         self.config = config
         self._data = {}
 
+        # Output passes run by to_glb() and write(); see compact() and quantize()
+        self._compact  = bool(config.get("compact",  False)) if config else False
+        self._quantize = bool(config.get("quantize", False)) if config else False
+        self._quantize_tolerance = config.get("quantize_tolerance", 1e-4) if config else 1e-4
+        self._field_texture = bool(config.get("field_texture", False)) if config else False
+
         #                 x, y, z, scalar
         self._rotation = [0, 0, 0, 1] #[-0.7071068, 0, 0, 0.7071068]
         # equivalent rotation matrix:
@@ -148,7 +387,13 @@ class GltfLibCanvas(Canvas):
             bufferViews=[],
             buffers=[pygltflib.Buffer(byteLength=0)],
         )
-        self.gltf._glb_data = bytes()
+        # Binary data is accumulated here and only joined into the
+        # GLB blob by to_glb()/write()
+        self._buffer = _BufferArena()
+        # Map content hashes to bufferView indices; see _push_data()
+        self._views = {}
+        # Map accessor descriptions to accessor indices; see _add_accessor()
+        self._accessors = {}
 
 
         # Map pairs of (color, alpha) to material's index in material list
@@ -157,6 +402,10 @@ class GltfLibCanvas(Canvas):
         
         self._arrows = {}
 
+        # Colormap textures and the materials that sample them; see plot_mesh_field()
+        self._colormap_textures = {}
+        self._field_materials = {}
+
         self._node_markers = {}
 
         #
@@ -198,10 +447,9 @@ class GltfLibCanvas(Canvas):
                     vertex_colors[vi] = [1.0, 1.0, 1.0, 1.0]
 
 
-        color_accessor_index = len(self.gltf.accessors)
-        self.gltf.accessors.append(
+        color_accessor_index = self._add_accessor(
             pygltflib.Accessor(
-                bufferView=self._push_data(vertex_colors.astype(self.float_t).tobytes(), pygltflib.ARRAY_BUFFER),
+                bufferView=self._push_data(vertex_colors, pygltflib.ARRAY_BUFFER),
                 componentType=GLTF_T[self.float_t],
                 count=len(vertex_colors),
                 type=pygltflib.VEC4,
@@ -288,32 +536,28 @@ class GltfLibCanvas(Canvas):
             ],
             dtype=index_t,
         )
-        triangles_binary_blob = triangles.flatten().tobytes()
 
-        self.gltf.accessors.extend([
+        indices_access = self._add_accessor(
             pygltflib.Accessor(
-                bufferView=self._push_data(triangles_binary_blob,
+                bufferView=self._push_data(triangles,
                                            pygltflib.ELEMENT_ARRAY_BUFFER),
                 componentType=GLTF_T[index_t],
                 count=triangles.size,
                 type=pygltflib.SCALAR,
                 max=[int(triangles.max())],
                 min=[int(triangles.min())],
-            ),
+            ))
+        points_access = self._add_accessor(
             pygltflib.Accessor(
-                bufferView=self._push_data(points.tobytes(),
+                bufferView=self._push_data(points,
                                            pygltflib.ARRAY_BUFFER),
                 componentType=GLTF_T[self.float_t],
                 count=len(points),
                 type=pygltflib.VEC3,
                 max=points.max(axis=0).tolist(),
                 min=points.min(axis=0).tolist(),
-            )
-        ])
-
+            ))
 
-        indices_access = len(self.gltf.accessors)-2
-        points_access  = len(self.gltf.accessors)-1
         self.gltf.meshes.append(
                pygltflib.Mesh(
                  primitives=[
@@ -365,32 +609,28 @@ class GltfLibCanvas(Canvas):
             ],
             dtype=index_t,
         )
-        triangles_binary_blob = triangles.flatten().tobytes()
 
-        self.gltf.accessors.extend([
+        indices_access = self._add_accessor(
             pygltflib.Accessor(
-                bufferView=self._push_data(triangles_binary_blob,
+                bufferView=self._push_data(triangles,
                                            pygltflib.ELEMENT_ARRAY_BUFFER),
                 componentType=GLTF_T[index_t],
                 count=triangles.size,
                 type=pygltflib.SCALAR,
                 max=[int(triangles.max())],
                 min=[int(triangles.min())],
-            ),
+            ))
+        points_access = self._add_accessor(
             pygltflib.Accessor(
-                bufferView=self._push_data(points.tobytes(),
+                bufferView=self._push_data(points,
                                            pygltflib.ARRAY_BUFFER),
                 componentType=GLTF_T[self.float_t],
                 count=len(points),
                 type=pygltflib.VEC3,
                 max=points.max(axis=0).tolist(),
                 min=points.min(axis=0).tolist(),
-            )
-        ])
-
+            ))
 
-        indices_access = len(self.gltf.accessors)-2
-        points_access  = len(self.gltf.accessors)-1
         self.gltf.meshes.append(
                pygltflib.Mesh(
                  primitives=[
@@ -455,50 +695,146 @@ class GltfLibCanvas(Canvas):
 
 
     def _push_data(self, data, target=None, byteStride=None)->int:
+        """
+        Append ``data`` (bytes or a numpy array) to the binary buffer and
+        return the index of a new bufferView referencing it.
+        """
+        if isinstance(data, np.ndarray):
+            data = np.ascontiguousarray(data)
+
+        # Identical payloads share one bufferView
+        view = memoryview(data)
+        key  = (hashlib.blake2b(view, digest_size=16).digest(), view.nbytes, target, byteStride)
+        if key in self._views:
+            index = self._views[key]
+            old   = self.gltf.bufferViews[index]
+            if view.nbytes == 0 or self._buffer.read(old.byteOffset, old.byteLength) == view.cast("B"):
+                return index
+
+        offset = self._buffer.push(data)
+
         self.gltf.bufferViews.append(
                 pygltflib.BufferView(
                     buffer=0,
                     byteStride=byteStride,
-                    byteOffset=self.gltf.buffers[0].byteLength,
-                    byteLength=len(data),
+                    byteOffset=offset,
+                    byteLength=len(self._buffer) - offset,
                     target=target,
                 )
         )
 
-        self.gltf._glb_data += data
-        self.gltf.buffers[0].byteLength += len(data)
-        return len(self.gltf.bufferViews)-1
+        self.gltf.buffers[0].byteLength = len(self._buffer)
+        self._views[key] = len(self.gltf.bufferViews)-1
+        return self._views[key]
 
 
-    def plot_nodes(self, vertices, label = None, style=None, data=None, rotations=None, skin=False, **kwds):
-        nodes = []
+    def _add_accessor(self, accessor)->int:
+        """
+        Append ``accessor`` and return its index, or return the index of an
+        existing accessor that describes the same region of the same
+        bufferView. Since _push_data shares views between identical
+        payloads, accessors of identical arrays are shared as well.
+        """
+        key = _accessor_key(accessor)
+        if key is not None and key in self._accessors:
+            index = self._accessors[key]
+            # Accessors may have been changed, e.g. by quantize()
+            if index < len(self.gltf.accessors) and _accessor_key(self.gltf.accessors[index]) == key:
+                return index
+
+        index = _append_index(self.gltf.accessors, accessor)
+        if key is not None:
+            self._accessors[key] = index
+        return index
+
+    def _use_extension(self, name, required=False):
+        if self.gltf.extensionsUsed is None:
+            self.gltf.extensionsUsed = []
+        if name not in self.gltf.extensionsUsed:
+            self.gltf.extensionsUsed.append(name)
+
+        if required:
+            if self.gltf.extensionsRequired is None:
+                self.gltf.extensionsRequired = []
+            if name not in self.gltf.extensionsRequired:
+                self.gltf.extensionsRequired.append(name)
 
-        # if not hasattr(self, "_node_mesh"):
-        #     self._init_nodes(style or NodeStyle())
+    def plot_nodes(self, vertices, label = None, style=None, data=None, rotations=None, skin=False, **kwds):
+        """
+        Draw a marker at each vertex.
 
+        Unless ``skin`` is True, all markers are drawn by a single glTF node
+        that instances the marker mesh with the ``EXT_mesh_gpu_instancing``
+        extension. When ``skin`` is True, one node is created per vertex so
+        that each marker can be used as a separate joint; these nodes are
+        not added to the scene.
+        """
         marker = self._find_marker(style or NodeStyle())
 
-        if rotations is None:
-            rotations = itertools.repeat([0, 0, 0, 1.0])
-        else:
+        R = self._rotation_matrix
+        translations = np.asarray(vertices, dtype=float).reshape(-1, 3)@R.T
+
+        if len(translations) == 0:
+            return []
+
+        quaternions = None
+        if rotations is not None:
+            rotations = np.asarray(rotations, dtype=float)
             try:
-                rotations = Rotation.from_matrix([self._rotation_matrix@R for R in rotations]).as_quat().tolist()
+                quaternions = Rotation.from_matrix(R@rotations).as_quat()
             except ValueError:
-                rotations = Rotation.from_rotvec([self._rotation_matrix@R for R in rotations]).as_quat().tolist()
+                quaternions = Rotation.from_rotvec(rotations@R.T).as_quat()
+
+        if skin:
+            if quaternions is None:
+                quaternions = np.tile([0, 0, 0, 1.0], (len(translations), 1))
+            nodes = []
+            for coord, rotation in zip(translations.tolist(), quaternions.tolist()):
+                index = _append_index(self.gltf.nodes, pygltflib.Node(
+                        mesh=marker,
+                        rotation=rotation,
+                        translation=coord,
+                    )
+                )
+                nodes.append(Node(id=index))
+            return nodes
 
+        return [Node(id=self._plot_instances(marker, translations, quaternions, name=label))]
 
-        for coord, rotation in zip(vertices, rotations):
-            index = _append_index(self.gltf.nodes, pygltflib.Node(
-                    mesh=marker,
-                    rotation=rotation,
-                    translation=(self._rotation_matrix@coord).tolist(),
-                )
-            )
-            if not skin:
-                self.gltf.scenes[0].nodes.append(index)
-            nodes.append(Node(id=index))
+    def _plot_instances(self, mesh, translations, rotations=None, scales=None, name=None)->int:
+        """
+        Add a single scene node that draws ``mesh`` once for every row of
+        ``translations`` using the ``EXT_mesh_gpu_instancing`` extension.
+        ``rotations`` are (n,4) quaternions and ``scales`` are (n,3) factors.
+        Returns the index of the new node.
+        """
+        self._use_extension("EXT_mesh_gpu_instancing")
 
-        return nodes
+        attributes = {}
+        for attr, array, type in (("TRANSLATION", translations, pygltflib.VEC3),
+                                  ("ROTATION",    rotations,    pygltflib.VEC4),
+                                  ("SCALE",       scales,       pygltflib.VEC3)):
+            if array is None:
+                continue
+            array = np.asarray(array, dtype=self.float_t)
+            attributes[attr] = self._add_accessor(pygltflib.Accessor(
+                bufferView=self._push_data(array),
+                componentType=GLTF_T[self.float_t],
+                count=len(array),
+                type=type,
+                max=array.max(axis=0).tolist(),
+                min=array.min(axis=0).tolist(),
+            ))
+
+        index = _append_index(self.gltf.nodes, pygltflib.Node(
+                mesh=mesh,
+                # glTF requires names to be strings
+                name=None if name is None else str(name),
+                extensions={"EXT_mesh_gpu_instancing": {"attributes": attributes}},
+            )
+        )
+        self.gltf.scenes[0].nodes.append(index)
+        return index
 
     def add_lines(self, lines: list, style=None, skin_nodes=None):
         """
@@ -532,8 +868,8 @@ class GltfLibCanvas(Canvas):
 
         points = np.zeros((len(joint_nodes), 3), dtype=self.float_t)
 
-        ver_accessor = _append_index(self.gltf.accessors, pygltflib.Accessor(
-                bufferView=self._push_data(points.tobytes(), pygltflib.ARRAY_BUFFER),
+        ver_accessor = self._add_accessor(pygltflib.Accessor(
+                bufferView=self._push_data(points, pygltflib.ARRAY_BUFFER),
                 componentType=GLTF_T[self.float_t],
                 count=len(points),
                 type=pygltflib.VEC3,
@@ -566,8 +902,8 @@ class GltfLibCanvas(Canvas):
         # Flatten inverse bind matrices for glTF format
         ibm_array = np.array(inverse_bind_matrices, dtype=self.float_t).reshape(-1, 16)
 
-        ibm_accessor_idx = _append_index(gltf.accessors, pygltflib.Accessor(
-            bufferView=self._push_data(ibm_array.tobytes(), target=None),
+        ibm_accessor_idx = self._add_accessor(pygltflib.Accessor(
+            bufferView=self._push_data(ibm_array, target=None),
             componentType=GLTF_T[self.float_t],
             count=len(joint_nodes),
             type="MAT4"
@@ -603,9 +939,8 @@ class GltfLibCanvas(Canvas):
 
         # Add buffer view and accessor
 
-        index_accessor_idx = len(gltf.accessors)
-        gltf.accessors.append(pygltflib.Accessor(
-            bufferView=self._push_data(index_array.tobytes(),pygltflib.ELEMENT_ARRAY_BUFFER),
+        index_accessor_idx = self._add_accessor(pygltflib.Accessor(
+            bufferView=self._push_data(index_array,pygltflib.ELEMENT_ARRAY_BUFFER),
             componentType=GLTF_T[self.index_t],
             count=len(index_array),
             type="SCALAR",
@@ -615,18 +950,16 @@ class GltfLibCanvas(Canvas):
 
         # Create the line mesh
 
-        joints_0_accessor_idx = len(gltf.accessors)
-        gltf.accessors.append(pygltflib.Accessor(
-            bufferView=self._push_data(np.array(joints_0, dtype=self.index_t).tobytes(), pygltflib.ARRAY_BUFFER),
+        joints_0_accessor_idx = self._add_accessor(pygltflib.Accessor(
+            bufferView=self._push_data(np.array(joints_0, dtype=self.index_t), pygltflib.ARRAY_BUFFER),
             componentType=GLTF_T[self.index_t],
             count=len(joints_0),
             type="VEC4"
         ))
 
         weights_0_array = np.array(weights_0, dtype=self.float_t)
-        weights_0_accessor_idx = len(gltf.accessors)
-        gltf.accessors.append(pygltflib.Accessor(
-            bufferView=self._push_data(weights_0_array.tobytes(), pygltflib.ARRAY_BUFFER),
+        weights_0_accessor_idx = self._add_accessor(pygltflib.Accessor(
+            bufferView=self._push_data(weights_0_array, pygltflib.ARRAY_BUFFER),
             componentType=GLTF_T[self.float_t],
             count=len(weights_0),
             type="VEC4"
@@ -663,337 +996,203 @@ class GltfLibCanvas(Canvas):
     def set_data(self, data, key):
 
         points = np.array(data, dtype=self.float_t)
-        self.gltf.accessors.extend([
+        index = self._add_accessor(
             pygltflib.Accessor(
-                bufferView=self._push_data(points.tobytes(), pygltflib.ARRAY_BUFFER),
+                bufferView=self._push_data(points, pygltflib.ARRAY_BUFFER),
                 componentType=GLTF_T[self.float_t],
                 count=len(points),
                 type=pygltflib.VEC3,
                 max=points.max(axis=0).tolist(),
                 min=points.min(axis=0).tolist(),
             )
-        ])
-
-        self._data[key] = {"access_index": len(self.gltf.accessors)-1}
-
-
-    def _make_line_strip(self, indices, vertices, points_access, material):
-        
-        # `n` adjusts indices by the number of nan rows that were removed so far
-        if not isinstance(vertices, (int, str)):
-            n  = sum(np.isnan(vertices[:indices[0],0]))
-        else:
-            n = 0
-
-        indices_array = indices - np.dtype(self.index_t).type(n)
-
-        indices_binary_blob = indices_array.tobytes()
-
-        if len(indices_array) <= 1:
-            import warnings
-            warnings.warn(indices_array)
-            return None
-
-        self.gltf.accessors.extend([
-            pygltflib.Accessor(
-                bufferView=self._push_data(indices_binary_blob,
-                                            pygltflib.ELEMENT_ARRAY_BUFFER),
-                componentType=GLTF_T[self.index_t],
-                count=indices_array.size,
-                type=pygltflib.SCALAR,
-                max=[int(indices_array.max())],
-                min=[int(indices_array.min())],
-            )
-        ])
-        self.gltf.meshes.append(
-                pygltflib.Mesh(
-                    primitives=[
-                        pygltflib.Primitive(
-                            mode=pygltflib.LINE_STRIP,
-                            attributes=pygltflib.Attributes(POSITION=points_access),
-                            material=material,
-                            # most recently added accessor
-                            indices=len(self.gltf.accessors)-1,
-                            # TODO: use this mechanism to add annotation data
-                            extras={},
-                        )
-                    ]
-                )
-        )
-
-        self.gltf.nodes.append(pygltflib.Node(
-                mesh=len(self.gltf.meshes)-1,
-                rotation=self._rotation
-            )
-        )
-
-        self.gltf.scenes[0].nodes.append(
-            len(self.gltf.nodes)-1
         )
 
-        return Line(id=len(self.gltf.nodes)-1)
+        self._data[key] = {"access_index": index}
 
-    def plot_lines(self, vertices, indices=None, style: LineStyle | None = None, **node_kwds):
+    def plot_lines(self, vertices, indices=None, style: LineStyle | None = None, label=None, **node_kwds)->list:
         """
-        Add a batch of disconnected line-segments to the scene as a *single*
+        Add a batch of line segments to the scene as a *single*
         glTF primitive (mode = LINES).
 
         Parameters
         ----------
         vertices : array_like, int, or str
-            • (N, 3) array – NaNs may delimit poly-lines  
-            • accessor index/name – reuse an existing POSITION accessor
+            • (N, 3) array – NaN rows may delimit poly-lines
+            • name of data stored with ``set_data`` – reuse its POSITION accessor
         indices : sequence[array_like] | None
             If given, each item is a vertex-index list describing one poly-line.
-            Consecutive pairs are turned into independent segments.  If omitted
-            and ``vertices`` is an array with NaNs, the index list is generated
-            automatically.
+            Consecutive pairs are turned into independent segments.  If omitted,
+            ``vertices`` must be an array and poly-lines are delimited by NaN rows.
         style   : LineStyle, optional
             Passed to ``_get_material``.
         **node_kwds
-            Extra kwargs for the created glTF ``Node`` (e.g. “name”, “matrix”, ...).
+            Extra kwargs for the created glTF ``Node`` (e.g. "matrix", ...).
 
         Returns
         -------
-        int
-            Index of the new ``Node`` in ``self.gltf.nodes``.
+        list
+            A single ``Line`` referencing the new ``Node``, or an empty list
+            if there was nothing to draw.
         """
+        material = self._get_material(style or LineStyle())
+
         #
-        # 1.  Material
+        # POSITION accessor
         #
-        material_idx = self._get_material(style or LineStyle())
-
-        # ------------------------------------------------------------------
-        # 2.  POSITION accessor
-        # ------------------------------------------------------------------
         if isinstance(vertices, (int, str)):
-            # Re-use an accessor that caller has already stored.
+            # Re-use an accessor that the caller has already stored.
+            if indices is None:
+                raise ValueError("indices are required when vertices is a data key")
             points_access = self.get_data(vertices)["access_index"]
             n_vertices = self.gltf.accessors[points_access].count
-            # When the caller passes indices, we trust them to
-            # reference this existing accessor correctly.
-            verts_map = None          # identity
+            segments = _polyline_segments(indices)
+
         else:
-            return self.plot_lines_old(vertices, indices, style, **node_kwds)
             vertices = np.asarray(vertices, dtype=self.float_t)
             if vertices.ndim != 2 or vertices.shape[1] != 3:
                 raise ValueError("vertices must be (N,3)")
 
-            # Strip NaN rows – these are *delimiters*, never emitted.
-            finite_mask = np.isfinite(vertices[:, 0])
-            points = vertices[finite_mask]
-            if points.size == 0:
-                return None  # nothing to draw
-
-            buf_view = self._push_data(points.tobytes(), pygltflib.ARRAY_BUFFER)
-            self.gltf.accessors.append(
-                pygltflib.Accessor(
-                    bufferView=buf_view,
-                    componentType=GLTF_T[self.float_t],
-                    count=len(points),
-                    type=pygltflib.VEC3,
-                    min=points.min(axis=0).tolist(),
-                    max=points.max(axis=0).tolist(),
-                )
-            )
-            points_access = len(self.gltf.accessors) - 1
+            # NaN rows are delimiters and are never emitted
+            finite = np.isfinite(vertices).all(axis=1)
+            if not finite.any():
+                return []
+
+            # Merge coincident vertices, and map rows of `vertices`
+            # to rows of the deduplicated array
+            points, inverse = np.unique(vertices[finite], axis=0, return_inverse=True)
+            verts_map = np.full(len(vertices), -1, dtype=np.int64)
+            verts_map[finite] = inverse.reshape(-1)
+
+            if indices is None:
+                # Segments join consecutive rows that are not delimiters
+                start = np.flatnonzero(finite[:-1] & finite[1:])
+                segments = verts_map[np.stack([start, start+1], axis=1)]
+            else:
+                segments = verts_map[_polyline_segments(indices)]
+                segments = segments[(segments >= 0).all(axis=1)]
+
+            points_access = self._add_accessor(pygltflib.Accessor(
+                bufferView=self._push_data(points, pygltflib.ARRAY_BUFFER),
+                componentType=GLTF_T[self.float_t],
+                count=len(points),
+                type=pygltflib.VEC3,
+                max=points.max(axis=0).tolist(),
+                min=points.min(axis=0).tolist(),
+            ))
             n_vertices = len(points)
 
-            # Map original row index to new compact index
-            verts_map = np.full(len(vertices), -1, dtype=self.index_t)
-            verts_map[finite_mask] = np.arange(n_vertices, dtype=self.index_t)
-
-        # ------------------------------------------------------------------
-        # 3.  Build flat SCALAR index list (pairs)
-        # ------------------------------------------------------------------
-        seg_idx = []
-        if indices is not None:
-            for poly in indices:
-                poly = np.asarray(poly, dtype=self.index_t)
-                if verts_map is not None:
-                    poly = verts_map[poly]          # translate to compact space
-                if len(poly) < 2:
-                    continue
-                # consecutive pairs
-                for i in range(len(poly) - 1):
-                    a, b = poly[i], poly[i + 1]
-                    if a != b:                      # skip degenerate
-                        seg_idx.extend((a, b))
-        else:
-            if verts_map is None:
-                raise ValueError("Automatic index generation needs vertices array.")
-            current = []
-            for src_idx, compact_idx in enumerate(verts_map):
-                if compact_idx == -1:               # NaN delimiter
-                    current.clear()
-                    continue
-                current.append(compact_idx)
-                if len(current) >= 2:
-                    # last two points form a segment
-                    seg_idx.extend(current[-2:])
-        if not seg_idx:
-            return None
-
-        seg_idx = np.asarray(seg_idx, dtype=self.index_t)
-        if seg_idx.max() >= n_vertices:
-            raise ValueError("Index out of range for POSITION accessor.")
-
-
-        # ------------------------------------------------------------------
-        # Create lines
-        # ------------------------------------------------------------------
-
         #
         # INDICES accessor
-        # 
-        idx_view = self._push_data(seg_idx.tobytes(), pygltflib.ELEMENT_ARRAY_BUFFER)
-        self.gltf.accessors.append(
-            pygltflib.Accessor(
-                bufferView=idx_view,
-                componentType=GLTF_T[self.index_t],
-                count=seg_idx.size,
-                type=pygltflib.SCALAR,
-                min=[int(seg_idx.min())],
-                max=[int(seg_idx.max())],
-            )
-        )
-        idx_acc = len(self.gltf.accessors) - 1
+        #
+        # Drop degenerate and repeated segments
+        segments = np.sort(segments, axis=1)
+        segments = np.unique(segments[segments[:,0] != segments[:,1]], axis=0)
+        if len(segments) == 0:
+            return []
+
+        segments = segments.astype(self.index_t).reshape(-1)
+        if segments.max() >= n_vertices:
+            raise ValueError("Index out of range for POSITION accessor.")
+
+        index_access = self._add_accessor(pygltflib.Accessor(
+            bufferView=self._push_data(segments, pygltflib.ELEMENT_ARRAY_BUFFER),
+            componentType=GLTF_T[self.index_t],
+            count=segments.size,
+            type=pygltflib.SCALAR,
+            max=[int(segments.max())],
+            min=[int(segments.min())],
+        ))
 
         #
         # Primitive, Mesh, and Node
         #
-        primitive = pygltflib.Primitive(
-            attributes={"POSITION": points_access},
-            indices=idx_acc,
-            mode=pygltflib.LINES,
-            material=material_idx,
-        )
-        self.gltf.meshes.append(pygltflib.Mesh(primitives=[primitive]))
-        mesh_idx = len(self.gltf.meshes) - 1
-
-        self.gltf.nodes.append(pygltflib.Node(mesh=mesh_idx, **node_kwds))
-        node_idx = len(self.gltf.nodes) - 1
-
-        self.gltf.scenes[0].nodes.append(node_idx)
-
-        return Line(id=node_idx)
-
-    def plot_lines_old(self, vertices, indices=None, style: LineStyle=None, **kwds):
-
-        lines = []
-        material = self._get_material(style or LineStyle())
-
-        points_access = None 
-
-        if isinstance(vertices, (int, str)):
-            points_access = self.get_data(vertices)["access_index"]
-
-        else:
-            # vertices is given with nans separating line groups, but
-            # GLTF does not accept nans so we have to filter these
-            # out, and add distinct meshes for each line group
-            assert np.all(np.isnan(vertices[np.isnan(vertices[:,0]), :]))
-            points  = np.array(vertices[~np.isnan(vertices[:,0]),:], dtype=self.float_t)
-
-            if points.size == 0:
-                return
-
-            self.gltf.accessors.append(
-                pygltflib.Accessor(
-                    bufferView=self._push_data(points.tobytes(), pygltflib.ARRAY_BUFFER),
-                    componentType=GLTF_T[self.float_t],
-                    count=len(points),
-                    type=pygltflib.VEC3,
-                    max=points.max(axis=0).tolist(),
-                    min=points.min(axis=0).tolist(),
+        mesh = _append_index(self.gltf.meshes, pygltflib.Mesh(
+            primitives=[
+                pygltflib.Primitive(
+                    mode=pygltflib.LINES,
+                    attributes=pygltflib.Attributes(POSITION=points_access),
+                    material=material,
+                    indices=index_access,
                 )
-            )
-            points_access = len(self.gltf.accessors) - 1
-
+            ]
+        ))
 
-        if indices is None:
-            # Get indices by splitting at nans
-            indices_ = utility.split(np.arange(len(vertices), dtype=self.index_t), np.nan, vertices[:,0])
-        else:
-            indices_ = list(map(lambda x: np.array(x, dtype=self.index_t), indices))
+        if label is not None:
+            node_kwds.setdefault("name", str(label))
 
-        for indices in indices_:
-            if (line := self._make_line_strip(indices, vertices, points_access, material)) is None:
-                continue
-            lines.append(line)
+        node = _append_index(self.gltf.nodes, pygltflib.Node(
+            mesh=mesh,
+            rotation=self._rotation,
+            **node_kwds
+        ))
+        self.gltf.scenes[0].nodes.append(node)
 
-        return lines
+        return [Line(id=node)]
 
     def plot_vectors(self, locs, vecs, label=None, extrude=False, **kwds):
+        locs = np.asarray(locs, dtype=float).reshape(-1, 3)
+        vecs = np.asarray(vecs, dtype=float).reshape(-1, 3)
         ne = len(vecs)
-        if not extrude:
-            for j in range(3):
-                style = kwds.get("line_style", LineStyle(color=("red", "green", "blue")[j]))
-                X = np.zeros((ne*3, 3))*np.nan
-                for i in range(j,ne,3):
-                    X[i*3,:] = locs[i]
-                    X[i*3+1,:] = locs[i] + vecs[i]
-                self.plot_lines(X, style=style, label=label)
-        else:
-            for j in range(3):
-                style = kwds.get("line_style", LineStyle(color=("red", "green", "blue")[j]))
-                X = np.zeros((ne*3, 3))*np.nan
-                for i in range(j,ne,3):
-                    self.draw_arrow(locs[i], vector=vecs[i], style=style)
+        for j in range(3):
+            style = kwds.get("line_style", LineStyle(color=("red", "green", "blue")[j]))
+            # Labels may be given per axis
+            name = label[j] if isinstance(label, (list, tuple)) and j < len(label) else label
+            # Every third vector is drawn with the same color
+            idx = np.arange(j, ne, 3)
+            if not extrude:
+                X = np.full((ne*3, 3), np.nan)
+                X[3*idx,:]   = locs[idx]
+                X[3*idx+1,:] = locs[idx] + vecs[idx]
+                self.plot_lines(X, style=style, label=name)
+            else:
+                self._plot_arrows(locs[idx], vecs[idx], style=style, name=name)
+
+    def _find_arrow(self, style):
+        # Arrows are created with unit length and scaled by each instance
+        if style.color not in self._arrows:
+            from veux.assets import create_arrow
+            self._arrows[style.color] = create_arrow(self, 1.0, style)
 
+        return self._arrows[style.color]
 
-    def draw_arrow(self, location, rotation=None, size=None, vector=None, style=None):
-        from veux.assets import create_arrow
-
-        def quaternion_from_x_to_vec(v):
-            """
-            Returns a rotation that rotates [1,0,0] onto the vector v.
-            """
-            # Convert to float np.array and normalize
-            v = np.array(v, dtype=float)
-            if np.allclose(v, 0):
-                raise ValueError("Target vector must be non-zero.")
-            v_norm = v / np.linalg.norm(v)
-
-            # The reference "from" vector is the unit x-axis
-            x_axis = np.array([1.0, 0.0, 0.0])
-
-            # Check if they are already the same (no rotation) or exactly opposite
-            dot_val = np.dot(x_axis, v_norm)
-            if np.isclose(dot_val, 1.0):
-                # Same direction, set to identity quaternion
-                return Rotation.from_quat([0.0, 0.0, 0.0, 1.0])
-            elif np.isclose(dot_val, -1.0):
-                # Opposite direction, 180 deg rotation about any axis perpendicular to x
-                # e.g., about [0,1,0]
-                return Rotation.from_rotvec(np.pi * np.array([0, 1, 0]))
-
-            # Otherwise, compute rotation axis as cross(x_axis, v_norm) and rotation angle
-            axis = np.cross(x_axis, v_norm)
-            axis /= np.linalg.norm(axis)
-            angle = np.arccos(dot_val)
-
-            return Rotation.from_rotvec(angle * axis)
+    def _plot_arrows(self, locations, vectors, style, name=None):
+        """
+        Draw an arrow from each location along the corresponding vector
+        as a single instanced node. Returns the node index, or None if
+        there were no non-zero vectors.
+        """
+        locations = np.asarray(locations, dtype=float).reshape(-1, 3)
+        vectors   = np.asarray(vectors,   dtype=float).reshape(-1, 3)
+
+        sizes = np.linalg.norm(vectors, axis=1)
+        keep  = np.isfinite(locations).all(axis=1) & np.isfinite(sizes) & (sizes > 0)
+        if not keep.any():
+            return None
+
+        R = self._rotation_matrix
+        sizes = sizes[keep]
+        return self._plot_instances(self._find_arrow(style),
+                                    locations[keep]@R.T,
+                                    _quaternions_from_x((vectors[keep]/sizes[:,None])@R.T),
+                                    np.repeat(sizes[:,None], 3, axis=1),
+                                    name=name)
 
+    def draw_arrow(self, location, rotation=None, size=None, vector=None, style=None):
         if style is None:
             style = DrawStyle(color="red")
 
         if vector is not None:
-            size = np.linalg.norm(vector)
-            rotation = quaternion_from_x_to_vec(vector/size).as_quat().tolist()
-
-        if style.color not in self._arrows:
-            self._arrows[style.color] = create_arrow(self, size, style)
-
-        arrow = self._arrows[style.color]
+            return self._plot_arrows([location], [vector], style=style)
 
         index = _append_index(self.gltf.nodes, pygltflib.Node(
-                mesh=arrow,
+                mesh=self._find_arrow(style),
                 rotation=rotation,
+                scale=[size]*3 if size is not None else None,
                 translation=(self._rotation_matrix@location).tolist(),
             )
         )
         self.gltf.scenes[0].nodes.append(index)
+        return index
 
     
     def draw_skin(self, vertices, triangles):
@@ -1013,33 +1212,31 @@ class GltfLibCanvas(Canvas):
             index_access = triangles
         else:
             triangles = np.array(triangles, dtype=self.index_t)
-            self.gltf.accessors.extend([
+            index_access = self._add_accessor(
                 pygltflib.Accessor(
-                    bufferView=self._push_data(triangles.flatten().tobytes(), pygltflib.ELEMENT_ARRAY_BUFFER),
+                    bufferView=self._push_data(triangles, pygltflib.ELEMENT_ARRAY_BUFFER),
                     componentType=GLTF_T[self.index_t],
                     count=triangles.size,
                     type=pygltflib.SCALAR,
                     max=[int(triangles.max())],
                     min=[int(triangles.min())],
                 )
-            ])
-            index_access = len(self.gltf.accessors)-1
+            )
 
         if isinstance(vertices, int):
             point_access = vertices
         else:
             points    = np.array(vertices, dtype=self.float_t)
-            self.gltf.accessors.extend([
+            point_access = self._add_accessor(
                 pygltflib.Accessor(
-                    bufferView=self._push_data(points.tobytes(), pygltflib.ARRAY_BUFFER),
+                    bufferView=self._push_data(points, pygltflib.ARRAY_BUFFER),
                     componentType=GLTF_T[self.float_t],
                     count=len(points),
                     type=pygltflib.VEC3,
                     max=points.max(axis=0).tolist(),
                     min=points.min(axis=0).tolist(),
                 )
-            ])
-            point_access = len(self.gltf.accessors)-1
+            )
 
 #       # Expecting morph_targets as an iterable of target arrays (each of shape (n,3))
 #       morph_targets = kwds.get("morph_targets", None)
@@ -1049,7 +1246,7 @@ class GltfLibCanvas(Canvas):
 #               mt_arr = np.array(mt, dtype=self.float_t)
 #               self.gltf.accessors.extend([
 #                   pygltflib.Accessor(
-#                       bufferView=self._push_data(mt_arr.tobytes(), pygltflib.ARRAY_BUFFER),
+#                       bufferView=self._push_data(mt_arr, pygltflib.ARRAY_BUFFER),
 #                       componentType=GLTF_T[self.float_t],
 #                       count=len(mt_arr),
 #                       type=pygltflib.VEC3,
@@ -1078,8 +1275,8 @@ class GltfLibCanvas(Canvas):
 
         if joints_0 is not None:
             joints_0  = np.array(joints_0,  dtype="uint16")
-            mesh.primitives[0].attributes.JOINTS_0 = _append_index(self.gltf.accessors, pygltflib.Accessor(
-                bufferView=self._push_data(joints_0.tobytes(), pygltflib.ARRAY_BUFFER),
+            mesh.primitives[0].attributes.JOINTS_0 = self._add_accessor(pygltflib.Accessor(
+                bufferView=self._push_data(joints_0, pygltflib.ARRAY_BUFFER),
                 componentType=GLTF_T["uint16"],
                 count=len(joints_0),
                 type="VEC4"
@@ -1087,8 +1284,8 @@ class GltfLibCanvas(Canvas):
 
         if weights_0 is not None:
             weights_0 = np.array(weights_0, dtype=self.float_t)
-            mesh.primitives[0].attributes.WEIGHTS_0 = _append_index(self.gltf.accessors, pygltflib.Accessor(
-                bufferView=self._push_data(weights_0.tobytes(), pygltflib.ARRAY_BUFFER),
+            mesh.primitives[0].attributes.WEIGHTS_0 = self._add_accessor(pygltflib.Accessor(
+                bufferView=self._push_data(weights_0, pygltflib.ARRAY_BUFFER),
                 componentType=GLTF_T[self.float_t],
                 count=len(weights_0),
                 type="VEC4"
@@ -1097,17 +1294,16 @@ class GltfLibCanvas(Canvas):
 
         if local_coords is not None:
             locoor = np.array(local_coords, dtype=self.float_t)
-            self.gltf.accessors.extend([
+            mesh.primitives[0].attributes.TEXCOORD_0 = self._add_accessor(
                 pygltflib.Accessor(
-                    bufferView=self._push_data(locoor.tobytes(), pygltflib.ARRAY_BUFFER),
+                    bufferView=self._push_data(locoor, pygltflib.ARRAY_BUFFER),
                     componentType=GLTF_T[self.float_t],
                     count=len(locoor),
                     type=pygltflib.VEC2,
                     max=locoor.max(axis=0).tolist(),
                     min=locoor.min(axis=0).tolist(),
                 )
-            ])
-            mesh.primitives[0].attributes.TEXCOORD_0 = len(self.gltf.accessors) -1
+            )
         
         #
         # 4) Create a Node referencing the mesh + skin
@@ -1134,7 +1330,7 @@ class GltfLibCanvas(Canvas):
 
     def plot_mesh_field(self, mesh_handle, field,
                         colormap="rainbow4", # "cet_CET_R1",# "cet_CET_D13"#"twilight", #"viridis", 
-                        vmin=None, vmax=None,
+                        vmin=None, vmax=None, texture=None,
                         **kwds) -> tuple:
         """
         Draw a mesh colored by a scalar field.
@@ -1146,28 +1342,46 @@ class GltfLibCanvas(Canvas):
         :param style: optional style info
         :param colormap: name of a matplotlib colormap or something similar
         :param vmin, vmax: optionally set the data range for mapping
+        :param texture: if True, store the field as a texture coordinate that
+                        samples a shared colormap texture instead of as vertex
+                        colors; defaults to the ``field_texture`` canvas option
         :param kwds: other keywords
         """
+        if texture is None:
+            texture = self._field_texture
+
+        mesh_idx = self.gltf.nodes[mesh_handle.id].mesh
+        primitive = self.gltf.meshes[mesh_idx].primitives[0]
+
+        if texture:
+            coords, material = self._map_field_to_texture(field, colormap, vmin, vmax)
+            primitive.attributes.TEXCOORD_0 = self._add_accessor(pygltflib.Accessor(
+                bufferView=self._push_data(coords, pygltflib.ARRAY_BUFFER),
+                componentType=GLTF_T["uint16"],
+                normalized=True,
+                count=len(coords),
+                type=pygltflib.VEC2,
+            ))
+            primitive.material = material
+            return mesh_handle
 
         # Determine color array from field
         color_array = self._map_field_to_colors(field, colormap, vmin, vmax)
 
         color_array = color_array.astype(self.float_t)
-        self.gltf.accessors.extend([
+        color_access = self._add_accessor(
             pygltflib.Accessor(
-                bufferView=self._push_data(color_array.tobytes(), pygltflib.ARRAY_BUFFER),
+                bufferView=self._push_data(color_array, pygltflib.ARRAY_BUFFER),
                 componentType=GLTF_T[self.float_t],
                 count=len(color_array),
                 type=pygltflib.VEC4,  # RGBA
                 max=color_array.max(axis=0).tolist(),
                 min=color_array.min(axis=0).tolist(),
             )
-        ])
-        color_access = len(self.gltf.accessors) - 1
+        )
 
         # Attach the color accessor to the existing mesh’s attributes
-        mesh_idx = self.gltf.nodes[mesh_handle.id].mesh
-        self.gltf.meshes[mesh_idx].primitives[0].attributes.COLOR_0 = color_access
+        primitive.attributes.COLOR_0 = color_access
 
         return mesh_handle
 
@@ -1175,53 +1389,694 @@ class GltfLibCanvas(Canvas):
                              colormap="cet_CET_D13", #"rainbow4", #"viridis", 
                              vmin=None, vmax=None):
         """
+        Return an (n,4) array with the RGBA color of each value of ``field``.
         """
-        try:
-            import colorcet as cc
-            field = np.asarray(field, dtype=np.float64)
+        field = np.asarray(field, dtype=np.float64)
 
-            # Normalisation
-            if vmin is None:
-                vmin = np.nanmin(field)
-            if vmax is None:
-                vmax = np.nanmax(field)
+        # Normalisation
+        if vmin is None:
+            vmin = np.nanmin(field)
+        if vmax is None:
+            vmax = np.nanmax(field)
 
-            # avoid divide-by-zero
-            span = vmax - vmin or 1.0
-            t = np.clip((field - vmin) / span, 0.0, 1.0)
+        # avoid divide-by-zero
+        span = vmax - vmin or 1.0
+        return _colormap(colormap)(np.clip((field - vmin)/span, 0.0, 1.0))
 
+    def _map_field_to_texture(self, field, colormap, vmin=None, vmax=None)->tuple:
+        """
+        Return normalized uint16 texture coordinates for ``field`` together
+        with the index of a material that maps them through ``colormap``.
 
-            try:
-                cmap = cc.cm[colormap]
-            except KeyError as e:
-                raise ValueError(f"Unknown ColorCET colormap '{colormap}'.") from e
+        Coordinates are normalized by the range of the field itself, and the
+        limits ``vmin`` and ``vmax`` are applied by a ``KHR_texture_transform``
+        on the material, so that changing them does not touch the vertex data.
+        """
+        field = np.asarray(field, dtype=np.float64)
+        lo, hi = np.nanmin(field), np.nanmax(field)
+        span = hi - lo or 1.0
+        t = np.nan_to_num((field - lo)/span)
+
+        # Place 0 and 1 at the centers of the first and last texels
+        n = len(_colormap_table(colormap))
+        u = (0.5 + t*(n - 1))/n
+
+        coords = np.empty((len(u), 2), dtype="uint16")
+        coords[:,0] = np.round(u*0xFFFF)
+        coords[:,1] = 0x8000
+
+        # Affine map from the normalized field to the requested limits
+        vmin = lo if vmin is None else vmin
+        vmax = hi if vmax is None else vmax
+        a = span/(vmax - vmin or 1.0)
+        b = (lo - vmin)/(vmax - vmin or 1.0)
+        scale  = float(a)
+        offset = float((0.5*(1 - a) + (n - 1)*b)/n)
+        return coords, self._find_colormap_material(colormap, scale, offset)
+
+    def _find_colormap_material(self, colormap, scale=1.0, offset=0.0)->int:
+        """
+        Return the index of an unlit-looking material whose base color samples
+        the texture of ``colormap``; textures and materials are shared.
+        """
+        key = (colormap, scale, offset)
+        if key in self._field_materials:
+            return self._field_materials[key]
+
+        if colormap not in self._colormap_textures:
+            table = _colormap_table(colormap)
+            if not self.gltf.samplers:
+                self.gltf.samplers.append(pygltflib.Sampler(
+                    magFilter=pygltflib.LINEAR,
+                    minFilter=pygltflib.LINEAR,
+                    wrapS=pygltflib.CLAMP_TO_EDGE,
+                    wrapT=pygltflib.CLAMP_TO_EDGE,
+                ))
+            image = _append_index(self.gltf.images, pygltflib.Image(
+                bufferView=self._push_data(_png_rgba(table[None])),
+                mimeType="image/png",
+                name=colormap,
+            ))
+            self._colormap_textures[colormap] = _append_index(self.gltf.textures,
+                    pygltflib.Texture(source=image, sampler=0, name=colormap))
+
+        info = pygltflib.TextureInfo(index=self._colormap_textures[colormap])
+        if (scale, offset) != (1.0, 0.0):
+            self._use_extension("KHR_texture_transform")
+            info.extensions = {"KHR_texture_transform": {"offset": [offset, 0.0], "scale": [scale, 1.0]}}
+
+        self._field_materials[key] = _append_index(self.gltf.materials, pygltflib.Material(
+            name=colormap,
+            doubleSided=True,
+            pbrMetallicRoughness=pygltflib.PbrMetallicRoughness(
+                baseColorTexture=info,
+                metallicFactor=0.0,
+                roughnessFactor=1.0,
+            )
+        ))
+        return self._field_materials[key]
 
-            colors = cmap(t)
-            return colors
 
-        except:
-            import matplotlib
-            import matplotlib.cm
+    def _read_accessor(self, index)->np.ndarray:
+        """
+        Return a copy of the data referenced by accessor ``index`` as an
+        array with shape (count, components).
+        """
+        accessor = self.gltf.accessors[index]
+        view   = self.gltf.bufferViews[accessor.bufferView]
+        dtype  = np.dtype(_NUMPY_T[accessor.componentType])
+        ncomp  = _COMPONENTS[accessor.type]
+        stride = view.byteStride or ncomp*dtype.itemsize
+        start  = view.byteOffset + (accessor.byteOffset or 0)
+        data   = self._buffer.read(start, accessor.count*stride)
+        # The last element of a strided view may omit its padding
+        data  += bytes(accessor.count*stride - len(data))
+        return np.frombuffer(data, dtype=dtype).reshape(accessor.count, -1)[:,:ncomp]
+
+    def _draw_calls(self)->int:
+        # Number of primitives drawn by the nodes reachable from the scene
+        count = 0
+        stack = list(self.gltf.scenes[0].nodes)
+        while stack:
+            node = self.gltf.nodes[stack.pop()]
+            if node.mesh is not None:
+                count += len(self.gltf.meshes[node.mesh].primitives)
+            stack.extend(node.children or [])
+        return count
+
+    def _is_static(self, index)->bool:
+        """
+        Return True if scene node ``index`` draws a plain mesh with an identity
+        transform, so that its primitives can be merged with others.
+        """
+        node = self.gltf.nodes[index]
+        if node.mesh is None or node.skin is not None or node.camera is not None \
+                or node.children or node.extensions:
+            return False
+
+        if (node.matrix    is not None and not np.allclose(node.matrix, np.eye(4).flat)) or \
+           (node.translation is not None and np.any(node.translation)) or \
+           (node.rotation  is not None and not np.allclose(node.rotation, [0, 0, 0, 1])) or \
+           (node.scale     is not None and not np.allclose(node.scale, 1)):
+            return False
+
+        mesh = self.gltf.meshes[node.mesh]
+        if mesh.weights:
+            return False
+
+        for primitive in mesh.primitives:
+            if primitive.mode not in _MERGE_MODES or primitive.targets or primitive.extensions:
+                return False
+            attributes = _attribute_items(primitive.attributes)
+            if not attributes:
+                return False
+            for index in (*attributes.values(), primitive.indices):
+                if index is None:
+                    continue
+                accessor = self.gltf.accessors[index]
+                if accessor.sparse is not None or accessor.bufferView is None \
+                        or self.gltf.bufferViews[accessor.bufferView].byteStride:
+                    return False
+        return True
 
-            field = np.array(field, dtype=np.float64)
-            if vmin is None:
-                vmin = field.min()
-            if vmax is None:
-                vmax = field.max()
+    def compact(self)->tuple:
+        """
+        Merge the primitives of static scene nodes that share a material and
+        primitive mode, so that each such group is drawn with a single draw call.
 
-            norm = matplotlib.colors.Normalize(vmin=vmin, vmax=vmax, clip=True)
-            cmap = matplotlib.cm.get_cmap(colormap)
+        Nodes that are skinned, animated, instanced, transformed or used
+        as joints are left untouched. Vertex data is concatenated and indices
+        are offset accordingly; ``LINE_STRIP`` primitives are converted to
+        ``LINES``. Handles previously returned by the ``plot_*`` methods
+        should not be used after compacting.
 
-            colors = cmap(norm(field))
-            return colors
+        Returns
+        -------
+        tuple
+            The number of draw calls issued by the scene before and after compacting.
+        """
+        gltf   = self.gltf
+        before = self._draw_calls()
+
+        # Nodes that are referenced by skins or animations must be kept
+        pinned = set()
+        for skin in gltf.skins:
+            pinned.update(skin.joints)
+            if skin.skeleton is not None:
+                pinned.add(skin.skeleton)
+        for animation in gltf.animations:
+            pinned.update(channel.target.node for channel in animation.channels)
+
+        static = [i for i in gltf.scenes[0].nodes if i not in pinned and self._is_static(i)]
+
+        # Group primitives by material, mode and vertex layout
+        groups = {}
+        origin = {}
+        for index in static:
+            for primitive in gltf.meshes[gltf.nodes[index].mesh].primitives:
+                attributes = _attribute_items(primitive.attributes)
+                layout = tuple(sorted(
+                    (name, gltf.accessors[a].componentType, gltf.accessors[a].type, bool(gltf.accessors[a].normalized))
+                    for name, a in attributes.items()
+                ))
+                mode = pygltflib.LINES if primitive.mode == pygltflib.LINE_STRIP else primitive.mode
+                key  = (primitive.material, mode, layout)
+                if key not in groups:
+                    groups[key] = []
+                    origin[key] = index
+                groups[key].append((attributes, primitive))
+
+        # Create one node for every group, placed where its first member was
+        group_nodes = {}
+        for key, members in groups.items():
+            material, mode, _ = key
+            if len(members) == 1 and members[0][1].mode == mode:
+                attributes, primitive = members[0]
+                indices = primitive.indices
+            else:
+                attributes, indices = self._merge_primitives(members)
+
+            mesh = _append_index(gltf.meshes, pygltflib.Mesh(primitives=[
+                pygltflib.Primitive(
+                    attributes=pygltflib.Attributes(**attributes),
+                    indices=indices,
+                    mode=mode,
+                    material=material
+                )
+            ]))
+            group_nodes.setdefault(origin[key], []).append(
+                    _append_index(gltf.nodes, pygltflib.Node(mesh=mesh)))
+
+        removed = set(static)
+        scene = []
+        for index in gltf.scenes[0].nodes:
+            if index in removed:
+                scene.extend(group_nodes.get(index, []))
+            else:
+                scene.append(index)
+        gltf.scenes[0].nodes = scene
+
+        self._prune(removed)
+        return before, self._draw_calls()
+
+    def _merge_primitives(self, members)->tuple:
+        """
+        Concatenate the vertex data of a group of primitives with the same layout
+        and return the attribute and index accessors of the merged primitive.
+        Primitives that share their vertex accessors share one copy of the data.
+        """
+        offsets = {}
+        arrays  = {name: [] for name in members[0][0]}
+        indices = []
+        nv = 0
+        for attributes, primitive in members:
+            ref = tuple(sorted(attributes.items()))
+            if ref not in offsets:
+                offsets[ref] = nv
+                for name, index in attributes.items():
+                    arrays[name].append(self._read_accessor(index))
+                nv += len(arrays[name][-1])
+
+            count = self.gltf.accessors[next(iter(attributes.values()))].count
+            if primitive.indices is None:
+                local = np.arange(count)
+            else:
+                local = self._read_accessor(primitive.indices).reshape(-1).astype(np.int64)
+
+            if primitive.mode == pygltflib.LINE_STRIP:
+                local = np.stack([local[:-1], local[1:]], axis=1).reshape(-1)
+
+            indices.append(local + offsets[ref])
+
+        merged = {}
+        for name, parts in arrays.items():
+            source = self.gltf.accessors[members[0][0][name]]
+            data = np.concatenate(parts)
+            merged[name] = self._add_accessor(pygltflib.Accessor(
+                bufferView=self._push_data(data, pygltflib.ARRAY_BUFFER),
+                componentType=source.componentType,
+                normalized=source.normalized,
+                count=len(data),
+                type=source.type,
+                max=data.max(axis=0).tolist() if source.max else [],
+                min=data.min(axis=0).tolist() if source.min else [],
+            ))
+
+        indices = np.concatenate(indices).astype(self.index_t)
+        index = self._add_accessor(pygltflib.Accessor(
+            bufferView=self._push_data(indices, pygltflib.ELEMENT_ARRAY_BUFFER),
+            componentType=GLTF_T[self.index_t],
+            count=indices.size,
+            type=pygltflib.SCALAR,
+            max=[int(indices.max())] if indices.size else [],
+            min=[int(indices.min())] if indices.size else [],
+        ))
+        return merged, index
+
+    def _map_accessors(self, f):
+        # Replace every accessor index referenced by the document with f(index)
+        for mesh in self.gltf.meshes:
+            for primitive in mesh.primitives:
+                for name, index in _attribute_items(primitive.attributes).items():
+                    if isinstance(primitive.attributes, dict):
+                        primitive.attributes[name] = f(index)
+                    else:
+                        setattr(primitive.attributes, name, f(index))
+                if primitive.indices is not None:
+                    primitive.indices = f(primitive.indices)
+                for target in primitive.targets or []:
+                    for name in target:
+                        target[name] = f(target[name])
+
+        for node in self.gltf.nodes:
+            if node.extensions and "EXT_mesh_gpu_instancing" in node.extensions:
+                attributes = node.extensions["EXT_mesh_gpu_instancing"]["attributes"]
+                for name in attributes:
+                    attributes[name] = f(attributes[name])
+
+        for skin in self.gltf.skins:
+            if skin.inverseBindMatrices is not None:
+                skin.inverseBindMatrices = f(skin.inverseBindMatrices)
+
+        for animation in self.gltf.animations:
+            for sampler in animation.samplers:
+                sampler.input  = f(sampler.input)
+                sampler.output = f(sampler.output)
+
+        for entry in self._data.values():
+            if "access_index" in entry:
+                entry["access_index"] = f(entry["access_index"])
+
+    def _prune(self, removed):
+        """
+        Delete the nodes in ``removed`` together with any meshes, accessors and
+        buffer data that are no longer referenced, and renumber the rest.
+        """
+        gltf = self.gltf
+        removed_meshes = {gltf.nodes[i].mesh for i in removed}
 
+        # Nodes
+        node_map = {}
+        nodes = []
+        for i, node in enumerate(gltf.nodes):
+            if i not in removed:
+                node_map[i] = _append_index(nodes, node)
+        gltf.nodes = nodes
+        for scene in gltf.scenes:
+            scene.nodes = [node_map[i] for i in scene.nodes]
+        for node in nodes:
+            if node.children:
+                node.children = [node_map[i] for i in node.children]
+        for skin in gltf.skins:
+            skin.joints = [node_map[i] for i in skin.joints]
+            if skin.skeleton is not None:
+                skin.skeleton = node_map[skin.skeleton]
+        for animation in gltf.animations:
+            for channel in animation.channels:
+                if channel.target.node is not None:
+                    channel.target.node = node_map[channel.target.node]
+
+        # Meshes; cached assets that were only drawn by removed nodes are forgotten
+        removed_meshes -= {node.mesh for node in nodes}
+        used = [j for j in range(len(gltf.meshes)) if j not in removed_meshes]
+        mesh_map = {j: i for i, j in enumerate(used)}
+        gltf.meshes = [gltf.meshes[j] for j in used]
+        for node in nodes:
+            if node.mesh is not None:
+                node.mesh = mesh_map[node.mesh]
+        self._node_markers = {k: mesh_map[m] for k, m in self._node_markers.items() if m in mesh_map}
+        self._arrows       = {k: mesh_map[m] for k, m in self._arrows.items()       if m in mesh_map}
+
+        # Accessors
+        used = set()
+        self._map_accessors(lambda i: used.add(i) or i)
+        if len(used) < len(gltf.accessors):
+            used = sorted(used)
+            accessor_map = {j: i for i, j in enumerate(used)}
+            gltf.accessors = [gltf.accessors[j] for j in used]
+            self._map_accessors(accessor_map.__getitem__)
+
+        # Buffer views and the binary data they reference; the buffer is
+        # only rebuilt when some of it is no longer referenced
+        used = sorted({a.bufferView for a in gltf.accessors if a.bufferView is not None}
+                    | {image.bufferView for image in gltf.images if image.bufferView is not None})
+        if len(used) < len(gltf.bufferViews):
+            self._prune_views(used)
+
+        self._accessors = {}
+        for i in reversed(range(len(gltf.accessors))):
+            if (key := _accessor_key(gltf.accessors[i])) is not None:
+                self._accessors[key] = i
+
+    def _prune_views(self, used):
+        # Keep only the bufferViews in the sorted list ``used``, and
+        # copy the data they reference into a new buffer
+        gltf = self.gltf
+        view_map = {j: i for i, j in enumerate(used)}
+        arena = _BufferArena()
+        for j in used:
+            view = gltf.bufferViews[j]
+            view.byteOffset = arena.push(self._buffer.read(view.byteOffset, view.byteLength))
+        gltf.bufferViews = [gltf.bufferViews[j] for j in used]
+        for accessor in gltf.accessors:
+            if accessor.bufferView is not None:
+                accessor.bufferView = view_map[accessor.bufferView]
+        for image in gltf.images:
+            if image.bufferView is not None:
+                image.bufferView = view_map[image.bufferView]
+
+        self._buffer = arena
+        gltf.buffers[0].byteLength = len(arena)
+        self._views = {k: view_map[j] for k, j in self._views.items() if j in view_map}
+
+    def quantize(self, tolerance=None)->tuple:
+        """
+        Store vertex data with the compact integer types allowed by the
+        ``KHR_mesh_quantization`` extension.
+
+        Positions are stored as normalized int8 or int16, whichever is the
+        smallest type whose rounding error stays below ``tolerance`` times the
+        diagonal of the model's bounding box; the dequantization is applied by
+        the transform of the nodes that draw them. Colors are stored as normalized
+        uint8, texture coordinates and weights as normalized uint16, joints as
+        uint16, and indices as uint16 whenever they fit.
+
+        Parameters
+        ----------
+        tolerance : float, optional
+            Largest rounding error of positions relative to the size of the
+            model. Defaults to the ``quantize_tolerance`` canvas option.
+
+        Returns
+        -------
+        tuple
+            The size of the binary buffer in bytes before and after quantizing.
+        """
+        if tolerance is None:
+            tolerance = self._quantize_tolerance
+
+        gltf   = self.gltf
+        before = len(self._buffer)
+
+        if self._quantize_positions(tolerance):
+            self._use_extension("KHR_mesh_quantization", required=True)
+
+        done = set()
+        for mesh in gltf.meshes:
+            for primitive in mesh.primitives:
+                for name, index in _attribute_items(primitive.attributes).items():
+                    if index in done:
+                        continue
+                    done.add(index)
+                    accessor = gltf.accessors[index]
+                    if accessor.componentType != pygltflib.FLOAT:
+                        if name.startswith("JOINTS") and accessor.componentType == pygltflib.UNSIGNED_INT:
+                            data = self._read_accessor(index)
+                            if data.size == 0 or data.max() < 1<<16:
+                                self._store_accessor(accessor, data.astype("uint16"), normalized=False)
+                        continue
+
+                    data = self._read_accessor(index)
+                    if data.size and (data.min() < 0 or data.max() > 1):
+                        continue
+
+                    if name.startswith("COLOR"):
+                        self._store_accessor(accessor, _quantize_unorm(data, "uint8"))
+                    elif name.startswith("TEXCOORD"):
+                        self._store_accessor(accessor, _quantize_unorm(data, "uint16"))
+                    elif name.startswith("WEIGHTS"):
+                        self._store_accessor(accessor, _quantize_weights(data, "uint16"))
+
+                if primitive.indices is not None and primitive.indices not in done:
+                    done.add(primitive.indices)
+                    accessor = gltf.accessors[primitive.indices]
+                    if accessor.componentType == pygltflib.UNSIGNED_INT:
+                        data = self._read_accessor(primitive.indices)
+                        # The largest value of the type is reserved for primitive restart
+                        if data.size == 0 or data.max() < (1<<16) - 1:
+                            self._store_accessor(accessor, data.astype("uint16"), normalized=False,
+                                                 target=pygltflib.ELEMENT_ARRAY_BUFFER)
+
+        self._prune(set())
+        return before, len(self._buffer)
+
+    def _quantize_positions(self, tolerance)->bool:
+        """
+        Quantize the float POSITION accessors of meshes that are drawn through
+        plain node transforms. Returns True if any accessor was quantized.
+        """
+        gltf = self.gltf
+
+        # Meshes that share a POSITION accessor must share the dequantization
+        # transform, so they are grouped with a union-find over accessors
+        parent = {}
+        def find(i):
+            while parent.setdefault(i, i) != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        positions = {}
+        for m, mesh in enumerate(gltf.meshes):
+            positions[m] = [p.attributes.POSITION for p in mesh.primitives
+                            if _attribute_items(p.attributes).get("POSITION") is not None]
+            for a in positions[m]:
+                parent[find(("a", a))] = find(("m", m))
+
+        users = {}
+        for n, node in enumerate(gltf.nodes):
+            if node.mesh is not None:
+                users.setdefault(node.mesh, []).append(n)
+
+        # Skinned and instanced nodes do not dequantize through their
+        # own transform, and morph targets would have to be quantized alike
+        excluded = set()
+        for m, mesh in enumerate(gltf.meshes):
+            if mesh.weights or any(p.targets for p in mesh.primitives) or any(
+                    gltf.nodes[n].skin is not None or gltf.nodes[n].extensions
+                    for n in users.get(m, [])):
+                excluded.add(find(("m", m)))
+            elif any(gltf.accessors[a].componentType != pygltflib.FLOAT
+                     or gltf.accessors[a].sparse is not None for a in positions[m]):
+                excluded.add(find(("m", m)))
+
+        groups = {}
+        for m in users:
+            root = find(("m", m))
+            if root not in excluded and positions[m]:
+                groups.setdefault(root, set()).add(m)
+
+        if not groups:
+            return False
+
+        data = {a: self._read_accessor(a).astype(float)
+                for meshes in groups.values() for m in meshes for a in positions[m]}
+
+        bounds = np.array([[x.min(axis=0), x.max(axis=0)] for x in data.values() if len(x)])
+        if len(bounds) == 0:
+            return False
+        size = np.linalg.norm(bounds[:,1].max(axis=0) - bounds[:,0].min(axis=0)) or 1.0
+
+        animated = {channel.target.node for animation in gltf.animations
+                                        for channel in animation.channels}
+
+        quantized = False
+        for meshes in groups.values():
+            accessors = sorted({a for m in meshes for a in positions[m]})
+            points = np.concatenate([data[a] for a in accessors])
+            if len(points) == 0:
+                continue
+            lo, hi  = points.min(axis=0), points.max(axis=0)
+            center  = (lo + hi)/2
+            scale   = float((hi - lo).max()/2) or 1.0
+
+            for dtype in "int8", "int16":
+                limit = np.iinfo(dtype).max
+                if scale/limit/2 <= tolerance*size:
+                    break
+            else:
+                continue
+
+            replace = {}
+            for a in accessors:
+                source = gltf.accessors[a]
+                # The accessor has no data yet, so it is never shared
+                replace[a] = self._add_accessor(pygltflib.Accessor(
+                    componentType=source.componentType,
+                    count=source.count,
+                    type=source.type,
+                    name=source.name,
+                ))
+                q = np.round((data[a] - center)/scale*limit).clip(-limit, limit).astype(dtype)
+                self._store_accessor(gltf.accessors[replace[a]], q, bounds=True)
+
+            for m in meshes:
+                for primitive in gltf.meshes[m].primitives:
+                    if primitive.attributes.POSITION in replace:
+                        primitive.attributes.POSITION = replace[primitive.attributes.POSITION]
+                for n in users[m]:
+                    self._dequantize_node(n, center, scale, child=n in animated)
+            quantized = True
+
+        return quantized
+
+    def _dequantize_node(self, index, center, scale, child=False):
+        """
+        Compose the transform of node ``index`` with the dequantization
+        ``x = scale*q + center`` of its mesh. The mesh is moved to a new child
+        node when the transform of the node cannot absorb it.
+        """
+        node = self.gltf.nodes[index]
+        if child or node.matrix is not None or node.children:
+            mesh, node.mesh = node.mesh, None
+            node.children = (node.children or []) + [_append_index(self.gltf.nodes, pygltflib.Node(
+                mesh=mesh,
+                translation=center.tolist(),
+                scale=[scale]*3,
+            ))]
+            return
+
+        s = np.asarray(node.scale if node.scale is not None else [1.0, 1.0, 1.0])
+        t = np.asarray(node.translation if node.translation is not None else [0.0, 0.0, 0.0])
+        R = Rotation.from_quat(node.rotation if node.rotation is not None else [0, 0, 0, 1])
+        node.translation = (t + R.apply(s*center)).tolist()
+        node.scale = (s*scale).tolist()
+
+    def _store_accessor(self, accessor, data, normalized=True, target=pygltflib.ARRAY_BUFFER, bounds=False):
+        """
+        Replace the data of ``accessor`` with the (count, components) integer
+        array ``data``. Vertex attributes are padded to a 4-byte stride, and
+        ``min``/``max`` are updated if present or if ``bounds`` is True.
+        """
+        count, ncomp = data.shape
+        stride = None
+        if target == pygltflib.ARRAY_BUFFER and (ncomp*data.itemsize) % 4:
+            width  = -(-ncomp*data.itemsize//4)*4//data.itemsize
+            padded = np.zeros((count, width), dtype=data.dtype)
+            padded[:,:ncomp] = data
+            stride = width*data.itemsize
+        else:
+            padded = data
+
+        accessor.bufferView    = self._push_data(padded, target, byteStride=stride)
+        accessor.byteOffset    = 0
+        accessor.componentType = GLTF_T[data.dtype.name]
+        accessor.normalized    = normalized
+        if bounds or accessor.max or accessor.min:
+            accessor.max = data.max(axis=0).tolist() if count else []
+            accessor.min = data.min(axis=0).tolist() if count else []
+
+    def _flush_buffer(self):
+        # Join the arena into the binary blob that pygltflib serializes;
+        # only needed when pygltflib writes the file itself
+        self.gltf.set_binary_blob(self._buffer.tobytes())
+        self.gltf.buffers[0].byteLength = len(self._buffer)
+
+    def _finalize(self):
+        # Passes that run on the document before it is serialized
+        if self._compact:
+            self.compact()
+        if self._quantize:
+            self.quantize()
+        self.gltf.buffers[0].byteLength = len(self._buffer)
+
+    def _to_json(self)->str:
+        # Serialize the document directly rather than through dataclasses-json,
+        # which deep-copies every object and dominates the time to write large scenes
+        return json.dumps(_json_tree(self.gltf), separators=(",", ":"),
+                          allow_nan=False, default=_json_default)
+
+    def _write_glb(self, write, chunk_size=1<<20):
+        """
+        Serialize the document as binary glTF through the callable ``write``.
+
+        The JSON chunk is written first, and the binary chunk is then streamed
+        from the buffer arena in pieces of ``chunk_size`` bytes, so the
+        geometry is never copied into a complete image of the file.
+        """
+        size = len(self._buffer)
+
+        document = self._to_json().encode("utf-8")
+        # Chunks are padded to 4 bytes; JSON with spaces and binary with zeros
+        document += b" "*(-len(document) % 4)
+        padding = -size % 4
+
+        write(struct.pack("<4sII", b"glTF", 2, 12 + 8 + len(document) + (8 + size + padding if size else 0)))
+        write(struct.pack("<I4s", len(document), b"JSON"))
+        write(document)
+        if not size:
+            return
+
+        write(struct.pack("<I4s", size + padding, b"BIN\0"))
+        with self._buffer.getbuffer() as view:
+            for start in range(0, size, chunk_size):
+                write(view[start:start+chunk_size])
+        write(bytes(padding))
 
     def to_glb(self)->bytes:
-        return b"".join(self.gltf.save_to_bytes())
+        self._finalize()
+        stream = io.BytesIO()
+        self._write_glb(stream.write)
+        return stream.getvalue()
 
     def write(self, filename=None):
-
-        self.gltf.save(filename)
+        """
+        Write the document to ``filename``. Files ending in ``.glb``, open binary
+        files and sockets receive a binary glTF that is streamed from the
+        buffer arena; other file names are written by pygltflib.
+        """
+        self._finalize()
+
+        if hasattr(filename, "write"):
+            self._write_glb(filename.write)
+        elif hasattr(filename, "sendall"):
+            self._write_glb(filename.sendall)
+        elif str(filename).lower().endswith(".glb"):
+            with open(filename, "wb") as f:
+                self._write_glb(f.write)
+        else:
+            self._flush_buffer()
+            self.gltf.save(filename)
 
 #       if "glb" in filename[-3:]:
 #           glb = b"".join(self.gltf.save_to_bytes())
@@ -38,7 +38,10 @@ def SketchConfig(kwds=None):
           "axes":        {"show": True, "scale": 1.0, "label": [r"$\mathbf{E}_1$", r"$\mathbf{E}_2$", r"$\mathbf{E}_3$"], "style": LineStyle(color="black")},
       },
       "frame": {
-          "outline":     {"show": True,  "style": LineStyle(color="black"), "basis": None},
+          "outline":     {"show": True,  "style": LineStyle(color="black"), "basis": None,
+                          # Segments of curved frames; either a fixed number of points,
+                          # or a chord tolerance relative to the model size
+                          "samples": {"tolerance": 1e-3, "max": 20, "total": 1_000_000}},
           "surface":     {"show": False, "style": MeshStyle(),             "basis": None, "scale": 1.0, "outline": "long", "line_style": LineStyle(color="black", width=4)},
           "axes":        {"show": False},
           "contour":     None,
@@ -96,10 +99,19 @@ Config = lambda : {
 
   "model_config":  {},
   "state_config":  {},
+  "cache_config":  {
+      "enabled":    True,              # load parsed model files from the on-disk cache
+      "directory":  None,              # defaults to $VEUX_CACHE_DIR or ~/.cache/veux
+      "max_size":   None,              # bytes; least recently used entries are evicted
+  },
   "canvas_config": {
       # Canvas
       "type":       "gltf",
       "view":       "iso",
+      "compact":    False,             # merge static glTF primitives before writing
+      "quantize":   False,             # store glTF vertex data with KHR_mesh_quantization
+      "quantize_tolerance": 1e-4,      # position error relative to the model size
+      "field_texture": False,          # color glTF fields with a colormap texture
       "camera": {
           "view": "iso",               # iso | plan| elev[ation] | sect[ion]
           "projection": "orthographic" # perspective | orthographic
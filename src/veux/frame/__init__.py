@@ -9,6 +9,7 @@
 import warnings
 from collections import defaultdict
 import numpy as np
+from scipy.spatial.transform import Rotation
 Array = np.ndarray
 
 import shps.rotor as so3
@@ -331,45 +332,54 @@ class FrameArtist:
             # linearized rotations for now.
             config["frame"]["basis"] = "Hermite"
 
-        N = 20 if state is not None and config["frame"]["basis"] is not None else 2
-        do_frames = False
-        ne = sum(1 for tag in model.iter_cell_tags() 
-                 if model.cell_matches(tag, "frame") or model.cell_matches(tag, "truss"))
-        frames = np.zeros((ne*(N+1),3))
-        frames.fill(np.nan)
-
-        j = 0 # frame element counter
-        for tag in model.iter_cell_tags():
-            if model.cell_matches(tag, "frame"): # or model.cell_matches(tag, "truss"):
-                if not config["frame"]["show"]:
-                    continue
+        tags = model.cell_tags("frame")
+        if len(tags) == 0 or not config["frame"]["show"]:
+            return
 
-                if config["frame"]["basis"] is None or not model.cell_matches(tag, "frame"):
-                    # Draw a straight line between nodes
-                    do_frames = True
-                    frames[(N+1)*j:(N+1)*j+N,:] = np.linspace(*[
-                        Ra@xn for xn in model.cell_position(tag, state)[[0,-1],:]
-                    ], N)
+        # Indices of the end nodes of every frame
+        offsets, indices = model.cell_connectivity()
+        rows  = np.array([model["cell_index"][tag] for tag in tags.tolist()], dtype=np.int64)
+        ends  = np.stack([indices[offsets[rows]], indices[offsets[rows+1]-1]], axis=1)
 
-                else:
-                    do_frames = True
-                    Q = model.frame_orientation(tag)
-                    X = model.cell_position(tag)
-                    u = [xi - Xi for Xi, xi in zip(X, model.cell_position(tag, state=state))]
-                    R = [model.node_rotation(node, state=state) for node in model.cell_nodes(tag)]
+        X = model.node_position()[ends]                         # (ne,2,3)
+        x = model.node_position(state=state)[ends] if state is not None else X
 
+        if state is None or config["frame"]["basis"] is None:
+            # Draw a straight line between nodes
+            frames = np.full((len(tags), 3, 3), np.nan)
+            frames[:,:2] = x@Ra.T
+            self.canvas.plot_lines(frames.reshape(-1,3)[:,:self.ndm], style=config["frame"]["style"])
+            return
 
-                    frames[(N+1)*j:(N+1)*j+N,:] = [Ra@v for v in  
-                                                    _hermite_cubic(X,
-                                                                 Q=Q,
-                                                                 u = [Q@u[0],          Q@u[1]],
-                                                                 v = [Q@so3.log(R[0]), Q@so3.log(R[1])],
-                                                                 npoints=N).T]
-                j += 1
+        R = model.node_rotation(state=state)
+        if np.ndim(R) == 2:
+            v = np.zeros_like(X)
+        else:
+            v = Rotation.from_matrix(np.asarray(R)[ends].reshape(-1,3,3)).as_rotvec().reshape(-1,2,3)
+
+        Q = model.frame_orientations()
+        samples = config["frame"].get("samples", 20)
+        if isinstance(samples, dict):
+            # Number of segments of each frame
+            size = np.linalg.norm(np.ptp(X.reshape(-1,3), axis=0)) or 1.0
+            n = _frame_samples(X, Q, x - X, v,
+                               tolerance=samples.get("tolerance", 1e-3)*size,
+                               limit=samples.get("max", 20),
+                               total=samples.get("total", None))
+        else:
+            n = np.full(len(tags), max(int(samples), 2) - 1)
 
+        # Pad the parameters of curves with fewer segments; padded points
+        # become the NaN rows that separate frames
+        N  = int(n.max()) + 1
+        k  = np.arange(N+1)[None,:]
+        xi = np.minimum(k/n[:,None], 1.0)
+        points = _hermite_cubics(X, Q, x - X, v, npoints=xi)@Ra.T
+        points[k.repeat(len(n), axis=0) > n[:,None]] = np.nan
 
-        if do_frames and config["frame"]["show"]:
-            self.canvas.plot_lines(frames[:,:self.ndm], style=config["frame"]["style"])
+        # Drop repeated separators
+        keep = k <= n[:,None] + 1
+        self.canvas.plot_lines(points[keep][:,:self.ndm], style=config["frame"]["style"])
 
 
 
@@ -672,13 +682,10 @@ class FrameArtist:
         triangles = []
         if "plane" in config and config["plane"]["show"]:
             nodes = np.array([Ra@model.node_position(tag,state=state) for tag in model.iter_node_tags()])
-
-            for tag in model.iter_cell_tags():
-                if not model.cell_matches(tag, "frame"):
-                    triangles.extend(model.cell_triangles(tag))
+            triangles = model.cell_surface()
 
         if len(triangles) > 0:
-            mesh = self.canvas.plot_mesh(nodes, np.array(triangles), style=config["plane"]["style"])
+            mesh = self.canvas.plot_mesh(nodes, np.asarray(triangles), style=config["plane"]["style"])
 
             if field is not None:
                 if isinstance(field, dict):
@@ -739,30 +746,22 @@ class FrameArtist:
             config = {type: conf["axes"] for type, conf in SketchConfig().items() if "axes" in conf}
             config["frame"]["show"] = True
 
-        ne = sum(1 for tag in self.model.iter_cell_tags() if self.model.cell_matches(tag, "frame"))
-        xyz, uvw = np.nan*np.zeros((2, ne, 3, 3))
-        i = 0
-        for _,tag in enumerate(self.model.iter_cell_tags()):
-            if not self.model.cell_matches(tag, "frame"):
-                continue
+        frames = self.model.cell_tags("frame")
+        if len(frames) == 0 or not config["frame"]["show"]:
+            return
 
-            axes = self.model.frame_orientation(tag)
-            if axes is None or not config["frame"]["show"]:
-                continue
+        axes = self.model.frame_orientations()
+        crd  = [self.model.cell_position(tag, state=state) for tag in frames]
+        ends = np.array([(x[0], x[-1], x.mean(axis=0)) for x in crd])
 
-            crd = self.model.cell_position(tag, state=state) #el["crd"]
-            if size is None:
-                scale = np.linalg.norm(crd[-1] - crd[0])/15
-            else:
-                scale = size
-            coord = sum(i for i in crd)/len(self.model.cell_indices(tag))
-            xyz[i,:,:] = np.array([Ra@coord]*3)
-            uvw[i,:,:] = scale*axes
-            i += 1
+        if size is None:
+            scale = np.linalg.norm(ends[:,1] - ends[:,0], axis=1)/15
+        else:
+            scale = np.full(len(frames), size)
 
-        self.canvas.plot_vectors(xyz.reshape(ne*3,3),
-                                 np.array([Ra@v for v in uvw.reshape(ne*3,3)]),
-                                 extrude=extrude)
+        xyz = np.repeat(ends[:,2]@Ra.T, 3, axis=0)
+        uvw = (scale[:,None,None]*axes).reshape(-1,3)
+        self.canvas.plot_vectors(xyz, uvw@Ra.T, extrude=extrude)
 
 
     def draw_origin(self, **kwds):
@@ -863,6 +862,96 @@ def _elastic_curve(x: Array, v: list, L:float, tangent=False)->Array:
         return (ui*M3 + vi*M5 + uj*M4 + vj*M6).flatten()
 
 
+def _local_ends(coord, Q, u, v):
+    # Length and local end displacements and rotations of frames; columns
+    # are longitudinal, transverse, vertical and section, elevation, plan
+    L = np.linalg.norm(coord[:,1] - coord[:,0], axis=1)
+    ul = np.einsum("eij,enj->eni", Q, u)
+    vl = np.einsum("eij,enj->eni", Q, v)
+    return L, ul, vl
+
+
+def _frame_samples(coord, Q, u, v, tolerance, turn=np.pi/16, limit=20, total=None):
+    """
+    Return the number of segments with which to draw each of the curves
+    of _hermite_cubics.
+
+    Curves are divided until the distance between each chord and the
+    curve is below ``tolerance``, and the tangent turns by at most
+    ``turn`` along a segment. Counts are clipped to ``limit``, and are
+    reduced uniformly when the curves would have more than ``total``
+    points altogether.
+    """
+    L, ul, vl = _local_ends(coord, Q, u, v)
+    Lnew = L + ul[:,1,0] - ul[:,0,0]
+    Lnew = np.where(Lnew > 0, Lnew, 1.0)
+
+    # Second derivatives of the plan and elevation cubics at each end;
+    # they vary linearly along the frame
+    tj_ti = ul[:,1,1:] - ul[:,0,1:]
+    ri = vl[:,0,[2,1]]*[1,-1]
+    rj = vl[:,1,[2,1]]*[1,-1]
+    d2i =  6*tj_ti/Lnew[:,None]**2 - (4*ri + 2*rj)/Lnew[:,None]
+    d2j = -6*tj_ti/Lnew[:,None]**2 + (2*ri + 4*rj)/Lnew[:,None]
+    curvature = np.maximum(np.linalg.norm(d2i, axis=1), np.linalg.norm(d2j, axis=1))
+
+    # A segment of length h deviates from the curve by at most curvature*h^2/8
+    n = np.ceil(Lnew*np.sqrt(curvature/(8*tolerance)))
+
+    # End rotations relative to the chord
+    chord = tj_ti/Lnew[:,None]
+    bend  = np.maximum(np.linalg.norm(ri - chord, axis=1), np.linalg.norm(rj - chord, axis=1))
+    n = np.maximum(n, np.ceil(bend/turn))
+    n = np.clip(n, 1, limit).astype(int)
+
+    if total is not None and np.sum(n+1) > total:
+        scale = max(total - 2*len(n), 0)/max(np.sum(n-1), 1)
+        n = 1 + np.floor((n-1)*scale).astype(int)
+
+    return n
+
+
+def _hermite_cubics(coord, Q, u, v, npoints: int = 10):
+    """
+    Batched form of _hermite_cubic.
+
+    Parameters
+    ----------
+    coord : (ne,2,3) array of end node coordinates
+    Q     : (ne,3,3) array of frame orientations
+    u     : (ne,2,3) array of end node displacements
+    v     : (ne,2,3) array of end node rotation vectors
+    npoints : int, or (ne,n) array of the parameters in [0,1] at which
+              each curve is sampled
+
+    Returns an (ne,npoints,3) array of points on the deformed curves.
+    """
+    L, ul, vl = _local_ends(coord, Q, u, v)
+    li, ti, vi = ul[:,0].T
+    lj, tj, vj = ul[:,1].T
+    si, ei, pi = vl[:,0].T
+    sj, ej, pj = vl[:,1].T
+
+    Lnew = (L + lj - li)[:,None]
+    if np.ndim(npoints) == 0:
+        xi = np.linspace(0.0, 1.0, npoints)[None,:]
+    else:
+        xi = np.asarray(npoints, dtype=float)
+    x    = Lnew*xi
+
+    # Hermite shape functions of _elastic_curve
+    N1 = 1.-3.*xi**2+2.*xi**3
+    N2 = Lnew*(xi-2.*xi**2+xi**3)
+    N3 = 3.*xi**2-2*xi**3
+    N4 = Lnew*(xi**3-xi**2)
+
+    plan = ti[:,None]*N1 + pi[:,None]*N2 + tj[:,None]*N3 + pj[:,None]*N4
+    elev = vi[:,None]*N1 - ei[:,None]*N2 + vj[:,None]*N3 - ej[:,None]*N4
+
+    local = np.stack([x + li[:,None], plan, elev], axis=2)
+    return np.einsum("eji,enj->eni", Q, local) + coord[:,:1]
+
+
 def _hermite_cubic(
         coord: Array,
         displ: Array = None,        #: Displacements
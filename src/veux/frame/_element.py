@@ -98,10 +98,7 @@ class _FrameElement:
         if self._xmodel is not None:
             self._gauss_sample_points = self._xmodel.eleResponse(self._tag, "integrationPoints")
 
-        self._gauss_sections = [
-            self._vmodel._frame_section(tag)
-            for tag in self._elem_data.get("sections", [])
-        ]    
+        self._gauss_sections = list(self._vmodel._frame_outlines.get(tag, []))
 
         # Simple samples
         if samples is not None:
@@ -121,14 +118,10 @@ class _FrameElement:
         if self._section_override is not None:
             return self._section_override
 
-        if self._section_source == "External":
-            return self._vmodel._frame_outlines[self._tag][sample.index]
-
-        elif self._section_source == "Internal":
-            return self._vmodel._frame_section(self._elem_data["sections"][sample.index])
-
-        else: 
-            return self._vmodel._frame_section(None)
+        # Sections are interned by the model, so elements with the
+        # same sections share one SectionGeometry
+        return self._vmodel.frame_section(self._tag,
+                                          self._simple_sample_points[sample.index])
 
 
     def simple_samples(self):
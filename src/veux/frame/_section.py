@@ -1,6 +1,26 @@
+import weakref
+import hashlib
 import numpy as np
 from veux.utility.earcut import earcut, flatten as flatten_earcut
 
+# Interned section geometries, keyed by their fingerprint; entries are
+# dropped once no model holds the section
+_SECTIONS = weakref.WeakValueDictionary()
+
+def _fingerprint(exterior, interior=None)->str:
+    """
+    Return a hash of the coordinates of a section outline and its holes.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for polygon in [exterior, *([] if interior is None else interior)]:
+        if polygon is None:
+            digest.update(b"none")
+            continue
+        polygon = np.ascontiguousarray(polygon, dtype=float)
+        digest.update(repr(polygon.shape).encode())
+        digest.update(polygon.tobytes())
+    return digest.hexdigest()
+
 def _clean_polygon(polygon, warping=None):
     """
     Remove duplicate points and collinear points from a polygon.
@@ -50,14 +70,57 @@ class SectionGeometry:
 
         self._interior = interior
         self._exterior = exterior
+        self._triangles = None
+        self._fingerprint = None
+
+    @classmethod
+    def intern(cls, exterior, interior=None)->"SectionGeometry":
+        """
+        Return the shared SectionGeometry with the given outline and holes,
+        creating it the first time it is requested. Interned sections
+        must not be modified, and their arrays are made read-only.
+        """
+        try:
+            key = _fingerprint(exterior, interior)
+        except (TypeError, ValueError):
+            # Ragged input; nothing to share
+            return cls(exterior, interior)
+
+        section = _SECTIONS.get(key)
+        if section is None:
+            section = cls(exterior, None if interior is None else list(interior))
+            section._fingerprint = key
+            for polygon in [section._exterior, *section._interior]:
+                if isinstance(polygon, np.ndarray):
+                    polygon.flags.writeable = False
+            _SECTIONS[key] = section
+
+        return section
+
+    @property
+    def fingerprint(self)->str:
+        if self._fingerprint is None:
+            self._fingerprint = _fingerprint(self._exterior, self._interior)
+        return self._fingerprint
 
     def triangles(self):
-        
+        if self._triangles is not None:
+            return self._triangles
+
         face_i = [self.exterior()[:,1:]] + [
             s[:,1:] for s in self.interior() if s is not None and len(s) > 0
         ]
 
-        return earcut(**flatten_earcut(face_i))
+        self._triangles = earcut(**flatten_earcut(face_i))
+        return self._triangles
+
+    def rings(self)->list:
+        """
+        Return the exterior outline followed by the holes that have points.
+        """
+        return [self._exterior] + [
+            s for s in self._interior if s is not None and len(s) > 0
+        ]
 
     def exterior(self, plane=False, close=False):
         if plane:
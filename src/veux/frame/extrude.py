@@ -25,8 +25,8 @@ class ExtrusionCollection:
     triang: list
     coords: list
     caps: list
-    no_outline: set
-    in_outline: set
+    edges: list         # (n,2) vertices of the side edges
+    outline: list       # mask of the ring-to-ring edges that are drawn as outlines
 
 def add_extrusion(extr, e, x, R, I, caps=None):
 
@@ -41,8 +41,7 @@ def add_extrusion(extr, e, x, R, I, caps=None):
     e.triang.extend([I + T for T in indices])
 
     for (j, start_idx, end_idx) in ring_ranges:
-        for i in range(start_idx, end_idx):
-            e.coords.append(x[j] + R[j] @ p[i])
+        e.coords.extend(x[j] + p[start_idx:end_idx]@np.transpose(R[j]))
 
     if caps:
         nen = len(x)
@@ -53,6 +52,95 @@ def add_extrusion(extr, e, x, R, I, caps=None):
     return len(p) #len(indices)
 
 
+def _ring_triangles(nen, noe):
+    """
+    Side triangles joining consecutive rings of ``noe`` vertices, in the
+    order produced by ``FrameMesh``.
+    """
+    j = np.arange(1, nen)[:,None]
+    k = np.arange(noe)[None,:]
+    kn = (k + 1)%noe
+    T = np.stack([
+        np.stack([noe*j + k,  noe*j + kn,     noe*(j-1) + k], axis=-1),
+        np.stack([noe*j + kn, noe*(j-1) + kn, noe*(j-1) + k], axis=-1),
+    ], axis=2)
+    return T.reshape(-1, 3)
+
+
+def _ring_edges(nen, noe):
+    """
+    Edges of rings of ``noe`` vertices; returns the ring-to-ring
+    (longitudinal) edges, and the edges within each ring (transverse).
+    """
+    j = np.arange(nen)[:,None]
+    k = np.arange(noe)[None,:]
+    kn = (k + 1)%noe
+    long = np.stack([noe*j[1:] + kn, noe*(j[1:]-1) + kn], axis=-1)
+    tran = np.stack([noe*j + k, noe*j + kn], axis=-1)
+    return long.reshape(-1, 2), tran.reshape(-1, 2)
+
+
+@dataclass
+class _SectionTemplate:
+    rings:  list            # (nen, noe, 3) local vertices of the exterior and of each hole
+    triang: np.ndarray      # side triangles, relative to the first vertex of an instance
+    caps:   np.ndarray      # front and back cap triangles, relative to the first vertex
+    edges:  np.ndarray      # side edges, relative to the first vertex
+    outline: np.ndarray     # mask of ring-to-ring edges that are outlines
+    size:   int             # number of vertices of an instance
+
+
+def _section_key(sections):
+    return tuple(s.fingerprint for s in sections)
+
+
+def _section_template(sections, scale)->_SectionTemplate:
+    """
+    Build the vertices and triangles that are shared by every frame
+    extruded through the same ``sections``.
+    """
+    nen = len(sections)
+    si  = sections[0]
+
+    # Exterior and holes, each through every section
+    outlines = list(zip(*(s.rings() for s in sections)))
+
+    rings, triang, icap, jcap = [], [], [], []
+    edges, silhouette = [], []
+    start = 0
+    for i, outline in enumerate(outlines):
+        P = np.array(outline, dtype=float)
+        P[...,1:] *= scale
+        noe = P.shape[1]
+        if noe < 2:
+            raise ValueError("Invalid cross-section")
+
+        rings.append(P)
+        triang.append(start + _ring_triangles(nen, noe))
+        icap.append(start + np.arange(noe))
+        jcap.append(start + (nen-1)*noe + np.arange(noe))
+
+        # Finely discretized exteriors are curved, and their ring-to-ring
+        # edges are not drawn
+        long, tran = _ring_edges(nen, noe)
+        edges.extend([start + long, start + tran])
+        silhouette.extend([np.full(len(long), i > 0 or noe <= 35), np.zeros(len(tran), dtype=bool)])
+        start += nen*noe
+
+    try:
+        face = np.asarray(si.triangles(), dtype=int)
+        caps = np.concatenate([np.concatenate(icap)[face],
+                               np.concatenate(jcap)[face]]).reshape(-1, 3)
+    except Exception as ex:
+        warnings.warn(f"Earcut failed with message: {ex}")
+        caps = np.zeros((0, 3), dtype=int)
+
+    return _SectionTemplate(rings, np.concatenate(triang), caps,
+                            np.concatenate(edges),
+                            np.concatenate(silhouette),
+                            start)
+
+
 def draw_extrusions3(model, canvas, state=None, config=None, Ra=None):
     if config is None:
         config = {"style": MeshStyle(color="gray")}
@@ -61,141 +149,113 @@ def draw_extrusions3(model, canvas, state=None, config=None, Ra=None):
 
     scale = config.get("scale", 1.0)
 
-    # 1) Build local geometry
+    # 1) Group frames by the sections they are extruded through
     #----------------------------------------------------------
-    I = 0
-    caps = []
-    e = ExtrusionCollection([], [], [], set(), set())
-    for tag in model.iter_cell_tags():
-        if not model.cell_matches(tag, "frame"):
+    tags = model.cell_tags("frame")
+    orientations = model.frame_orientations()
+    offsets, indices = model.cell_connectivity()
+
+    templates = {}
+    groups = {}         # key -> list of (position, frame row, cell row)
+    sizes  = []         # (vertices, triangles, caps, edges) of each instance
+    for i, tag in enumerate(tags.tolist()):
+        row = model["cell_index"][tag]
+        nen = int(offsets[row+1] - offsets[row])
+        if nen < 2:
             continue
 
-        R0 = model.frame_orientation(tag)
-        if R0 is None:
-            warnings.warn(f"Frame {tag} has no orientation")
+        sections = [model.frame_section(tag, j) for j in range(nen)]
+        if sections[0] is None or sections[-1] is None:
             continue
-        else:
-            R0 = R0.T
-
-        X_ref = np.array([
-            Ra@model.node_position(node) for node in model.cell_nodes(tag)
-        ])
-        nen = len(X_ref)
 
-        if state is not None:
-            x = np.array([
-                Ra@model.node_position(node, state=state) for node in model.cell_nodes(tag)
-            ])
-            # u = state.cell_array(tag, state.position)
-            # x = shps.curve.displace(X_ref, u, nen)
-            R = [Ra@Ri@R0 for Ri in state.cell_array(tag, state.rotation)]
-        else:
-            x = X_ref
-            R = [Ra@R0 for _ in range(nen)]
+        key = _section_key(sections)
+        if key not in templates:
+            try:
+                templates[key] = _section_template(sections, scale)
+            except ValueError as ex:
+                warnings.warn(f"Failed to extrude frame {tag}; {ex}")
+                templates[key] = None
 
-        sections = [model.frame_section(tag, i) for i in range(len(x))]
-        if sections[0] is None or sections[-1] is None:
+        template = templates[key]
+        if template is None:
             continue
 
-        icap, jcap = [], []
-        #
-        # Exterior
-        #
-        extr = FrameMesh(len(x),
-                        [s.exterior() for s in sections],
-                        scale=scale,
-                        do_end_caps=False)
-
-        ne = add_extrusion(extr, e, x, R, I, [icap, jcap])
-
-        si = sections[0]
-        if len(si.exterior()) > 35:
-            for i in range(ne):
-                e.no_outline.add(I+i)
-
-        #
-        # Interior
-        #
-        ni = 0
-        for i in range(len(si.interior())):
-            if si.interior()[i] is None or len(si.interior()[i]) == 0:
-                continue
-
-            extr = FrameMesh(len(x),
-                    [s.interior()[i] for s in sections],
-                    scale=scale,
-                    do_end_caps=False)
-        
-            nij = add_extrusion(extr, e, x, R, I+ne+ni, [icap, jcap])
-            for i in range(nij):
-                # e.no_outline.add(I+ne+ni+i)
-                e.in_outline.add(I+ne+ni+i)
-            ni += nij
-
-        I += ni + ne
-
-        #
-        # Caps
-        #
-        try:
-            face = si.triangles()
+        groups.setdefault(key, []).append((len(sizes), i, row))
+        sizes.append((template.size, len(template.triang), len(template.caps), len(template.edges)))
 
-        except Exception as ex:
-            warnings.warn(f"Earcut failed with message: {ex}")
-            continue
+    if len(sizes) == 0:
+        return
+
+    # Offsets of each instance into the vertex, triangle and cap buffers
+    sizes = np.array(sizes, dtype=np.int64)
+    start = np.zeros((len(sizes)+1, 4), dtype=np.int64)
+    np.cumsum(sizes, axis=0, out=start[1:])
+
+    coords = np.empty((start[-1,0], 3))
+    triang = np.empty((start[-1,1], 3), dtype=np.int64)
+    caps   = np.empty((start[-1,2], 3), dtype=np.int64)
+    edges  = np.empty((start[-1,3], 2), dtype=np.int64)
+    outline = np.empty(start[-1,3], dtype=bool)
+
+    # 2) Place every member of a group at once
+    #----------------------------------------------------------
+    X = model.node_position(state=state)
+    if state is not None:
+        Rn = np.asarray(model.node_rotation(state=state))
+
+    e = ExtrusionCollection(triang, coords, caps, edges, outline)
+    for key, members in groups.items():
+        template = templates[key]
+        order, frames, rows = map(np.array, zip(*members))
+        nen   = len(template.rings[0])
+        nodes = indices[offsets[rows][:,None] + np.arange(nen)]
+
+        x  = X[nodes]@Ra.T                              # (ne, nen, 3)
+        R0 = orientations[frames].transpose(0,2,1)      # (ne, 3, 3)
+        if state is not None:
+            R = np.einsum("ab,ejbc,ecd->ejad", Ra, Rn[nodes] if Rn.ndim == 3 else Rn[None,None], R0)
+            R = np.broadcast_to(R, (len(rows), nen, 3, 3))
+        else:
+            R = np.broadcast_to((Ra@R0)[:,None], (len(rows), nen, 3, 3))
+
+        I = start[order, 0]
+        coords[I[:,None] + np.arange(template.size)] = np.concatenate([
+            (x[:,:,None] + np.einsum("ejab,jkb->ejka", R, P)).reshape(len(rows), -1, 3)
+            for P in template.rings
+        ], axis=1)
 
-        iicap = [ i for j in icap for i in j ]
-        ijcap = [ i for j in jcap for i in j ]
-        caps.extend([
-            [iicap[i] for i in face],
-            [ijcap[i] for i in face]
-        ])
+        triang[start[order,1][:,None] + np.arange(len(template.triang))] = I[:,None,None] + template.triang
+        caps[start[order,2][:,None] + np.arange(len(template.caps))] = I[:,None,None] + template.caps
 
+        J = start[order,3][:,None] + np.arange(len(template.edges))
+        edges[J] = I[:,None,None] + template.edges
+        outline[J] = template.outline
 
     # Draw mesh
-    if e.coords:
-        mesh = canvas.plot_mesh(e.coords,
-                     [list(reversed(face)) for face in e.triang],
-                     style=config["style"])
+    mesh = canvas.plot_mesh(e.coords, e.triang[:,::-1], style=config["style"])
 
     # Draw caps
-    if len(caps) > 0:
-        for cap in caps:
-            try:
-                canvas.plot_mesh(mesh.vertices, cap, style=config["style"])
-            except Exception as ex:
-                print(ex)
+    if len(e.caps) > 0:
+        try:
+            canvas.plot_mesh(mesh.vertices, e.caps, style=config["style"])
+        except Exception as ex:
+            warnings.warn(f"Failed to draw end caps with message: {ex}")
 
     # Draw outlines
     if "outline" not in config:
         return
 
-    triang = e.triang
-    nan = np.array([0,0,0], dtype=float)*np.nan
-    IDX = np.array(((0,2),(0,1)))
-    coords = np.array(e.coords)
-    try:
-        if "tran" in config["outline"]:
-            tri_points = np.array([
-                coords[idx]  if (j+1)%3 else nan
-                for j,idx in enumerate(np.array(triang).reshape(-1))
-            ])
-
-        elif "long" in config["outline"]:
-            tri_points = np.array([
-                coords[i]  if j%2 else nan
-                for j,idx in enumerate(np.array(triang)) for i in idx[IDX[j%2]] if j not in e.no_outline
-            ])
-        else:
-            return
-
-        if len(tri_points):
-            canvas.plot_lines(tri_points,
-                        style=config["line_style"])
-    except Exception as ex:
-        warnings.warn(f"Failed to draw outline with message: {ex}")
+    if "tran" in config["outline"]:
+        # Edges of the rings and between rings
+        edges = e.edges
+    elif "long" in config["outline"]:
+        edges = e.edges[e.outline]
+    else:
         return
 
+    if len(edges):
+        canvas.plot_lines(e.coords, indices=edges, style=config["line_style"])
+
 class so3:
     @classmethod
     def exp(cls, vect):
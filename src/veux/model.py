@@ -37,6 +37,12 @@ class Model:
 
     def cell_matches(self, tag, type): ...
 
+    def cell_tags(self, type=None):
+        tags = list(self.iter_cell_tags())
+        if type is not None:
+            tags = [tag for tag in tags if self.cell_matches(tag, type)]
+        return np.array(tags)
+
     def cell_type(self, tag):       ... # line triangle quadrilateral 
 
     def cell_exterior(self, tag):   ...
@@ -55,6 +61,13 @@ class Model:
 
     def cell_triangles(self, tag):  ...
 
+    def cell_surface(self):
+        triangles = []
+        for tag in self.iter_cell_tags():
+            if not self.cell_matches(tag, "frame"):
+                triangles.extend(self.cell_triangles(tag))
+        return np.array(triangles)
+
 
 # Constants
 _EYE3 = np.eye(3)
@@ -97,6 +110,92 @@ def _is_solid(el):
     return "brick" in name or "tetra" in name
 
 
+# Faces of solid cells, ordered so that their normals point outwards
+# for the node numbering used by cell_triangles
+_TETRA_FACES = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+_BRICK_FACES = np.array([[0, 3, 2, 1], [0, 1, 5, 4], [0, 4, 7, 3],
+                         [6, 7, 4, 5], [6, 2, 3, 7], [6, 5, 1, 2]])
+
+
+def _surface_faces(faces, solid):
+    """
+    Given an (n,k) array of cell faces and a boolean array that marks faces
+    of solid cells, return the faces that bound the mesh. Solid faces shared
+    by two cells are interior and are dropped; the remaining faces that
+    repeat the same nodes are kept once.
+    """
+    if len(faces) == 0:
+        return faces
+
+    _, inverse = np.unique(np.sort(faces, axis=1), axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    shared  = np.bincount(inverse, weights=solid)
+
+    keep = ~solid | (shared[inverse] == 1)
+    _, first = np.unique(inverse[keep], return_index=True)
+    return faces[np.flatnonzero(keep)[np.sort(first)]]
+
+
+# Families of cells that can be queried with FrameModel.cell_matches
+_FAMILIES = ("frame", "prism", "truss", "plane", "solid")
+
+def _type_families(name:str)->dict:
+    el = {"type": name}
+    name = name.lower()
+    return {
+        "frame": _is_frame(el),
+        "prism": _is_frame(el) and ("prism" in name or "elastic" in name),
+        "truss": _is_truss(el),
+        "plane": _is_plane(el),
+        "solid": _is_solid(el),
+    }
+
+def _exterior_rule(name:str):
+    # How FrameModel.cell_exterior outlines cells of this type
+    name = name.lower()
+    if "frm" in name or "beamcol" in name:
+        return "all"
+    elif "quad" in name or "shell" in name and ("q" in name) or ("mitc" in name):
+        return "quad"
+    elif "tri" in name or "shell" in name and ("t" in name):
+        return "all"
+    elif "tetra" in name:
+        return "tetra"
+    elif "brick" in name or "hex" in name:
+        return "brick"
+
+def _triangle_rule(name:str):
+    # How FrameModel.cell_triangles triangulates cells of this type
+    if _is_frame({"type": name}):
+        return None
+    name = name.lower()
+    if "tri" in name or ("shell" in name and ("dkgt" in name)):
+        return "tri"
+    elif "quad" in name or ("shell" in name and ("q" in name) or ("mitc" in name)):
+        return "quad"
+    elif "tetra" in name:
+        return "tetra"
+    elif "brick" in name:
+        return "brick"
+
+def _cell_shape(name:str, nen:int):
+    """
+    Return the shape of a cell with ``nen`` nodes whose type is ``name``,
+    as one of ``line<n>``, ``tri<n>``, ``quad<n>``, ``tet<n>`` or ``hex<n>``,
+    or None if it is not known.
+    """
+    families = _type_families(name)
+    if families["frame"] or families["truss"]:
+        return f"line{nen}"
+    rule = _triangle_rule(name) or _exterior_rule(name)
+    if rule in {"tri", "quad"}:
+        return f"{rule}{nen}"
+    elif rule == "tetra":
+        return f"tet{nen}"
+    elif rule == "brick":
+        return f"hex{nen}"
+
+
 def _orient_frame(xi, xj, angle):
     """
     Calculate the coordinate transformation vector.
@@ -136,7 +235,63 @@ def _orient_frame(xi, xj, angle):
     return e3r / np.linalg.norm(e3r)
 
 
-def read_model(filename:str, shift=None, verbose=False)->dict:
+def _model_parser(filename):
+    """
+    Return the name of the parser used to read a model file, or None if
+    the model cannot be cached.
+    """
+    if not isinstance(filename, (str, Path)):
+        return None
+
+    suffix = Path(filename).suffix
+    if suffix == ".tcl":
+        # Scripts may read other files, which are not part of the key
+        return None
+    elif suffix in {".s2k", ".$2k", ".$br", ".b2k"}:
+        return "csi"
+    elif suffix == ".inp":
+        return "inp"
+    elif suffix == ".vtk":
+        return None
+    return "json"
+
+
+def read_model(filename:str, shift=None, verbose=False, cache=None)->dict:
+    """
+    Read a model file.
+
+    Parameters
+    ----------
+    filename : str, Path or file
+        Model file; ``.tcl``, CSI (``.s2k``, ``.b2k``), Abaqus (``.inp``),
+        ``.vtk`` or JSON.
+    cache : bool or dict, optional
+        If ``True``, parsed files are stored in an on-disk cache (see
+        :class:`veux.cache.ModelCache`) and later reads of the same file
+        are loaded from it. A dictionary with ``enabled``, ``directory`` and
+        ``max_size`` keys configures the cache. By default files are parsed
+        every time. Tcl scripts are never cached.
+    """
+    from veux.cache import open_cache
+    parser = _model_parser(filename)
+    store  = open_cache(cache)
+
+    if parser is None or store is None:
+        return _parse_model(filename, verbose=verbose)
+
+    key = store.key(filename, parser)
+    sam = store.load(key)
+    if sam is None:
+        sam = _parse_model(filename, verbose=verbose)
+        if isinstance(sam, dict):
+            store.store(key, sam)
+    return sam
+
+
+def _parse_model(filename, verbose=False)->dict:
+    if isinstance(filename, Path):
+        filename = str(filename)
+
     if isinstance(filename, str) and filename.endswith(".tcl"):
         import opensees.tcl
         try:
@@ -168,14 +323,9 @@ def read_model(filename:str, shift=None, verbose=False)->dict:
     elif isinstance(filename, str) and filename.endswith(".inp"):
         pass
 
-    try:
-        with open(filename,"r") as f:
-            sam = json.loads(f.read())
-
-    except TypeError:
-        sam = json.loads(filename.read())
-
-    return sam
+    # JSON models are read incrementally
+    from veux.utility.stream import read_model as read_json
+    return read_json(filename)
 
 
 def read_state(res_file,
@@ -370,10 +520,14 @@ class FrameModel:
 
         #
         self._data = _from_opensees(sam, shift, R)# output
+        # Positions are handed out as views of the shared coordinate array
+        self._data["coord"].flags.writeable = False
 
         self.ndm = self._data["ndm"]
         self.ndf = self._data["ndf"]
 
+        self._classify_cells()
+
         #
         # Section data
         #
@@ -387,23 +541,23 @@ class FrameModel:
                     self._frame_outlines[key] = polygons
                 elif hasattr(polygons[0][0], "__len__"):
                     # list of numpy arrays
-                    self._frame_outlines[key] = [SectionGeometry(i) for i in polygons]
+                    self._frame_outlines[key] = [SectionGeometry.intern(i) for i in polygons]
                 else:
-                    self._frame_outlines[key] = [SectionGeometry(polygons)]
+                    self._frame_outlines[key] = [SectionGeometry.intern(polygons)]
 
         elif frame_outlines is None and "extrude_outline" not in kwds:
             # TODO: Make this dict of list of sections
-            self._frame_outlines = _get_frame_outlines(self)
+            self._frame_outlines = _get_frame_outlines(self, kwds.get("cache", None))
 
-        self._extrude_default = SectionGeometry(_OUTLINES[kwds.get("extrude_default", "square")])
+        self._extrude_default = SectionGeometry.intern(_OUTLINES[kwds.get("extrude_default", "square")])
         if "extrude_outline" in kwds:
             if hasattr(kwds["extrude_outline"], "exterior"):
                 self._extrude_outline = SectionGeometry(
                                           exterior=kwds["extrude_outline"].exterior(),
-                                          interior=kwds["extrude_outline"].interior(),
+                                          interior=list(kwds["extrude_outline"].interior()),
                                           warping=kwds.get("section_warping", None))
             elif isinstance(kwds["extrude_outline"], str):
-                self._extrude_outline = SectionGeometry(_OUTLINES[kwds["extrude_outline"]])
+                self._extrude_outline = SectionGeometry.intern(_OUTLINES[kwds["extrude_outline"]])
             else:
                 raise ValueError("extrude_outline must be a SectionGeometry or a string")
         else:
@@ -452,6 +606,50 @@ class FrameModel:
         else:
             return state
 
+    def _classify_cells(self):
+        # Classify every cell once from its type code and number of nodes;
+        # see cell_matches, cell_tags and cell_shape
+        names = self["type_names"]
+        codes = self["cell_types"]
+        sizes = np.diff(self["cell_offsets"])
+
+        families = [_type_families(name) for name in names]
+        self._cell_families = {
+            family: np.array([f[family] for f in families], dtype=bool)[codes]
+            for family in _FAMILIES
+        }
+        self._cell_rules = [
+            (_exterior_rule(name), _triangle_rule(name)) for name in names
+        ]
+
+        shapes = {}
+        for code, nen in set(zip(codes.tolist(), sizes.tolist())):
+            shapes[code, nen] = _cell_shape(names[code], nen)
+        self._cell_shapes = [shapes[key] for key in zip(codes.tolist(), sizes.tolist())]
+
+        tags = np.array(self["cell_tags"])
+        self._family_tags = {
+            family: tags[mask] for family, mask in self._cell_families.items()
+        }
+        self._family_tags[None] = tags
+
+    def cell_tags(self, type=None)->np.ndarray:
+        """
+        Return an array with the tags of all cells in the family ``type``
+        (one of ``"frame"``, ``"prism"``, ``"truss"``, ``"plane"`` or
+        ``"solid"``), or of all cells if ``type`` is None.
+        """
+        if type not in self._family_tags:
+            return self._family_tags[None][:0]
+        return self._family_tags[type]
+
+    def cell_shape(self, tag)->str:
+        """
+        Return the shape of a cell, e.g. ``"line2"``, ``"tri3"``, ``"quad4"``,
+        ``"tet4"`` or ``"hex8"``, or None if it is not known.
+        """
+        return self._cell_shapes[self["cell_index"][tag]]
+
     def cell_nodes(self, tag=None):
         if tag is None:
             if not hasattr(self, "_cell_nodes"):
@@ -461,16 +659,27 @@ class FrameModel:
             return self["assembly"][tag]["nodes"]
 
     def cell_indices(self, tag=None):
+        if tag is not None:
+            i = self["cell_index"][tag]
+            offsets = self["cell_offsets"]
+            return tuple(self["connectivity"][offsets[i]:offsets[i+1]].tolist())
+
         if not hasattr(self, "_cell_indices"):
+            offsets = self["cell_offsets"].tolist()
+            indices = self["connectivity"].tolist()
             self._cell_indices = {
-                elem["name"]: tuple(self.node_indices(n) for n in elem["nodes"])
-                for elem in self["assembly"].values()
+                tag: tuple(indices[offsets[i]:offsets[i+1]])
+                for tag, i in self["cell_index"].items()
             }
+        return self._cell_indices
 
-        if tag is not None:
-            return self._cell_indices[tag]
-        else:
-            return self._cell_indices
+    def cell_connectivity(self)->tuple:
+        """
+        Return the connectivity of all cells in compressed sparse row form,
+        as a pair ``(offsets, indices)`` such that the node indices of the cell
+        in row ``i`` of ``cell_index`` are ``indices[offsets[i]:offsets[i+1]]``.
+        """
+        return self["cell_offsets"], self["connectivity"]
 
     def cell_properties(self, tag=None):
         if tag is not None:
@@ -481,24 +690,31 @@ class FrameModel:
                         "crd", "crdTransformation"}
 
         if not self["prototypes"]:
-            elem_types = defaultdict(dict)
-
-            for elem in self["assembly"].values():
-                if not self.cell_matches(elem["name"], "frame"):
-                    continue
+            # Group frames that share their properties, sections, materials
+            # and transformation
+            from veux.utility.consolidate import group_elements
+            properties = self["sam"].get("properties", {})
+            groups = group_elements((self["assembly"][tag] for tag in self.cell_tags("frame")),
+                                    sections=self["sections"].values(),
+                                    materials=properties.get("uniaxialMaterials", []),
+                                    transforms=properties.get("crdTransformations", []))
+
+            count = defaultdict(int)
+            for instances in groups.values():
+                count[self["assembly"][instances[0]]["type"]] += 1
+
+            elem_types = []
+            for instances in groups.values():
+                elem = self["assembly"][instances[0]]
                 type = elem["type"]
-                if type not in elem_types:
-                    elem_types[type]["name"] = type
-                    elem_types[type]["variants"] = []
-                    elem_types[type]["instances"] = [elem["name"]]
-                    elem_types[type]["properties"] = {
+                elem_types.append({
+                    "name": type if count[type] == 1 else f"{type}<{elem['name']}>",
+                    "variants": [],
+                    "instances": instances,
+                    "properties": {
                         k: v for k,v in elem.items() if k not in exclude_keys
                     }
-                else:
-                    elem_types[type]["instances"].append(elem["name"])
-
-
-            elem_types = list(elem_types.values())
+                })
         else:
             elem_types = [
                 {
@@ -527,11 +743,9 @@ class FrameModel:
         return self["nodes"][tag]
 
     def node_indices(self, tag=None):
-        if not hasattr(self, "_node_indices"):
-            self._node_indices = {
-                tag: i for i, tag in enumerate(self["nodes"])
-            }
-        return self._node_indices[tag]
+        if tag is None:
+            return self["node_index"]
+        return self["node_index"][tag]
 
     def node_rotation(self, tag=None, state=None):
         if self.ndm == self.ndf:
@@ -550,9 +764,9 @@ class FrameModel:
     def node_position(self, tag=None, state=None):
 
         if tag is None:
-            pos = np.array([n["crd"] for n in self["nodes"].values()])
+            pos = self["coord"]
         else:
-            pos = self["nodes"][tag]["crd"]
+            pos = self["coord"][self["node_index"][tag]]
 
         if state is not None:
             pos = pos + state.node_array(tag, dof=state.position)
@@ -560,36 +774,31 @@ class FrameModel:
         return pos
 
     def cell_matches(self, tag, type=None)->bool:
-        elem = self["assembly"][tag]
-
-        if type == "prism":
-            return _is_frame(elem) and (
-                "prism" in elem["type"].lower()
-                or "elastic" in elem["type"].lower()
-            )
-        if type == "frame":
-            return _is_frame(elem)
-        
-        if type == "truss":
-            return _is_truss(elem)
-
-        if type == "plane":
-            return _is_plane(elem)
-        
-        if type == "solid":
-            return _is_solid(elem) 
-
-        return False
+        if type not in self._cell_families:
+            return False
+        return bool(self._cell_families[type][self["cell_index"][tag]])
 
     def cell_position(self, tag, state=None):
+        if state is not None:
+            if isinstance(tag, list):
+                return np.array([[
+                        self.node_position(node, state) for node in self["assembly"][t]["nodes"]
+                    ] for t in tag
+                ])
+            else:
+                return np.array([ self.node_position(node, state)
+                                  for node in self["assembly"][tag]["nodes"] ])
+
+        offsets, indices = self.cell_connectivity()
         if isinstance(tag, list):
-            return np.array([[
-                    self.node_position(node, state) for node in self["assembly"][t]["nodes"]
-                ] for t in tag
-            ])
-        else:
-            return np.array([ self.node_position(node, state)
-                              for node in self["assembly"][tag]["nodes"] ])
+            rows  = np.array([self["cell_index"][t] for t in tag], dtype=np.int64)
+            sizes = offsets[rows+1] - offsets[rows]
+            if len(rows) and np.all(sizes == sizes[0]):
+                return self["coord"][indices[offsets[rows][:,None] + np.arange(sizes[0])]]
+            return np.array([self.cell_position(t) for t in tag])
+
+        i = self["cell_index"][tag]
+        return self["coord"][indices[offsets[i]:offsets[i+1]]]
 
 
     def cell_exterior(self, tag):
@@ -598,25 +807,19 @@ class FrameModel:
         This is related to finding an Eulerian path through the element's
         connectivity graph.
         """
-        type = self["assembly"][tag]["type"].lower()
+        rule, _ = self._cell_rules[self["cell_types"][self["cell_index"][tag]]]
 
-        if "frm" in type or "beamcol" in type:
+        if rule == "all":
             return self.cell_indices(tag)
 
-        elif ("quad" in type or \
-              "shell" in type and ("q" in type) or ("mitc" in type)):
+        elif rule == "quad":
             return self.cell_indices(tag)[:4]
 
-
-        elif ("tri" in type or \
-              "shell" in type and ("t" in type)):
-            return self.cell_indices(tag)
-
-        elif "tetra" in type:
+        elif rule == "tetra":
             indices = self.cell_indices(tag)
             return [indices[i] for i in [0, 1, 2, 3, 0, 2, 3, 1]]
 
-        elif "brick" in type or "hex" in type:
+        elif rule == "brick":
             i = self.cell_indices(tag)
             if len(i) == 8:
                 return [
@@ -647,17 +850,15 @@ class FrameModel:
     def cell_triangles(self, tag):
         """
         """
-        type = self["assembly"][tag]["type"].lower()
+        _, rule = self._cell_rules[self["cell_types"][self["cell_index"][tag]]]
 
-        if self.cell_matches(tag, "frame"):
+        if rule is None:
             return []
 
-        elif ("tri" in type or
-             ("shell" in type and ("dkgt" in type))):
+        elif rule == "tri":
             return [self.cell_indices(tag)]
 
-        elif ("quad" in type or
-             ("shell" in type and ("q" in type) or ("mitc" in type))):
+        elif rule == "quad":
             nodes = self.cell_indices(tag)
 
             if len(nodes) == 3:
@@ -667,14 +868,14 @@ class FrameModel:
                 return [[nodes[0], nodes[1], nodes[2]],
                         [nodes[2], nodes[3], nodes[0]]]
 
-        elif "tetra" in type:
+        elif rule == "tetra":
             nodes = self.cell_indices(tag)
             return [[nodes[0], nodes[2], nodes[1]],
                     [nodes[0], nodes[1], nodes[3]],
                     [nodes[0], nodes[3], nodes[2]],
                     [nodes[1], nodes[2], nodes[3]]]
 
-        elif "brick" in type:
+        elif rule == "brick":
             nodes = self.cell_indices(tag)
 
             if len(nodes) == 8:
@@ -689,6 +890,52 @@ class FrameModel:
 
         return []
 
+    def cell_surface(self)->np.ndarray:
+        """
+        Return an (n,3) array with the node indices of the triangles that
+        bound the plane and solid cells of the model.
+
+        All faces are built at once for each kind of cell, and faces are
+        matched by their sorted node indices, so that faces between two solid
+        cells and coincident plane cells are not drawn.
+        """
+        offsets, indices = self.cell_connectivity()
+        sizes = np.diff(offsets)
+        rules = np.array([rule for _, rule in self._cell_rules], dtype=object)[self["cell_types"]] \
+                if len(sizes) else np.array([], dtype=object)
+
+        def nodes(rows, n):
+            return indices[offsets[rows][:,None] + np.arange(n)]
+
+        # Faces with 3 and 4 nodes, and whether they belong to solids
+        faces = {3: [], 4: []}
+        solid = {3: [], 4: []}
+        for rule, nen in set(zip(rules.tolist(), sizes.tolist())):
+            rows = np.flatnonzero((rules == rule) & (sizes == nen))
+            if rule == "tri" or (rule == "quad" and nen == 3):
+                faces[3].append(nodes(rows, 3))
+                solid[3].append(np.zeros(len(rows), dtype=bool))
+            elif rule == "quad" and nen in {4, 8, 9}:
+                faces[4].append(nodes(rows, 4))
+                solid[4].append(np.zeros(len(rows), dtype=bool))
+            elif rule == "tetra" and nen >= 4:
+                faces[3].append(nodes(rows, 4)[:,_TETRA_FACES].reshape(-1, 3))
+                solid[3].append(np.ones(4*len(rows), dtype=bool))
+            elif rule == "brick" and nen == 8:
+                faces[4].append(nodes(rows, 8)[:,_BRICK_FACES].reshape(-1, 4))
+                solid[4].append(np.ones(6*len(rows), dtype=bool))
+
+        triangles = []
+        if faces[3]:
+            triangles.append(_surface_faces(np.concatenate(faces[3]), np.concatenate(solid[3])))
+        if faces[4]:
+            quads = _surface_faces(np.concatenate(faces[4]), np.concatenate(solid[4]))
+            triangles.append(quads[:,[0, 1, 2, 2, 3, 0]].reshape(-1, 3))
+
+        if not triangles:
+            return np.empty((0, 3), dtype=indices.dtype)
+        return np.concatenate(triangles)
+
     def _section_area(self, tag, i):
         # TODO
         return 1
@@ -707,7 +954,7 @@ class FrameModel:
         if self.cell_matches(tag, "truss"):
             A = self["assembly"][tag].get("A", 1.0)
             o = np.sqrt(A)*np.array([[0,-1,-1],[0,1,-1],[0,1,1],[0,-1,1]], dtype=float)
-            return SectionGeometry(o)
+            return SectionGeometry.intern(o)
 
         if not self.cell_matches(tag, "frame"):
             return None
@@ -720,7 +967,7 @@ class FrameModel:
         sections = []
         if self._extrude_outline is not None:
             sections = [
-                SectionGeometry(self._extrude_outline.exterior()*self._section_area(tag, 0)),
+                SectionGeometry.intern(self._extrude_outline.exterior()*self._section_area(tag, 0)),
             ]*2 #*self._extrude_scale
 
         elif tag in self._frame_outlines:
@@ -734,14 +981,14 @@ class FrameModel:
             # print(f"Empty sections for {tag}", file=sys.stderr)
             return
 
-        elif len(sections) == 1:
+        elif len(sections) == 1 or all(s is sections[0] for s in sections):
             return sections[0]
 
         # Interpolate coord
         elif len(sections) >= 2:
             def interpolate(values, x):
                 n = len(values) - 1
-                idx = np.clip(int(x * n), 0, n - 1)  # Find the lower bound index
+                idx = min(max(int(x * n), 0), n - 1)  # Find the lower bound index
                 t = x * n - idx  # Fractional part for interpolation
                 return (1 - t) * values[idx] + t * values[idx + 1]
 
@@ -750,38 +997,81 @@ class FrameModel:
 
             exterior = np.array([s.exterior() for s in sections])
             interior = np.array([s.interior() for s in sections])
-            return SectionGeometry(
+            return SectionGeometry.intern(
                 interpolate(exterior, coord),
                 interpolate(interior, coord)
             )
 
 
-    def frame_orientation(self, tag, state=None):
-        el  = self["assembly"][tag]
-        xyz = el["crd"]
-
-        v1  = xyz[-1] - xyz[0]
-        L   = np.linalg.norm(v1)
-        e1  = v1/L
-
-        if self.ndm == 2:
-            v2 = -np.cross(e1, np.array([0, 0, 1]))
-
-        if "yvec" in el["trsfm"] and el["trsfm"]["yvec"] is not None:
-            v2  = np.array(el["trsfm"]["yvec"])
-
-        elif "vecxz" in el["trsfm"]:
-            v13 =  np.atleast_1d(el["trsfm"]["vecxz"])
-            v2  = -np.cross(e1,v13)
+    def _frame_basis(self, rows)->np.ndarray:
+        """
+        Return an (n,3,3) array with the local axes ``[e1, e2, e3]`` of the
+        cells in ``rows`` of the cell index.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        offsets, indices = self.cell_connectivity()
+        coord = self["coord"]
+        xi = coord[indices[offsets[rows]]]
+        xj = coord[indices[offsets[rows]+1]]
+        v1 = coord[indices[offsets[rows+1]-1]] - xi
+        e1 = v1/np.linalg.norm(v1, axis=1)[:,None]
+
+        # Group the cells by the kind of their coordinate transformation
+        v2 = np.empty_like(e1)
+        yvec  = []
+        vecxz = []
+        for i, row in enumerate(rows.tolist()):
+            trsfm = self["assembly"][self["cell_tags"][row]]["trsfm"] or {}
+            if trsfm.get("yvec", None) is not None:
+                yvec.append(i)
+                v2[i] = trsfm["yvec"]
+            elif "vecxz" in trsfm:
+                vecxz.append(i)
+                v2[i] = np.atleast_1d(trsfm["vecxz"])
+
+        if vecxz:
+            v2[vecxz] = -np.cross(e1[vecxz], v2[vecxz])
+
+        default = np.ones(len(rows), dtype=bool)
+        default[yvec]  = False
+        default[vecxz] = False
+        if np.any(default):
+            # Vectorized _orient_frame with no rotation about the local axis
+            dx = xj[default] - xi[default]
+            e2 = np.cross([0, 0, 1], dx)
+            e2[(dx[:,0] == 0) & (dx[:,1] == 0)] = [1, 0, 0]
+            v3 = np.cross(dx, e2)
+            v3 = v3/np.linalg.norm(v3, axis=1)[:,None]
+            v2[default] = -np.cross(e1[default], v3)
+
+        e2 = v2/np.linalg.norm(v2, axis=1)[:,None]
+        v3 = np.cross(e1, e2)
+        e3 = v3/np.linalg.norm(v3, axis=1)[:,None]
+        return np.stack([e1, e2, e3], axis=1)
+
+    def frame_orientations(self)->np.ndarray:
+        """
+        Return an (ne,3,3) array with the orientation of every frame cell,
+        in the order of ``cell_tags("frame")``. The result is computed once
+        and cached on the model.
+        """
+        if not hasattr(self, "_frame_orientations"):
+            tags = self.cell_tags("frame")
+            self._frame_rows = {tag: i for i, tag in enumerate(tags.tolist())}
+            rows = [self["cell_index"][tag] for tag in tags.tolist()]
+            self._frame_orientations = self._frame_basis(rows)
+            self._frame_orientations.flags.writeable = False
+        return self._frame_orientations
 
-        else:
-            v3 = _orient_frame(el["crd"][0], el["crd"][1], 0)
-            v2  = -np.cross(e1,v3)
+    def frame_orientation(self, tag, state=None):
+        orientations = self.frame_orientations()
+        if tag in self._frame_rows:
+            return orientations[self._frame_rows[tag]]
+        return self._frame_basis([self["cell_index"][tag]])[0]
 
-        e2 = v2 / np.linalg.norm(v2)
-        v3 = np.cross(e1,e2)
-        e3 = v3 / np.linalg.norm(v3)
-        return np.stack([e1,e2,e3])
+    def frame_element(self, tag, **kwds):
+        from .frame._element import _FrameElement
+        return _FrameElement(tag, self, **kwds)
 
 
 class FiberModel(Model):
@@ -829,18 +1119,32 @@ def _from_opensees(sam: dict, shift, R):
 
     geom = sam.get("geometry", sam.get("assembly"))
 
-    try:
-        #coord = np.array([R@n.pop("crd") for n in geom["nodes"]], dtype=float) + shift
-        coord = np.array([R@n["crd"] for n in geom["nodes"]], dtype=float) + R@shift
-        ndm = 3
-    except:
-        coord = np.array([R@[*n["crd"], 0.0] for n in geom["nodes"]], dtype=float) + shift
-        ndm = 2
+    # Arrays gathered while the model was read (see veux.utility.stream)
+    columns = geom.get("columns", {})
 
+    if "coord" in columns and np.shape(columns["coord"])[1] in {2, 3}:
+        coord = np.asarray(columns["coord"], dtype=float)
+        if coord.shape[1] == 3:
+            coord = coord@R.T + R@shift
+            ndm = 3
+        else:
+            coord = np.pad(coord, ((0,0), (0,1)))@R.T + shift
+            ndm = 2
+    else:
+        try:
+            #coord = np.array([R@n.pop("crd") for n in geom["nodes"]], dtype=float) + shift
+            coord = np.array([R@n["crd"] for n in geom["nodes"]], dtype=float) + R@shift
+            ndm = 3
+        except:
+            coord = np.array([R@[*n["crd"], 0.0] for n in geom["nodes"]], dtype=float) + shift
+            ndm = 2
+
+    # Records are copied so that the caller's model is left untouched
     nodes = {
         n["name"]: {**n, "crd": coord[i], "idx": i}
             for i,n in enumerate(geom["nodes"])
     }
+    node_index = {n["name"]: i for i,n in enumerate(geom["nodes"])}
 
 #   ndm = len(next(iter(nodes.values()))["crd"])
     ndf = next(iter(nodes.values())).get("ndf", None)
@@ -863,12 +1167,28 @@ def _from_opensees(sam: dict, shift, R):
         if "yvec" in e:
             return dict(yvec=R@e["yvec"])
 
+    # Columnar connectivity in CSR form; the nodes of the i-th element are
+    # connectivity[offsets[i]:offsets[i+1]]
+    if "connectivity" in columns:
+        offsets = np.asarray(columns["offsets"], dtype=np.int64)
+        connectivity = np.asarray(columns["connectivity"], dtype=np.int64)
+    else:
+        offsets = np.zeros(len(geom["elements"])+1, dtype=np.int64)
+        np.cumsum([len(e["nodes"]) for e in geom["elements"]], out=offsets[1:])
+        connectivity = np.fromiter((node_index[n] for e in geom["elements"] for n in e["nodes"]),
+                                   dtype=np.int64, count=offsets[-1])
+
+    type_names, cell_types = np.unique([e["type"] for e in geom["elements"]] or [""],
+                                       return_inverse=True)
+
+    # Element coordinates are views into one gathered array
+    cell_crd = coord[connectivity]
     elems =  {
         e["name"]: dict(
             **e,
-            crd=np.array([nodes[n]["crd"] for n in e["nodes"]], dtype=float),
+            crd=cell_crd[offsets[i]:offsets[i+1]],
             trsfm=_make_transform(e) 
-        ) for e in geom["elements"]
+        ) for i,e in enumerate(geom["elements"])
     }
 
     try:
@@ -878,6 +1198,14 @@ def _from_opensees(sam: dict, shift, R):
 
     output = dict(nodes=nodes,
                   assembly=elems,
+                  coord=coord,
+                  node_index=node_index,
+                  cell_index={e["name"]: i for i,e in enumerate(geom["elements"])},
+                  cell_tags=[e["name"] for e in geom["elements"]],
+                  cell_offsets=offsets,
+                  connectivity=connectivity,
+                  cell_types=cell_types[:len(geom["elements"])].astype(np.int32),
+                  type_names=[str(t) for t in type_names],
                   sam=sam,
                   sections=sections,
                   prototypes=sam.get("prototypes", {}),
@@ -891,14 +1219,49 @@ def _from_opensees(sam: dict, shift, R):
 def collect_outlines(model):
     return _get_frame_outlines(_from_opensees(model, [0, 0, 0], np.eye(3)))
 
-def _add_section_shape(section, sections, outlines, ndm):
+# Outlines of fiber sections, keyed by a hash of the fiber coordinates
+_FIBER_OUTLINES = {}
+
+def _fiber_outline(points, store=None):
+    """
+    Return the outline of a fiber section. Outlines are memoized by a hash
+    of the fiber coordinates in memory and, when ``store`` (a
+    veux.cache.ModelCache) is given, on disk.
+    """
+    import hashlib
+    points = np.ascontiguousarray(points, dtype=float)
+    digest = hashlib.blake2b(repr(points.shape).encode(), digest_size=20)
+    digest.update(points.tobytes())
+    key = f"outline-{digest.hexdigest()}"
+
+    if key in _FIBER_OUTLINES:
+        return _FIBER_OUTLINES[key]
+
+    outline = store.load_array(key) if store is not None else None
+    if outline is None:
+        try:
+            from veux.utility.alpha_shape import alpha_shape
+            outline = alpha_shape(points, bound_ratio=0.0025) #0.01) #0.03)#0.01)
+        except Exception as e: #scipy.spatial._qhull.QhullError as e:
+            warnings.warn("Failed to compute alpha shape")
+            import scipy.spatial
+            outline = points[scipy.spatial.ConvexHull(points).vertices]
+
+        if store is not None:
+            store.store_array(key, outline)
+
+    _FIBER_OUTLINES[key] = outline
+    return outline
+
+
+def _add_section_shape(section, sections, outlines, ndm, store=None):
 
     tag = int(section["name"])
     if "section" in section:
         # Treat aggregated sections
         child_tag = int(section["section"])
         if child_tag not in outlines:
-            _add_section_shape(sections[section["section"]], sections, outlines, ndm)
+            _add_section_shape(sections[section["section"]], sections, outlines, ndm, store)
 
         outlines[tag] = outlines[child_tag]
 
@@ -913,14 +1276,7 @@ def _add_section_shape(section, sections, outlines, ndm):
             points = np.array([
                 f.get("coord", None) or f["location"] for f in section["fibers"]
             ])
-            try:
-                from veux.utility.alpha_shape import alpha_shape
-                alpha = alpha_shape(points, bound_ratio=0.0025) #0.01) #0.03)#0.01)
-                outlines[tag] =  alpha
-            except Exception as e: #scipy.spatial._qhull.QhullError as e:
-                warnings.warn("Failed to compute alpha shape")
-                import scipy.spatial
-                outlines[tag] = points[scipy.spatial.ConvexHull(points).vertices]
+            outlines[tag] = _fiber_outline(points, store)
 
         except Exception as e:
             warnings.warn("Failed to find section shape")
@@ -928,10 +1284,13 @@ def _add_section_shape(section, sections, outlines, ndm):
 
 
 
-def _get_frame_outlines(model):
+def _get_frame_outlines(model, cache=None):
+    from veux.cache import open_cache
+    store = open_cache(cache)
+
     section_outlines = {}
     for name,section in model["sections"].items():
-        _add_section_shape(section, model["sections"], section_outlines, model.ndm)
+        _add_section_shape(section, model["sections"], section_outlines, model.ndm, store)
 
 
     # Function to check if list of lists is homogeneous
@@ -947,7 +1306,7 @@ def _get_frame_outlines(model):
     for elem in model["assembly"].values():
         if "sections" in elem:
             outlines[elem["name"]] = [
-                SectionGeometry(section_outlines[int(i)]) for i in elem["sections"]
+                SectionGeometry.intern(section_outlines[int(i)]) for i in elem["sections"]
                 if i in section_outlines and section_outlines[i] is not None
             ]
             continue
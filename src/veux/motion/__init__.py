@@ -39,13 +39,10 @@ def _create_mesh(canvas,
     weights_0 = np.array(weights_0, dtype=canvas.float_t)
     indices   = np.array(indices,   dtype=canvas.index_t).reshape(-1)
 
-    jnt_bytes = joints_0.tobytes()
-    wts_bytes = weights_0.tobytes()
-
     # Accessors
     positions = np.array(positions, dtype=canvas.float_t)
-    ver_accessor = _append_index(gltf.accessors, pygltflib.Accessor(
-        bufferView=canvas._push_data(positions.tobytes(), pygltflib.ARRAY_BUFFER),
+    ver_accessor = canvas._add_accessor(pygltflib.Accessor(
+        bufferView=canvas._push_data(positions, pygltflib.ARRAY_BUFFER),
         componentType=GLTF_T[canvas.float_t],
         count=len(positions),
         type="VEC3",
@@ -54,30 +51,30 @@ def _create_mesh(canvas,
     ))
 
     texcoords = np.array(texcoords, dtype=canvas.float_t)
-    tex_accessor = _append_index(gltf.accessors, pygltflib.Accessor(
-        bufferView=canvas._push_data(texcoords.tobytes(), pygltflib.ARRAY_BUFFER),
+    tex_accessor = canvas._add_accessor(pygltflib.Accessor(
+        bufferView=canvas._push_data(texcoords, pygltflib.ARRAY_BUFFER),
         componentType=GLTF_T[canvas.float_t],
         count=len(texcoords),
         type="VEC2"
     ))
 
-    jnt_accessor = _append_index(gltf.accessors, pygltflib.Accessor(
-        bufferView=canvas._push_data(jnt_bytes, pygltflib.ARRAY_BUFFER),
+    jnt_accessor = canvas._add_accessor(pygltflib.Accessor(
+        bufferView=canvas._push_data(joints_0, pygltflib.ARRAY_BUFFER),
         componentType=GLTF_T[canvas.index_t],
         count=len(joints_0),
         type="VEC4"
     ))
 
-    wts_accessor = _append_index(gltf.accessors, pygltflib.Accessor(
-        bufferView=canvas._push_data(wts_bytes, pygltflib.ARRAY_BUFFER),
+    wts_accessor = canvas._add_accessor(pygltflib.Accessor(
+        bufferView=canvas._push_data(weights_0, pygltflib.ARRAY_BUFFER),
         componentType=GLTF_T[canvas.float_t],
         count=len(weights_0),
         type="VEC4"
     ))
 
 
-    idx_accessor = _append_index(gltf.accessors, pygltflib.Accessor(
-        bufferView=canvas._push_data(indices.tobytes(), pygltflib.ELEMENT_ARRAY_BUFFER),
+    idx_accessor = canvas._add_accessor(pygltflib.Accessor(
+        bufferView=canvas._push_data(indices, pygltflib.ELEMENT_ARRAY_BUFFER),
         componentType=GLTF_T[canvas.index_t],
         count=len(indices),
         type="SCALAR",
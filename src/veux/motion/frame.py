@@ -73,7 +73,7 @@ def skin_frames(model, artist, config=None, interpolate=None):
     I = 0
     joints_0    = []
     weights_0   = []
-    e = ExtrusionCollection([], [], [], set(), set())
+    e = ExtrusionCollection([], [], [], [], [])
     for tag in model.iter_cell_tags():
         if not model.cell_matches(tag, "frame") and not model.cell_matches(tag, "truss"):
             continue
@@ -281,8 +281,8 @@ def _create_skin(canvas, ibms, joint_nodes, skeleton):
 
     # Create accessor to inverse bind matrices and skin
     skin = pygltflib.Skin(
-        inverseBindMatrices=_append_index(gltf.accessors, pygltflib.Accessor(
-            bufferView=canvas._push_data(ibm_array.tobytes(), target=None),
+        inverseBindMatrices=canvas._add_accessor(pygltflib.Accessor(
+            bufferView=canvas._push_data(ibm_array, target=None),
             componentType=GLTF_T[canvas.float_t],
             count=len(ibms),
             type="MAT4"
@@ -594,8 +594,8 @@ class Motion:
         #    Create BufferViews and Accessors, then set up each sampler's input/output
         #    to reference the newly created accessor indices.
         for sampler in anim.samplers:
-            time_accessor_idx = _append_index(gltf.accessors, pygltflib.Accessor(
-                bufferView=canvas._push_data(sampler.extras["times_array"].tobytes()),
+            time_accessor_idx = canvas._add_accessor(pygltflib.Accessor(
+                bufferView=canvas._push_data(sampler.extras["times_array"]),
                 byteOffset=0,
                 componentType=FLOAT,
                 count=len(sampler.extras["times_array"]),
@@ -612,8 +612,8 @@ class Motion:
             if sampler.extras["vals_array"].shape[1] == 1:
                 val_type = "SCALAR"
 
-            vals_accessor_idx = _append_index(gltf.accessors, pygltflib.Accessor(
-                bufferView=canvas._push_data(sampler.extras["vals_array"].tobytes()),
+            vals_accessor_idx = canvas._add_accessor(pygltflib.Accessor(
+                bufferView=canvas._push_data(sampler.extras["vals_array"]),
                 byteOffset=0,
                 componentType=FLOAT,
                 count=len(sampler.extras["vals_array"]),
@@ -51,6 +51,10 @@ Options:
   SERVER
   --port <port>                  port to serve rendering
 
+  CACHE
+  --no-cache                     Parse <sam-file> without the model cache.
+  --cache-size <MB>              Limit the size of the model cache.
+
   MISC.
   -o, --save   <out-file>        Save plot to <out-file>.
       --conf   <conf-file>
@@ -217,6 +221,14 @@ def parse_args(argv)->dict:
             elif arg == "--port":
                 opts["server_config"]["port"] = int(next(args))
 
+            #
+            # Cache
+            #
+            elif arg == "--no-cache":
+                opts["cache_config"]["enabled"] = False
+            elif arg == "--cache-size":
+                opts["cache_config"]["max_size"] = int(float(next(args))*(1<<20))
+
             #
             # Canvas
             #
@@ -59,7 +59,7 @@ class GltfLibAnimation01:
         quat_bytes = b"".join([struct.pack("<4f", *q) for q in rotations])
 
         # Create Accessors for time & states
-        time_accessor = _append_index(gltf.accessors, pygltflib.Accessor(
+        time_accessor = canvas._add_accessor(pygltflib.Accessor(
                 bufferView=canvas._push_data(time_bytes, target=None),
                 byteOffset=0,
                 componentType=pygltflib.FLOAT,
@@ -70,7 +70,7 @@ class GltfLibAnimation01:
             )
         )
 
-        state_accessor = _append_index(gltf.accessors, pygltflib.Accessor(
+        state_accessor = canvas._add_accessor(pygltflib.Accessor(
             bufferView=canvas._push_data(quat_bytes, target=None),
             byteOffset=0,
             componentType=pygltflib.FLOAT,
@@ -18,11 +18,21 @@ class so3:
 
 
 
+def _node_rows(model)->dict:
+    # Map from node tags to rows of model-wide arrays
+    if hasattr(model, "node_indices"):
+        return model.node_indices()
+    return {tag: i for i, tag in enumerate(model.iter_node_tags())}
+
+
 class BasicState(State):
     # spatial distribution of a solution
     def __init__(self, data, model, scale=1.0, fn=None, transform=None, time=None):
         """
         data: callable|dict|array
+
+        Values are stored in one array with a row for each node of the
+        model; ``scale`` and ``transform`` are applied to the whole array.
         """
         self.model  = model
         self.time   = time
@@ -30,10 +40,11 @@ class BasicState(State):
         self.line_style = LineStyle()
         self.mesh_style = MeshStyle()
 
+        rows = _node_rows(model)
+
         # Handle data
         if isinstance(data, np.ndarray):
             self.ndf = data.shape[1] if len(data.shape) > 1 else 1
-            data = {tag: data[i]  for i, tag in enumerate(model.iter_node_tags())}
         else:
             self.ndf = model.ndf
 
@@ -45,36 +56,66 @@ class BasicState(State):
         #     self.rotation = slice(3, None)
 
         if callable(data): # OpenSees
-            # fn is something like nodeDisp or nodeEigenvector
+            # fn is something like nodeDisp or nodeEigenvector; values
+            # are gathered as a dict so that they are padded below
             data = {tag: data(tag) for tag in model.iter_node_tags()}
 
-        # Handle remaining arguments; by now data should be a dict
+        if isinstance(data, dict):
+            if not all(tag in rows for tag in data):
+                # Keys are not node tags of the model; keep their order
+                rows = {tag: i for i, tag in enumerate(data)}
+
+            # Nodes may have different numbers of values; rows are padded
+            # with zeros
+            values = [np.atleast_1d(v) for v in data.values()]
+            width  = max((len(v) for v in values), default=0)
+            array  = np.zeros((len(rows), width))
+            for tag, v in zip(data, values):
+                array[rows[tag], :len(v)] = v
+            data = array
+
+        data = np.asarray(data)
+
+        # Handle remaining arguments; by now data should be an array
         if scale is not None:
-            data = {k: scale*np.array(val) for k, val in data.items()}
+            data = scale*data
 
         if transform is not None:
-            data = {k: transform@np.atleast_1d(val) for k, val in data.items()}
+            data = data@np.asarray(transform).T if data.ndim > 1 else data[:,None]@np.asarray(transform).T
 
-        self._data  : dict  = data
+        self._rows  : dict       = rows
+        self._array : np.ndarray = data
         self._scale : float = scale
 
     def __repr__(self):
-        return f"<BasicState {self._data}>"
+        return f"<BasicState {self._array.shape}>"
+
+    def _model_rows(self):
+        # Rows of the array in the order of model.iter_node_tags(), or None
+        # if they are already in that order
+        if not hasattr(self, "_gather"):
+            tags = list(self.model.iter_node_tags())
+            idx  = np.array([self._rows[tag] for tag in tags], dtype=np.int64)
+            self._gather = None if np.array_equal(idx, np.arange(len(self._array))) else idx
+        return self._gather
 
 
     def node_array(self, tag=None, dof=None):
         # ordered by dof
         if tag is None:
+            # Views of the whole array when its rows are in model order
+            idx = self._model_rows()
+            array = self._array if idx is None else self._array[idx]
             if dof is None:
-                return np.array([self._data[tag] for tag in self.model.iter_node_tags()])
+                return array
             else:
-                return np.array([self._data[tag][dof] for tag in self.model.iter_node_tags()])
+                return array[:, dof]
 
         elif dof is None:
-            return self._data[tag]
+            return self._array[self._rows[tag]]
 
         else:
-            return self._data[tag][dof]
+            return self._array[self._rows[tag]][dof]
 
 
     def cell_array(self, tag,
@@ -85,27 +126,45 @@ class BasicState(State):
 
         # incr: init,conv,iter
 
-        return np.array([
-                u for n in self.model.cell_nodes(tag)
-                    for u in self.node_array(n, dof)
-        ])
-        return np.array([
-                [u for u in self.node_array(n, dof)]
-                for n in self.model.cell_nodes(tag)
-        ])
+        array = self._array[[self._rows[n] for n in self.model.cell_nodes(tag)]]
+        if dof is not None:
+            array = array[:, dof]
+        return array.reshape(-1)
 
 
 class GroupStateSO3(State):
-    def __init__(self, data, model, time=None, transform=None):
+    def __init__(self, data, model, time=None, transform=None, scale=None):
+        """
+        data: Rotation|dict
+
+        ``data`` is either a stacked Rotation with one rotation for each
+        node of the model, or a dict from node tags to Rotations; nodes
+        that are missing from the dict are not rotated. Rotations are not
+        scaled, so ``scale`` is ignored.
+        """
         self.model  = model
         self.time   = time
 
+        self._rows = _node_rows(model)
+        if isinstance(data, dict):
+            quat = np.tile([0.0, 0.0, 0.0, 1.0], (len(self._rows), 1))
+            for tag, rotation in data.items():
+                if tag in self._rows:
+                    quat[self._rows[tag]] = rotation.as_quat()
+            data = Rotation.from_quat(quat)
+
         self._data  = data
-        self._qe = Rotation.from_matrix(np.eye(3))
+        self._matrix = None
         if transform is None:
             transform = np.eye(3)
         self._R0 = transform # Rotation.from_matrix(transform)
 
+    def _matrices(self):
+        # Rotation matrices of all nodes, computed on first use
+        if self._matrix is None:
+            self._matrix = self._R0@self._data.as_matrix().reshape(-1, 3, 3)
+        return self._matrix
+
     def cell_array(self, tag=None):
         raise Exception
         if tag is None:
@@ -119,9 +178,9 @@ class GroupStateSO3(State):
 
     def node_array(self, tag=None):
         if tag is None:
-            return np.array([self.node_array(tag) for tag in self.model.iter_node_tags()])
+            return self._matrices()
 
-        return self._R0@self._data.get(tag, self._qe).as_matrix()
+        return self._matrices()[self._rows[tag]]
 
 
 
@@ -270,8 +329,10 @@ class GroupSeriesSO3(Series):
         if transform is None:
             transform = np.eye(3)
 
+        # Rotations of all nodes are stacked in one Rotation, which is
+        # updated with a single composition for each increment
         R0   = Rotation.from_matrix(transform)
-        last = {n: R0 for n in self.model.iter_node_tags()}
+        last = Rotation.from_quat(np.tile(R0.as_quat(), (len(_node_rows(model)), 1)))
         hist = self._hist = {}
         time = None
         for incr in series.values(incr=recover_rotations):
@@ -284,17 +345,11 @@ class GroupSeriesSO3(Series):
 
                 time = incr.time
 
-            last = {
-                tag: Rotation.from_rotvec(incr.node_array(tag)[3:])*last[tag]
-                for tag in self.model.iter_node_tags()
-            }
+            last = Rotation.from_rotvec(incr.node_array(dof=slice(3, 6)))*last
 
         # Recover the final converged state
         time = incr.time
-        last = {
-            tag: Rotation.from_rotvec(incr.node_array(tag)[3:])*last[tag]
-            for tag in self.model.iter_node_tags()
-        }
+        last = Rotation.from_rotvec(incr.node_array(dof=slice(3, 6)))*last
         hist[time] = {
             "converged": GroupStateSO3(last, model, time=time)
         }
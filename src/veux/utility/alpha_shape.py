@@ -77,19 +77,45 @@ def remove_collinear_points(points, tol=2e-4):
         new_points.append(new_points[0])
     return np.array(new_points)
 
-def _add_edge(edges, i, j, only_outer=True):
+def _triangle_edges(simplices):
     """
-    Add an edge between the i-th and j-th points,
-    if not in the list already
+    Return the directed edges (i,j), (j,k), (k,i) of each triangle as an
+    (3*M,2) array.
     """
-    if (i, j) in edges or (j, i) in edges:
-        # already added
-        assert (j, i) in edges, "Can't go twice over same directed edge?"
-        if only_outer:
-            # if both neighboring triangles are in shape, it's not a boundary edge
-            edges.remove((j, i))
-        return
-    edges.add((i, j))
+    return simplices[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+
+
+def _alpha_edges(simplices, only_outer=True):
+    """
+    Return the edges of a set of triangles. If ``only_outer`` is True,
+    edges shared by two triangles are dropped; otherwise each edge is
+    kept once, in the direction it was first found.
+    """
+    edges = _triangle_edges(simplices)
+    if len(edges) == 0:
+        return edges
+
+    _, first, inverse, count = np.unique(np.sort(edges, axis=1), axis=0,
+                                         return_index=True,
+                                         return_inverse=True,
+                                         return_counts=True)
+    if only_outer:
+        return edges[count[inverse.reshape(-1)] == 1]
+    return edges[np.sort(first)]
+
+
+def _circumradii(points, simplices):
+    """
+    Radii of the circumcircles of all triangles at once.
+    """
+    pa, pb, pc = (points[simplices[:, i]] for i in range(3))
+    a = np.linalg.norm(pa - pb, axis=1)
+    b = np.linalg.norm(pb - pc, axis=1)
+    c = np.linalg.norm(pc - pa, axis=1)
+    s = (a + b + c) / 2.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        area = np.sqrt(s * (s - a) * (s - b) * (s - c))
+        return a * b * c / (4.0 * area)
 
 
 def _alpha_default(points, tri) -> float:
@@ -102,30 +128,10 @@ def _alpha_default(points, tri) -> float:
     :return: A float alpha
     """
 
-    # tri.simplices is an (M,3) array of indices into `points`
-    simplices = tri.simplices
-
-    # Collect all edges by pairs of indices from each simplex
-    # Note: each triangle contributes edges (i,j), (j,k), (k,i)
-    edges = []
-    for simplex in simplices:
-        i, j, k = simplex
-        edges.append((i, j))
-        edges.append((j, k))
-        edges.append((k, i))
+    # Unique edges of all triangles
+    edges = np.unique(np.sort(_triangle_edges(tri.simplices), axis=1), axis=0)
 
-    # Convert edges list to a unique set so we don't repeat edges
-    # (small performance optimization)
-    edges = set(tuple(sorted(edge)) for edge in edges)
-
-    # Compute lengths of all edges
-    lengths = []
-    for (i, j) in edges:
-        pi = points[i]
-        pj = points[j]
-        lengths.append(np.linalg.norm(pi - pj))
-
-    lengths = np.array(lengths)
+    lengths = np.linalg.norm(points[edges[:, 0]] - points[edges[:, 1]], axis=1)
     # We could use the mean, but here we use median for robustness
     median_length = np.median(lengths)
 
@@ -144,16 +150,41 @@ def _max_pairwise_distance(points: np.ndarray) -> float:
     :return: The largest Euclidean distance between any pair
     """
 
-    from scipy.spatial.distance import cdist
+    from scipy.spatial import ConvexHull
+    from scipy.spatial.distance import pdist
     # Edge case: if there is 0 or 1 point, max distance is 0
     if points.shape[0] < 2:
         return 0.0
 
-    # Compute all pairwise distances
-    dist_matrix = cdist(points, points, 'euclidean')
+    # The farthest pair of points lies on the convex hull
+    try:
+        points = points[ConvexHull(points).vertices]
+    except Exception:
+        # Degenerate (e.g., collinear) points
+        pass
+
+    return float(pdist(points, 'euclidean').max())
+
+
+def _first_boundary(points, edges):
+    """
+    Chain directed boundary edges into a closed loop and return its
+    vertices in order. The loop through the leftmost boundary point is
+    taken, so that the exterior of a section with holes is returned.
+    """
+    following = {}
+    for i, j in edges.tolist():
+        following.setdefault(i, j)
+
+    starts = edges[:, 0]
+    start = int(starts[np.lexsort((points[starts, 1], points[starts, 0]))[0]])
+    loop = [start]
+    nxt = following[start]
+    while nxt != start and nxt in following and len(loop) <= len(edges):
+        loop.append(nxt)
+        nxt = following[nxt]
+    return loop
 
-    # Return the maximum distance
-    return float(dist_matrix.max())
 
 def alpha_shape(points, alpha=None, only_outer=True, radius=None, bound_ratio=None, tri=None):
     """
@@ -179,32 +210,11 @@ def alpha_shape(points, alpha=None, only_outer=True, radius=None, bound_ratio=No
     if alpha is None:
         alpha = _alpha_default(points, tri)
 
-    edges = set()
-    # Loop over triangles:
-    # ia, ib, ic = indices of corner points of the triangle
-    for ia, ib, ic in tri.simplices:
-        pa = points[ia]
-        pb = points[ib]
-        pc = points[ic]
-        # Computing radius of triangle circumcircle
-        # www.mathalino.com/reviewer/derivation-of-formulas/derivation-of-formula-for-radius-of-circumcircle
-        a = np.sqrt((pa[0] - pb[0]) ** 2 + (pa[1] - pb[1]) ** 2)
-        b = np.sqrt((pb[0] - pc[0]) ** 2 + (pb[1] - pc[1]) ** 2)
-        c = np.sqrt((pc[0] - pa[0]) ** 2 + (pc[1] - pa[1]) ** 2)
-        s = (a + b + c) / 2.0
-        area = np.sqrt(s * (s - a) * (s - b) * (s - c))
-        circum_r = a * b * c / (4.0 * area)
-        if circum_r < 1/alpha:
-            _add_edge(edges, ia, ib, only_outer=only_outer)
-            _add_edge(edges, ib, ic, only_outer=only_outer)
-            _add_edge(edges, ic, ia, only_outer=only_outer)
-
-    # return points[stitch_boundaries(edges)]
-    # return stitch_boundaries(edges)
-    # return edges
-    first_bound = stitch_boundaries(edges)[0]
-    # return np.array(list(reversed([points[i] for edge in first_bound for i in edge])))
-    ordered_points = np.array([points[i] for edge in first_bound for i in edge])
+    # Keep the triangles whose circumcircle is smaller than 1/alpha
+    simplices = tri.simplices[_circumradii(points, tri.simplices) < 1/alpha]
+    edges = _alpha_edges(simplices, only_outer=only_outer)
+
+    ordered_points = points[_first_boundary(points, edges)]
     _, idx = np.unique(ordered_points, return_index=True, axis=0)
 
     ordered_unique_points = ordered_points[np.sort(idx)]
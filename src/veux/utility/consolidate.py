@@ -1,71 +1,185 @@
 #!/bin/env python
 import sys
 import math
-
-
-def _list_equal(l1:list, l2:list, verbose=False)->bool:
-    match = True
-    for _i,_j in zip(l1,l2):
-        if match != True:
-            break
-        else:
-            i,j = _i,_j
-
-        if isinstance(i,list):
-            if isinstance(j,list):
-                match = _list_equal(i,j)
-            else:
-                match = False
-
-        elif isinstance(i,dict):
-            if isinstance(j,dict):
-                match = _dict_equal(i,j)
-            else:
-                match = False
-
-        elif isinstance(i,float):
-            match = match and math.isclose(i,j)
-
+from collections.abc import Mapping
+
+import numpy as np
+
+# Keys that identify an object rather than describe it
+_IGNORE = {"name", "nodes", "instances", "crd", "trsfm"}
+
+
+def _float(v:float, digits:int)->float:
+    # Round to a number of significant digits so that values that differ
+    # only by round-off share a fingerprint
+    if v == 0 or not math.isfinite(v):
+        return abs(v) if v == 0 else v
+    return float(f"{v:.{digits}g}")
+
+
+def _round(x, digits:int):
+    # Vectorized form of _float
+    x = np.asarray(x, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        e = np.where(np.isfinite(x) & (x != 0), np.floor(np.log10(np.abs(x))), 0.0)
+        scale = 10.0**(digits - 1 - e)
+        r = np.round(x*scale)/scale
+    r = np.where(np.isfinite(x), r, x)
+    return r + 0.0  # drop negative zeros
+
+
+def _canonical_records(records, digits:int):
+    """
+    Canonical form of a long list of objects with the same keys, such as
+    the fibers of a section; numeric fields are rounded as arrays.
+    """
+    keys = sorted(records[0].keys())
+    columns = []
+    for k in keys:
+        column = [r[k] for r in records]
+        try:
+            array = np.array(column, dtype=float)
+        except (TypeError, ValueError):
+            array = None
+        if array is not None and not any(isinstance(v, (str, bool)) for v in column):
+            columns.append((k, array.shape, _round(array, digits).tobytes()))
         else:
-            match = match and (i==j)
-
-    if verbose and match != True:
-        print(f"{verbose}{i}\n\t{j}")
-
-    return match
-
-
-def _dict_equal(d1:bool, d2:bool,verbose=False)->bool:
-    match = True
-
-    for _k,_v in d1.items():
-        if match != True: break
-        else: k,v = _k,_v
-
-        if k in {"name", "nodes", "instances", "crdTransformation"}:
-            continue
-        elif isinstance(v,dict):
-            match = match and _dict_equal(v, d2[k])
-        elif isinstance(v,list):
-            match = match and _list_equal(v, d2[k])
-        elif isinstance(v,float):
-            match = match and math.isclose(v,d2[k])
+            columns.append((k, tuple(canonical(v, digits, ()) for v in column)))
+    return ("records", tuple(columns))
+
+
+def canonical(value, digits:int=9, exclude=_IGNORE):
+    """
+    Return a hashable, normalized form of a JSON-like value. Dictionary
+    keys are sorted, keys in ``exclude`` are dropped at the top level, and
+    floats are rounded to ``digits`` significant digits.
+    """
+    if isinstance(value, Mapping):
+        return tuple(sorted(
+            (k, canonical(v, digits, ())) for k,v in value.items() if k not in exclude
+        ))
+    elif isinstance(value, (list, tuple)):
+        if len(value) > 16 and all(isinstance(v, Mapping) for v in value) \
+           and all(v.keys() == value[0].keys() for v in value):
+            return _canonical_records(value, digits)
+        return tuple(canonical(v, digits, ()) for v in value)
+    elif isinstance(value, float):
+        return _float(value, digits)
+    elif hasattr(value, "tolist"):
+        # numpy arrays and scalars
+        return canonical(value.tolist(), digits, ())
+    return value
+
+
+class _Classes:
+    """
+    Assigns an integer class to objects with equal canonical forms, and
+    remembers the class of each object name.
+    """
+    def __init__(self, objects=(), digits=9):
+        self._digits = digits
+        self.keys    = {}       # canonical form -> class
+        self.first   = []       # class -> name of its first object
+        self.names   = {}       # str(name) -> class
+        for obj in objects:
+            self.add(obj)
+
+    def add(self, obj, key=None):
+        if key is None:
+            key = canonical(obj, self._digits)
+        if key not in self.keys:
+            self.keys[key] = len(self.first)
+            self.first.append(obj.get("name"))
+        cls = self.keys[key]
+        self.names[str(obj.get("name"))] = cls
+        return cls
+
+    def __getitem__(self, name):
+        return self.names.get(str(name), str(name))
+
+
+def group_elements(elements, sections=(), materials=(), transforms=(), digits=9)->dict:
+    """
+    Group elements that have the same properties, sections, materials and
+    coordinate transformation.
+
+    Elements are given a fingerprint in which references to sections,
+    materials and transformations are replaced by the class of the
+    referenced object, so grouping takes time linear in the number of
+    elements.
+
+    Returns a dictionary that maps each fingerprint to the list of the
+    names of its elements, in order.
+    """
+    mats = _Classes(materials, digits)
+
+    def section_key(section):
+        # Sections refer to materials directly and through their fibers
+        section = dict(section)
+        if "materials" in section:
+            section["materials"] = [mats[m] for m in section["materials"]]
+        if "fibers" in section:
+            section["fibers"] = [
+                {**f, "material": mats[f["material"]]} if "material" in f else f
+                for f in section["fibers"]
+            ]
+        return canonical(section, digits)
+
+    secs = _Classes(digits=digits)
+    # Aggregated sections refer to other sections, which are classified first
+    for section in sorted(sections, key=lambda s: "section" in s):
+        key = section_key({**section, "section": secs[section["section"]]}
+                          if "section" in section else section)
+        secs.add(section, key)
+
+    trsf = _Classes(transforms, digits)
+
+    groups = {}
+    for elem in elements:
+        key = (
+            canonical(elem, digits, _IGNORE | {"sections", "materials", "section", "material",
+                                               "crdTransformation", "transform"}),
+            tuple(secs[s] for s in elem.get("sections", ())),
+            secs[elem["section"]] if "section" in elem else None,
+            tuple(mats[m] for m in elem.get("materials", ())),
+            mats[elem["material"]] if "material" in elem else None,
+            trsf[elem.get("crdTransformation", elem.get("transform"))],
+        )
+        groups.setdefault(key, []).append(elem["name"])
+
+    return groups
+
+
+def _consolidate(objects, remap=None, types=None, label=None, digits=9):
+    # Map the name of each object to the name of the first object with the
+    # same canonical form
+    types = [] if types is None else types
+    remap = {} if remap is None else remap
+
+    index = {canonical(typ, digits): typ for typ in types}
+    for el in objects:
+        key = canonical(el, digits)
+        if key not in index:
+            index[key] = el
+            types.append(el)
+            el["instances"] = [el["name"]]
+            remap[el["name"]] = el["name"]
         else:
-            match = match and (v == d2[k])
+            typ = index[key]
+            if el is not typ and el["name"] not in typ["instances"]:
+                typ["instances"].append(el["name"])
+            remap[el["name"]] = typ["name"]
 
-    if verbose and not match:
-        print(f"{verbose}{k}: {v}, {d2[k]}")
+    if label is not None:
+        print(f"{label}:\t{len(objects)}\t{len(types)}", file=sys.stderr)
+    return remap, types
 
-    return match
 
 def sections(dat, mat_remap, sec_remap=None, sec_types = None):
-    sec_types = [] if sec_types is None else sec_types
-    sec_remap = {} if sec_remap is None else sec_remap
     secs = dat["StructuralAnalysisModel"]["properties"]["sections"]
 
     for el in secs:
-        match = False
-        if "section" in el and el["section"] in sec_remap:
+        if "section" in el and sec_remap is not None and el["section"] in sec_remap:
             el["section"] = sec_remap[el["section"]]
 
         if "materials" in el:
@@ -73,85 +187,31 @@ def sections(dat, mat_remap, sec_remap=None, sec_types = None):
 
         if "fibers" in el:
             for fib in el["fibers"]:
-                fib["material"] = mat_remap[fib["material"]]
+                if "material" in fib:
+                    fib["material"] = mat_remap[fib["material"]]
 
-        # Test equality
-        for typ in sec_types:
-            if el["type"] == typ["type"] and _dict_equal(el,typ)==True:
-                match = True
-                break
+    return _consolidate(secs, sec_remap, sec_types, label="sections")
 
-        if not match:
-            sec_types.append(el)
-            el["instances"] = [el["name"]]
-            sec_remap[el["name"]] = el["name"]
-
-        else:
-            sec_remap[el["name"]] = typ["name"]
-            #if el in sec_types:
-            #    sec_types.pop(sec_types.index(el))
-
-    print(f"sections:\t{len(secs)}\t{len(sec_types)}", file=sys.stderr)
-    return sec_remap, sec_types
 
 def transfms(dat, crd_remap=None, crd_types = None):
-    crd_types = [] if crd_types is None else crd_types
-    crd_remap = {} if crd_remap is None else crd_remap
-    secs = dat["StructuralAnalysisModel"]["properties"]["crdTransformations"]
-    for el in secs:
-        match = False
-        # Test equality
-        for typ in crd_types:
-            if el["type"] == typ["type"] and _dict_equal(el,typ)==True:
-                match = True
-                break
-
-        if not match:
-            crd_types.append(el)
-            el["instances"] = [el["name"]]
-            crd_remap[el["name"]] = el["name"]
+    secs = dat["StructuralAnalysisModel"]["properties"].get("crdTransformations", [])
+    return _consolidate(secs, crd_remap, crd_types, label="transforms")
 
-        else:
-            crd_remap[el["name"]] = typ["name"]
-            #if el in crd_types:
-            #    crd_types.pop(crd_types.index(el))
-
-    print(f"transforms:\t{len(secs)}\t{len(crd_types)}", file=sys.stderr)
-    return crd_remap, crd_types
 
 def materials(dat):
-    mat_types = []
-    mat_remap = {}
-    mats = dat["StructuralAnalysisModel"]["properties"]["uniaxialMaterials"]
-    for el in mats:
-        match = False
-        for typ in mat_types:
-            if el["type"] == typ["type"] and _dict_equal(el,typ)==True:
-                match = True
-                break
-        if not match:
-            mat_types.append(el)
-            el["instances"] = [el["name"]]
-            mat_remap[el["name"]] = el["name"]
-        else:
-            mat_remap[el["name"]] = typ["name"]
+    mats = dat["StructuralAnalysisModel"]["properties"].get("uniaxialMaterials", [])
+    return _consolidate(mats, label="materials")
 
-    print(f"materials:\t{len(mats)}\t{len(mat_types)}", file=sys.stderr)
-    return mat_remap, mat_types
 
 def consolidate(model, modify = False):
     mat_remap, mat_types = materials(model)
     sec_remap, sec_types = sections(model, mat_remap)
+    # Second pass to resolve references between aggregated sections
     sec_remap, sec_types = sections(model, mat_remap, sec_remap, sec_types)
     crd_remap, crd_types = transfms(model)
 
-    elem_types = []
     elems = model["StructuralAnalysisModel"]["geometry"]["elements"]
     for el in elems:
-        match = False
-        verbose  = False
-        #print(f"{el['name']}")
-
         # change references
         if "materials" in el:
             el["materials"] = [mat_remap[m] for m in el["materials"]]
@@ -162,16 +222,14 @@ def consolidate(model, modify = False):
         if "crdTransformation" in el:
             el["crdTransformation"] = crd_remap[el["crdTransformation"]]
 
-        for typ in elem_types:
-            if el["type"] == typ["type"] and _dict_equal(el,typ,verbose)==True:
-                match = True
-                break
-
-        if not match:
-            elem_types.append(el)
-            el["instances"] = [el["name"]]
-        else:
-            typ["instances"].append(el["name"])
+    # References are now canonical names, so elements are grouped by their
+    # own fields, including the transformation
+    by_name = {el["name"]: el for el in elems}
+    elem_types = []
+    for names in group_elements(elems).values():
+        typ = by_name[names[0]]
+        typ["instances"] = names
+        elem_types.append(typ)
 
     model["StructuralAnalysisModel"]["properties"]["element_types"] = elem_types
 
@@ -188,4 +246,3 @@ if __name__=="__main__":
     clean = consolidate(model)
 
     print(json.dumps(clean,indent=2))
-
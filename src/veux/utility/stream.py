@@ -0,0 +1,326 @@
+#===----------------------------------------------------------------------===#
+#
+#         STAIRLab -- STructural Artificial Intelligence Laboratory
+#
+#===----------------------------------------------------------------------===#
+#
+# Incremental reader for OpenSees JSON model files.
+#
+# Node and element records are decoded one at a time while the file is
+# read in chunks; coordinates and connectivity go straight into flat
+# arrays, and the fiber payloads of sections are kept as raw text until
+# they are used.
+#
+import re
+import sys
+import json
+import codecs
+from array import array
+from collections.abc import MutableMapping
+
+import numpy as np
+
+
+_DECODER = json.JSONDecoder()
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Characters that may continue a number
+_NUMBER = frozenset("0123456789.eE+-")
+
+# Keys of sections whose values are only decoded when accessed
+_DEFERRED = {"fibers", "patches", "layers"}
+
+
+class LazyObject(MutableMapping):
+    """
+    A JSON object whose larger members are kept as text.
+
+    Only the source text of the deferred members is kept. Each is decoded
+    the first time it is looked up, and the decoded value replaces its text.
+    """
+    def __init__(self, data:dict, text:dict):
+        self._data = data
+        self._text = text
+
+    def __getitem__(self, key):
+        if key in self._text:
+            self._data[key] = json.loads(self._text.pop(key))
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._text.pop(key, None)
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        if key in self._text:
+            del self._text[key]
+        else:
+            del self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data or key in self._text
+
+    def __iter__(self):
+        # Looking up a deferred member moves it between the dictionaries
+        return iter([*self._data, *self._text])
+
+    def __len__(self):
+        return len(self._data) + len(self._text)
+
+    def __repr__(self):
+        return f"LazyObject({self._data!r}, deferred={sorted(self._text)})"
+
+
+class _Scanner:
+    def __init__(self, file, chunk_size):
+        self._file  = file
+        self._size  = chunk_size
+        self._text  = ""
+        self._pos   = 0
+        self._done  = False
+        self._codec = None
+
+    def _fill(self, size=None)->bool:
+        if self._done:
+            return False
+
+        data = self._file.read(size or self._size)
+        if isinstance(data, bytes):
+            if self._codec is None:
+                self._codec = codecs.getincrementaldecoder("utf-8")()
+            data = self._codec.decode(data, final=not data)
+
+        if not data:
+            self._done = True
+            return False
+
+        # Drop the text that has already been consumed
+        self._text = self._text[self._pos:] + data
+        self._pos  = 0
+        return True
+
+    def peek(self)->str:
+        while True:
+            text = self._text
+            self._pos = pos = _WHITESPACE.match(text, self._pos).end()
+            if pos < len(text):
+                return text[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' in JSON model, found '{self.peek()}'")
+        self._pos += 1
+
+    def record(self):
+        """
+        Decode the next object. Its keys are interned, since each record
+        is decoded on its own and would otherwise hold its own copies.
+        """
+        value = self.value()
+        if isinstance(value, dict):
+            value = {sys.intern(k): v for k,v in value.items()}
+        return value
+
+    def value(self, text=False):
+        """
+        Decode the next value. If ``text`` is True, also return its source.
+        """
+        self.peek()
+        # Values that span many chunks are read with a growing chunk size
+        # so that they are not decoded from the start too many times
+        size = self._size
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._text, self._pos)
+                # A number that is cut off by the end of the buffer, possibly
+                # before its fraction or exponent, continues in the next chunk
+                if self._done or (end < len(self._text) and self._text[end] not in _NUMBER):
+                    break
+            except json.JSONDecodeError:
+                if self._done:
+                    raise
+            if not self._fill(size):
+                value, end = _DECODER.raw_decode(self._text, self._pos)
+                break
+            size *= 2
+
+        source = self._text[self._pos:end] if text else None
+        self._pos = end
+        return (value, source) if text else value
+
+    def items(self, close):
+        # Yields once per member of an array or object; the caller
+        # consumes the member itself.
+        first = True
+        while True:
+            if self.peek() == close:
+                self._pos += 1
+                return
+            if not first:
+                self.expect(",")
+            first = False
+            yield
+
+
+class _ModelReader:
+    def __init__(self, scanner):
+        self._scan = scanner
+        self.node_index = {}
+        self.columns = {}
+
+    def object(self, path=()):
+        scan = self._scan
+        scan.expect("{")
+        data = {}
+        for _ in scan.items("}"):
+            key = scan.value()
+            scan.expect(":")
+            data[key] = self.member(path + (key,))
+        return data
+
+    def member(self, path):
+        if path[-1] in {"StructuralAnalysisModel", "geometry", "properties"} \
+           and self._scan.peek() == "{":
+            return self.object(path)
+        elif path[-2:] == ("geometry", "nodes"):
+            return self.nodes()
+        elif path[-2:] == ("geometry", "elements"):
+            return self.elements()
+        elif path[-2:] == ("properties", "sections"):
+            return self.sections()
+        return self._scan.value()
+
+    def array(self, item):
+        scan = self._scan
+        scan.expect("[")
+        return [item() for _ in scan.items("]")]
+
+    def nodes(self):
+        values  = array("d")
+        lengths = array("q")
+
+        def node():
+            node = self._scan.record()
+            crd = node.pop("crd", ())
+            values.extend(crd)
+            lengths.append(len(crd))
+            self.node_index[node.get("name")] = len(lengths) - 1
+            return node
+
+        nodes = self.array(node)
+
+        values = np.frombuffer(values, dtype=float)
+        if len(nodes) and all(n == lengths[0] for n in lengths) and lengths[0] > 0:
+            # Node coordinates become views into one array
+            coord = values.reshape(len(nodes), lengths[0])
+            self.columns["coord"] = coord
+            for node, crd in zip(nodes, coord):
+                node["crd"] = crd
+        else:
+            offsets = np.cumsum([0, *lengths])
+            for i, node in enumerate(nodes):
+                if lengths[i] > 0:
+                    node["crd"] = values[offsets[i]:offsets[i+1]].tolist()
+        return nodes
+
+    def elements(self):
+        connectivity = array("q")
+        lengths      = array("q")
+        complete     = True
+
+        def element():
+            nonlocal complete
+            elem = self._scan.record()
+            nodes = elem.get("nodes", ())
+            lengths.append(len(nodes))
+            if complete:
+                try:
+                    connectivity.extend(self.node_index[n] for n in nodes)
+                except (KeyError, TypeError):
+                    # Nodes were not read first, or are unknown
+                    complete = False
+            return elem
+
+        elements = self.array(element)
+
+        if complete and len(elements):
+            offsets = np.zeros(len(elements)+1, dtype=np.int64)
+            np.cumsum(np.frombuffer(lengths, dtype=np.int64), out=offsets[1:])
+            self.columns["offsets"] = offsets
+            self.columns["connectivity"] = np.frombuffer(connectivity, dtype=np.int64)
+        return elements
+
+    def sections(self):
+        scan = self._scan
+
+        def section():
+            if scan.peek() != "{":
+                return scan.value()
+
+            # Members are read one at a time so that only the text of the
+            # deferred members is kept
+            scan.expect("{")
+            data, text = {}, {}
+            for _ in scan.items("}"):
+                key = scan.value()
+                scan.expect(":")
+                if key in _DEFERRED:
+                    text[key] = scan.value(text=True)[1]
+                else:
+                    data[key] = scan.value()
+
+            return LazyObject(data, text) if text else data
+
+        return self.array(section)
+
+
+def json_default(value):
+    """
+    Convert the LazyObject and array values of a model returned by
+    read_model for ``json.dump``; pass as its ``default`` argument.
+    """
+    if isinstance(value, LazyObject):
+        return {k: value[k] for k in value}
+    elif isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def read_model(file, chunk_size=1<<22)->dict:
+    """
+    Read an OpenSees JSON model from a file object or path.
+
+    The ``geometry`` of the model is given a ``columns`` entry holding
+    the node coordinates (``coord``) and the element connectivity in CSR
+    form (``offsets``, ``connectivity``), so that these do not need to be
+    gathered again from the node and element records.
+
+    Unlike ``json.load``, the node ``crd`` values are rows of
+    ``columns["coord"]`` when all nodes have the same number of
+    coordinates, and sections with fibers, patches or layers are
+    LazyObject mappings. To write the model back out, use
+    ``json.dumps(sam, default=json_default)``.
+    """
+    if not hasattr(file, "read"):
+        with open(file, "rb") as f:
+            return read_model(f, chunk_size=chunk_size)
+
+    reader = _ModelReader(_Scanner(file, chunk_size))
+    if reader._scan.peek() != "{":
+        # Not an object; nothing to stream
+        return reader._scan.value()
+
+    sam = reader.object()
+
+    try:
+        geometry = sam["StructuralAnalysisModel"]["geometry"]
+    except (KeyError, TypeError):
+        return sam
+
+    if isinstance(geometry, dict) and reader.columns:
+        geometry["columns"] = reader.columns
+
+    return sam
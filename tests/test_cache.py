@@ -0,0 +1,64 @@
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from veux.cache import ModelCache
+from veux.model import read_model
+
+MODEL = Path(__file__).parent/"hayward.json"
+
+
+def _geometry(sam):
+    return sam["StructuralAnalysisModel"]["geometry"]
+
+
+def test_round_trip(tmp_path):
+    cache = ModelCache(tmp_path)
+    sam = read_model(MODEL)
+    key = cache.key(MODEL, "json")
+
+    assert cache.load(key) is None
+    cache.store(key, sam)
+    loaded = cache.load(key)
+
+    assert loaded is not None
+    nodes, elements = _geometry(sam)["nodes"], _geometry(sam)["elements"]
+    assert [n["name"] for n in _geometry(loaded)["nodes"]] == [n["name"] for n in nodes]
+    assert np.allclose([n["crd"] for n in _geometry(loaded)["nodes"]],
+                       [n["crd"] for n in nodes])
+    assert [e["nodes"] for e in _geometry(loaded)["elements"]] == [e["nodes"] for e in elements]
+    assert loaded["StructuralAnalysisModel"]["properties"]["sections"] \
+        == [dict(s) for s in sam["StructuralAnalysisModel"]["properties"]["sections"]]
+
+
+def test_stale_key(tmp_path):
+    path = tmp_path/"model.json"
+    shutil.copy(MODEL, path)
+
+    cache = ModelCache(tmp_path/"cache")
+    key = cache.key(path, "json")
+    cache.store(key, read_model(path))
+
+    # Any change to the file gives a new key, which has no entry
+    with open(path, "a") as f:
+        f.write("\n")
+    assert cache.key(path, "json") != key
+    assert cache.load(cache.key(path, "json")) is None
+    assert cache.load(key) is not None
+
+
+def test_read_model(tmp_path, monkeypatch):
+    monkeypatch.setenv("VEUX_CACHE_DIR", str(tmp_path/"cache"))
+    path = tmp_path/"model.json"
+    shutil.copy(MODEL, path)
+
+    # The cache is only used when asked for
+    read_model(path)
+    assert not (tmp_path/"cache").exists()
+
+    first  = read_model(path, cache=True)
+    assert list((tmp_path/"cache").glob("*.json"))
+    second = read_model(path, cache=True)
+    assert np.allclose([n["crd"] for n in _geometry(first)["nodes"]],
+                       [n["crd"] for n in _geometry(second)["nodes"]])
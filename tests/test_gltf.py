@@ -0,0 +1,137 @@
+import io
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pygltflib = pytest.importorskip("pygltflib")
+from scipy.spatial.transform import Rotation
+
+import veux
+
+MODEL = Path(__file__).parent/"hayward.json"
+
+_DTYPES = {
+    pygltflib.FLOAT:          "f4",
+    pygltflib.UNSIGNED_INT:   "u4",
+    pygltflib.UNSIGNED_SHORT: "u2",
+    pygltflib.UNSIGNED_BYTE:  "u1",
+    pygltflib.SHORT:          "i2",
+    pygltflib.BYTE:           "i1",
+}
+_SIZES = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT4": 16}
+
+
+def _render(**config):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        artist = veux.render(MODEL, canvas="gltf", canvas_config=config)
+        artist.draw_sections()
+    return artist.canvas
+
+
+def _read(gltf, blob, index):
+    # Values of an accessor, with normalized integers mapped back to floats
+    accessor = gltf.accessors[index]
+    view  = gltf.bufferViews[accessor.bufferView]
+    dtype = np.dtype(_DTYPES[accessor.componentType])
+    size  = _SIZES[accessor.type]
+    stride = view.byteStride or size*dtype.itemsize
+    start  = view.byteOffset + (accessor.byteOffset or 0)
+    data = np.frombuffer(blob[start:start + stride*accessor.count].ljust(stride*accessor.count, b"\0"),
+                         dtype=dtype).reshape(accessor.count, -1)[:, :size].astype(float)
+    if accessor.normalized:
+        data = np.maximum(data/np.iinfo(dtype).max, -1)
+    return data
+
+
+def _positions(glb):
+    # World positions of the vertices drawn by each material
+    gltf = pygltflib.GLTF2.load_from_bytes(glb)
+    blob = gltf.binary_blob()
+    out  = {}
+    def visit(index, parent):
+        node = gltf.nodes[index]
+        if node.matrix:
+            local = np.array(node.matrix).reshape(4, 4).T
+        else:
+            local = np.eye(4)
+            if node.rotation:
+                local[:3, :3] = Rotation.from_quat(node.rotation).as_matrix()
+            local[:3, :3] *= list(node.scale or [1, 1, 1])
+            local[:3,  3]  = node.translation or [0, 0, 0]
+        matrix = parent@local
+
+        if node.mesh is not None and not node.extensions:
+            for primitive in gltf.meshes[node.mesh].primitives:
+                x = _read(gltf, blob, primitive.attributes.POSITION)
+                if primitive.indices is not None:
+                    x = x[_read(gltf, blob, primitive.indices).astype(int).ravel()]
+                out.setdefault(primitive.material, []).append(x@matrix[:3, :3].T + matrix[:3, 3])
+
+        for child in node.children or []:
+            visit(child, matrix)
+
+    for index in gltf.scenes[0].nodes:
+        visit(index, np.eye(4))
+    return {k: np.concatenate(v) for k, v in out.items()}
+
+
+def _primitives(glb):
+    gltf = pygltflib.GLTF2.load_from_bytes(glb)
+    return sum(len(gltf.meshes[node.mesh].primitives)
+               for node in gltf.nodes if node.mesh is not None)
+
+
+def _sorted(x):
+    return x[np.lexsort(x.T[::-1])]
+
+
+def test_compact():
+    plain   = _render().to_glb()
+    compact = _render(compact=True).to_glb()
+
+    assert _primitives(compact) < _primitives(plain)
+
+    expected, actual = _positions(plain), _positions(compact)
+    assert expected.keys() == actual.keys()
+    for material in expected:
+        assert np.allclose(_sorted(expected[material]), _sorted(actual[material]))
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_quantize(compact):
+    tolerance = 1e-4
+    plain     = _render(compact=compact).to_glb()
+    quantized = _render(compact=compact, quantize=True, quantize_tolerance=tolerance).to_glb()
+
+    gltf = pygltflib.GLTF2.load_from_bytes(quantized)
+    assert "KHR_mesh_quantization" in gltf.extensionsRequired
+    assert any(gltf.accessors[primitive.attributes.POSITION].componentType != pygltflib.FLOAT
+               for mesh in gltf.meshes for primitive in mesh.primitives)
+    assert len(quantized) < len(plain)
+
+    expected, actual = _positions(plain), _positions(quantized)
+    points = np.concatenate(list(expected.values()))
+    size   = np.linalg.norm(points.max(axis=0) - points.min(axis=0))
+    assert expected.keys() == actual.keys()
+    for material in expected:
+        assert np.abs(expected[material] - actual[material]).max() <= tolerance*size
+
+
+@pytest.mark.parametrize("config", [{}, {"compact": True, "quantize": True}])
+def test_write(tmp_path, config):
+    canvas = _render(**config)
+    glb = canvas.to_glb()
+
+    stream = io.BytesIO()
+    canvas.write(stream)
+    canvas.write(tmp_path/"model.glb")
+
+    assert stream.getvalue() == glb
+    assert (tmp_path/"model.glb").read_bytes() == glb
+    assert canvas.to_glb() == glb
+
+    gltf = pygltflib.GLTF2.load_from_bytes(glb)
+    assert gltf.buffers[0].byteLength == len(gltf.binary_blob())
@@ -0,0 +1,93 @@
+import io
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from veux.utility.stream import read_model, json_default, LazyObject
+
+MODELS = sorted(Path(__file__).parent.glob("[a-z].json")) \
+       + [Path(__file__).parent/"hayward.json"]
+
+
+def _plain(value):
+    # Decode lazy members and arrays, and drop the gathered columns
+    if isinstance(value, (dict, LazyObject)):
+        return {k: _plain(value[k]) for k in value if k != "columns"}
+    elif isinstance(value, list):
+        return [_plain(v) for v in value]
+    elif isinstance(value, np.ndarray):
+        return value.tolist()
+    return value
+
+
+@pytest.mark.parametrize("path", MODELS, ids=lambda p: p.name)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1<<22])
+def test_chunked(path, chunk_size):
+    with open(path) as f:
+        expected = json.load(f)
+    assert _plain(read_model(path, chunk_size=chunk_size)) == expected
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 12))
+def test_numbers(chunk_size):
+    text = b'{"a": [1.25e-3, -4.5E+2, 7, 0.5]}'
+    assert read_model(io.BytesIO(text), chunk_size=chunk_size) == json.loads(text)
+
+
+def test_columns():
+    path = Path(__file__).parent/"hayward.json"
+    sam  = read_model(path, chunk_size=64)
+    with open(path) as f:
+        geometry = json.load(f)["StructuralAnalysisModel"]["geometry"]
+
+    columns = sam["StructuralAnalysisModel"]["geometry"]["columns"]
+    assert np.array_equal(columns["coord"], [n["crd"] for n in geometry["nodes"]])
+
+    index = {n["name"]: i for i,n in enumerate(geometry["nodes"])}
+    offsets = columns["offsets"]
+    for i, elem in enumerate(geometry["elements"]):
+        nodes = columns["connectivity"][offsets[i]:offsets[i+1]]
+        assert nodes.tolist() == [index[n] for n in elem["nodes"]]
+
+
+def test_lazy_sections():
+    path = Path(__file__).parent/"hayward.json"
+    sam  = read_model(path)
+    with open(path) as f:
+        expected = json.load(f)["StructuralAnalysisModel"]["properties"]["sections"]
+
+    sections = sam["StructuralAnalysisModel"]["properties"]["sections"]
+    lazy = [s for s in sections if isinstance(s, LazyObject)]
+    assert lazy
+
+    for section, reference in zip(sections, expected):
+        assert set(section) == set(reference)
+        for key in reference:
+            assert section[key] == reference[key]
+            # Decoded members are kept
+            assert section[key] is section[key]
+
+
+def test_dumps():
+    path = Path(__file__).parent/"hayward.json"
+    with open(path) as f:
+        expected = json.load(f)
+
+    dumped = json.loads(json.dumps(read_model(path), default=json_default))
+    columns = dumped["StructuralAnalysisModel"]["geometry"].pop("columns")
+    assert dumped == expected
+    assert columns["coord"] == [n["crd"] for n in expected["StructuralAnalysisModel"]["geometry"]["nodes"]]
+
+
+def test_models_are_independent():
+    from veux.model import FrameModel
+    sam = read_model(Path(__file__).parent/"hayward.json")
+    first  = FrameModel(sam)
+    second = FrameModel(sam, shift=[1000, 0, 0])
+
+    for tag in first["assembly"]:
+        assert first["assembly"][tag] is not second["assembly"][tag]
+        assert np.array_equal(first["assembly"][tag]["crd"], first.cell_position(tag))
+    assert "idx" not in sam["StructuralAnalysisModel"]["geometry"]["nodes"][0]